@@ -0,0 +1,102 @@
+"""
+Public API of the repository, loaded lazily.
+
+Importing this module is cheap: each name is only imported from its module
+the first time it is accessed, so e.g.
+
+    from api import weightCompGroup
+
+imports the weight components without pulling in openaerostruct, lsdo_utils
+or the plotting packages that other groups depend on.
+
+A `from api import ...` still imports every name it lists, so run.py,
+run_opt.py and run_with_viz.py, which import OASGroup, PerformanceGroup or
+generate_mesh and use them right away, load openaerostruct as before; the
+lazy loading only saves time for code that does not use those names, such
+as runWeightGroup.py.
+"""
+import importlib
+
+
+_lazy_names = {
+    # aerodynamics
+    'OASGroup': 'components.oas_group',
+    'CachedAeroPointComp': 'components.cached_aero_point_comp',
+    'CachedAeroPointGroup': 'components.cached_aero_point_comp',
+    'WarmStartAeroPoint': 'components.warm_start_aero_point',
+    'generate_mesh': 'openaerostruct.geometry.utils',
+    'AerostructGroup': 'components.aerostruct_group',
+
+    # zero-lift drag
+    'ZeroLiftGroup': 'components.zero_lift_drag.zero_lift_group',
+    'AtmosphereGroup': 'components.zero_lift_drag.atmosphere_group',
+    'SWet': 'components.zero_lift_drag.s_wet',
+    'FormDragCo': 'components.zero_lift_drag.form_drag_co',
+    'WaveDragCo': 'components.zero_lift_drag.wave_drag_co',
+    'DragBuildupComp': 'components.zero_lift_drag.drag_buildup_comp',
+    'ZeroLiftComp': 'components.zero_lift_drag.zero_lift_comp',
+
+    # drag polar
+    'DragPolarTable': 'components.drag_polar.drag_polar_table',
+    'get_drag_polar_table': 'components.drag_polar.drag_polar_table',
+    'DragPolarComp': 'components.drag_polar.drag_polar_comp',
+    'VLMPolar': 'components.drag_polar.vlm_polar',
+
+    # aerodynamics surrogate
+    'AeroSurrogate': 'components.aero_surrogate.aero_surrogate',
+    'get_aero_surrogate': 'components.aero_surrogate.aero_surrogate',
+    'AeroSurrogateComp': 'components.aero_surrogate.aero_surrogate_comp',
+
+    # forces and propulsion
+    'thrustComp': 'components.aeroprop.thrust_comp',
+    'dragComp': 'components.aeroprop.drag_comp',
+    'liftComp': 'components.aeroprop.lift_comp',
+    'ForcesComp': 'components.aeroprop.forces_comp',
+    'EngineDeck': 'components.aeroprop.engine_deck',
+    'get_engine_deck': 'components.aeroprop.engine_deck',
+    'EngineDeckComp': 'components.aeroprop.engine_deck_comp',
+
+    # performance model of run_opt
+    'PerformanceGroup': 'components.performance_group',
+    'add_design_problem': 'components.performance_group',
+    'add_sizing_constraint': 'components.performance_group',
+    'run_mesh_continuation': 'components.mesh_continuation',
+
+    # range
+    'BregRangeCo': 'components.breguet_range.breguet_range_comp',
+    'BregRange': 'components.breguet_range.breg_range',
+    'MissionComp': 'components.breguet_range.mission_comp',
+
+    # weights
+    'weightCompGroup': 'weight_component.weightGroup',
+    'weightEngineComp': 'weight_component.weightEngine',
+
+    # standard atmosphere
+    'AtmosphereComp': 'atmosphere.atmosphere_comp',
+    'AtmosphereTable': 'atmosphere.atmosphere_table',
+    'get_atmosphere_table': 'atmosphere.atmosphere_table',
+}
+
+# names that differ from the attribute in their module
+_aliases = {
+    'StandardAtmosphereGroup': ('atmosphere.atmosphere_group', 'AtmosphereGroup'),
+}
+
+__all__ = sorted(list(_lazy_names) + list(_aliases))
+
+
+def __getattr__(name):
+    if name in _lazy_names:
+        module_name, attr_name = _lazy_names[name], name
+    elif name in _aliases:
+        module_name, attr_name = _aliases[name]
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,216 @@
+from __future__ import print_function
+import numpy as np
+
+from openmdao.api import ExplicitComponent
+
+from .utils import compute_atmosphere
+from .atmosphere_table import AtmosphereTable
+
+
+class AtmosphereComp(ExplicitComponent):
+    """
+    Fused standard-atmosphere component.
+
+    Evaluates altitude_km, temperature, pressure_MPa, density, sonic_speed,
+    dynamic_viscosity, the Mach number and the dynamic pressure in one
+    vectorized pass over an arbitrary shape. Every output only depends on the
+    same index of its inputs, so all partials are declared diagonal.
+
+    Options
+    -------
+    shape : tuple
+        Shape of every input and output.
+    speed_name : str
+        Name of the flight speed input [m/s].
+    mach_name : str
+        Name of the Mach number output.
+    density_names : list
+        Names under which the density is output (e.g. ['density', 'rho']).
+    with_reynolds : bool
+        If True, adds a characteristic_length input and an 're' output
+        computed as speed * characteristic_length / dynamic_viscosity.
+    table : AtmosphereTable or None
+        If given, the thermodynamic state is looked up in this spline table
+        instead of being evaluated from the analytic model.
+    num_scenarios : int or None
+        If given, adds a delta_T input of shape (num_scenarios,) holding the
+        ISA temperature offset [K] of each scenario (non-standard day), and
+        altitude becomes the pressure altitude. Every output except
+        altitude_km then has shape (num_scenarios,) + shape and holds the
+        state of all scenarios at all altitudes and speeds, which are shared
+        by the scenarios. Values and partials take O(num_scenarios * size)
+        memory per output; partials with respect to altitude, speed and
+        characteristic_length have one entry per output element and those
+        with respect to delta_T also have one entry per output element.
+    """
+
+    def initialize(self):
+        self.options.declare('shape', types=tuple)
+        self.options.declare('speed_name', default='speed', types=str)
+        self.options.declare('mach_name', default='mach_number', types=str)
+        self.options.declare('density_names', default=['density'], types=list)
+        self.options.declare('with_reynolds', default=False, types=bool)
+        self.options.declare('table', default=None, types=AtmosphereTable, allow_none=True)
+        self.options.declare('num_scenarios', default=None, types=int, allow_none=True)
+
+    def setup(self):
+        shape = self.options['shape']
+        speed_name = self.options['speed_name']
+        mach_name = self.options['mach_name']
+        density_names = self.options['density_names']
+        with_reynolds = self.options['with_reynolds']
+
+        num_scenarios = self.options['num_scenarios']
+
+        size = int(np.prod(shape))
+        arange = np.arange(size)
+
+        if num_scenarios is None:
+            out_shape = shape
+            rows = cols = arange
+        else:
+            # output element (i, j) of scenario i depends on input element j and delta_T[i]
+            out_shape = (num_scenarios,) + shape
+            rows = np.arange(num_scenarios * size)
+            cols = np.tile(arange, num_scenarios)
+            scenario_cols = np.repeat(np.arange(num_scenarios), size)
+
+        self.add_input('altitude', shape=shape)
+        self.add_input(speed_name, shape=shape)
+        if num_scenarios is not None:
+            self.add_input('delta_T', shape=(num_scenarios,))
+
+        self.add_output('altitude_km', shape=shape)
+        self.add_output('temperature', shape=out_shape)
+        self.add_output('pressure_MPa', shape=out_shape)
+        for density_name in density_names:
+            self.add_output(density_name, shape=out_shape)
+        self.add_output('sonic_speed', shape=out_shape)
+        self.add_output('dynamic_viscosity', shape=out_shape)
+        self.add_output(mach_name, shape=out_shape)
+        self.add_output('dynamic_pressure', shape=out_shape)
+
+        self.declare_partials('altitude_km', 'altitude', val=1.e-3, rows=arange, cols=arange)
+
+        altitude_outputs = ['temperature', 'pressure_MPa', 'sonic_speed', 'dynamic_viscosity',
+            mach_name, 'dynamic_pressure'] + density_names
+        for out_name in altitude_outputs:
+            self.declare_partials(out_name, 'altitude', rows=rows, cols=cols)
+
+        self.declare_partials(mach_name, speed_name, rows=rows, cols=cols)
+        self.declare_partials('dynamic_pressure', speed_name, rows=rows, cols=cols)
+
+        if num_scenarios is not None:
+            self.declare_partials('temperature', 'delta_T', val=1., rows=rows, cols=scenario_cols)
+
+            scenario_outputs = ['sonic_speed', 'dynamic_viscosity', mach_name,
+                'dynamic_pressure'] + density_names
+            for out_name in scenario_outputs:
+                self.declare_partials(out_name, 'delta_T', rows=rows, cols=scenario_cols)
+
+        if with_reynolds:
+            self.add_input('characteristic_length', shape=shape)
+            self.add_output('re', shape=out_shape)
+
+            self.declare_partials('re', 'altitude', rows=rows, cols=cols)
+            self.declare_partials('re', speed_name, rows=rows, cols=cols)
+            self.declare_partials('re', 'characteristic_length', rows=rows, cols=cols)
+            if num_scenarios is not None:
+                self.declare_partials('re', 'delta_T', rows=rows, cols=scenario_cols)
+
+    def compute(self, inputs, outputs):
+        speed_name = self.options['speed_name']
+        mach_name = self.options['mach_name']
+        density_names = self.options['density_names']
+        with_reynolds = self.options['with_reynolds']
+
+        h_m = inputs['altitude']
+        speed = inputs[speed_name]
+
+        atm = self._evaluate(inputs, h_m, derivs=False)
+
+        outputs['altitude_km'] = h_m * 1e-3
+        outputs['temperature'] = atm['temperature']
+        outputs['pressure_MPa'] = self._broadcast(atm['pressure'] / 1e6, h_m.shape)
+        for density_name in density_names:
+            outputs[density_name] = atm['density']
+        outputs['sonic_speed'] = atm['sonic_speed']
+        outputs['dynamic_viscosity'] = atm['dynamic_viscosity']
+        outputs[mach_name] = speed / atm['sonic_speed']
+        outputs['dynamic_pressure'] = 0.5 * atm['density'] * speed ** 2
+
+        if with_reynolds:
+            outputs['re'] = speed * inputs['characteristic_length'] / atm['dynamic_viscosity']
+
+    def compute_partials(self, inputs, partials):
+        speed_name = self.options['speed_name']
+        mach_name = self.options['mach_name']
+        density_names = self.options['density_names']
+        with_reynolds = self.options['with_reynolds']
+
+        num_scenarios = self.options['num_scenarios']
+
+        h_m = inputs['altitude'].flatten()
+        speed = inputs[speed_name].flatten()
+
+        atm = self._evaluate(inputs, h_m)
+        # every array is flattened in scenario-major order to match the rows
+        atm = {name: self._broadcast(value, h_m.shape).flatten() for name, value in atm.items()}
+        speed = self._broadcast(speed, h_m.shape).flatten()
+        a = atm['sonic_speed']
+
+        partials['temperature', 'altitude'] = atm['dtemperature_dh']
+        partials['pressure_MPa', 'altitude'] = atm['dpressure_dh'] / 1e6
+        for density_name in density_names:
+            partials[density_name, 'altitude'] = atm['ddensity_dh']
+        partials['sonic_speed', 'altitude'] = atm['dsonic_speed_dh']
+        partials['dynamic_viscosity', 'altitude'] = atm['ddynamic_viscosity_dh']
+
+        partials[mach_name, 'altitude'] = -speed / a ** 2 * atm['dsonic_speed_dh']
+        partials[mach_name, speed_name] = 1. / a
+
+        partials['dynamic_pressure', 'altitude'] = 0.5 * speed ** 2 * atm['ddensity_dh']
+        partials['dynamic_pressure', speed_name] = atm['density'] * speed
+
+        if num_scenarios is not None:
+            for density_name in density_names:
+                partials[density_name, 'delta_T'] = atm['ddensity_ddT']
+            partials['sonic_speed', 'delta_T'] = atm['dsonic_speed_ddT']
+            partials['dynamic_viscosity', 'delta_T'] = atm['ddynamic_viscosity_ddT']
+            partials[mach_name, 'delta_T'] = -speed / a ** 2 * atm['dsonic_speed_ddT']
+            partials['dynamic_pressure', 'delta_T'] = 0.5 * speed ** 2 * atm['ddensity_ddT']
+
+        if with_reynolds:
+            length = self._broadcast(inputs['characteristic_length'].flatten(), h_m.shape).flatten()
+            mu = atm['dynamic_viscosity']
+
+            partials['re', 'altitude'] = -speed * length / mu ** 2 * atm['ddynamic_viscosity_dh']
+            partials['re', speed_name] = length / mu
+            partials['re', 'characteristic_length'] = speed / mu
+            if num_scenarios is not None:
+                partials['re', 'delta_T'] = \
+                    -speed * length / mu ** 2 * atm['ddynamic_viscosity_ddT']
+
+    def _evaluate(self, inputs, h_m, derivs=True):
+        table = self.options['table']
+        num_scenarios = self.options['num_scenarios']
+
+        if num_scenarios is None:
+            delta_T = 0.
+        else:
+            # one row per scenario, broadcast against the altitudes
+            delta_T = inputs['delta_T'].reshape((num_scenarios,) + (1,) * h_m.ndim)
+
+        if table is None:
+            return compute_atmosphere(h_m, derivs=derivs, delta_T=delta_T)
+        else:
+            return table.evaluate(h_m, derivs=derivs, delta_T=delta_T)
+
+    def _broadcast(self, value, shape):
+        # expands arrays that only depend on altitude to all scenarios
+        num_scenarios = self.options['num_scenarios']
+
+        if num_scenarios is None:
+            return value
+        else:
+            return np.broadcast_to(value, (num_scenarios,) + shape)
@@ -2,13 +2,8 @@ from __future__ import print_function
 import numpy as np
 from openmdao.api import Group, IndepVarComp
 
-from lsdo_utils.api import PowerCombinationComp
-
-from temperature_comp import TemperatureComp
-from pressure_comp import PressureComp
-from density_comp import DensityComp
-from sonic_speed_comp import SonicSpeedComp
-from viscosity_comp import ViscosityComp
+from .atmosphere_comp import AtmosphereComp
+from .atmosphere_table import get_atmosphere_table
 
 
 class AtmosphereGroup(Group):
@@ -16,6 +11,9 @@ class AtmosphereGroup(Group):
     def initialize(self):
         self.options.declare('shape', types=tuple)
         self.options.declare('options_dictionary')
+        self.options.declare('fused', default=True, types=bool)
+        self.options.declare('mode', default='analytic', values=['analytic', 'table'])
+        self.options.declare('num_scenarios', default=None, types=int, allow_none=True)
 
         self.promotes = None
 
@@ -26,6 +24,31 @@ class AtmosphereGroup(Group):
 
         group = Group()
 
+        if self.options['mode'] == 'table' and not self.options['fused']:
+            raise ValueError('The table atmosphere mode requires fused=True')
+        if self.options['num_scenarios'] is not None and not self.options['fused']:
+            raise ValueError('Atmosphere scenarios (ISA offsets) require fused=True')
+
+        if self.options['fused']:
+            if self.options['mode'] == 'table':
+                table = get_atmosphere_table()
+            else:
+                table = None
+
+            comp = AtmosphereComp(shape=shape, table=table,
+                num_scenarios=self.options['num_scenarios'])
+            self.add_subsystem('atmosphere_comp', comp, promotes=['*'])
+            return
+
+        # only the component chain needs lsdo_utils
+        from lsdo_utils.api import PowerCombinationComp
+
+        from .temperature_comp import TemperatureComp
+        from .pressure_comp import PressureComp
+        from .density_comp import DensityComp
+        from .sonic_speed_comp import SonicSpeedComp
+        from .viscosity_comp import ViscosityComp
+
         comp = PowerCombinationComp(
             shape=shape,
             out_name='altitude_km',
@@ -0,0 +1,185 @@
+from __future__ import division, print_function
+import hashlib
+import os
+
+import numpy as np
+
+from . import constants
+from .utils import compute_atmosphere, compute_state, h_lower, h_upper
+
+
+# Version of the on-disk table format; bump it to invalidate old caches
+table_version = 1
+
+# Quantities whose maximum error against the analytic model is reported
+error_names = ['temperature', 'pressure', 'density', 'sonic_speed', 'dynamic_viscosity']
+
+default_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_cache')
+
+_tables = {}
+
+
+def get_constants_key(h_min, h_max, spacing):
+    """
+    Returns a hash of every constant in atmosphere/constants.py together with
+    the table layout, so that a cached table is rebuilt whenever either changes.
+    """
+    items = sorted(
+        (name, value) for name, value in vars(constants).items()
+        if not name.startswith('_') and isinstance(value, (int, float))
+    )
+    text = repr((table_version, items, float(h_min), float(h_max), float(spacing)))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def get_atmosphere_table(h_min=-1000., h_max=25000., spacing=25., cache_dir=None):
+    """
+    Returns a shared AtmosphereTable, building or loading it only once per process.
+    """
+    key = (h_min, h_max, spacing, cache_dir)
+    if key not in _tables:
+        _tables[key] = AtmosphereTable(h_min=h_min, h_max=h_max, spacing=spacing,
+            cache_dir=cache_dir)
+    return _tables[key]
+
+
+class AtmosphereTable(object):
+    """
+    Cubic Hermite spline table of the standard atmosphere.
+
+    Temperature and pressure, the two quantities that need the power law,
+    exponential and tropopause blend, are tabulated together with their exact
+    altitude derivatives on a uniform grid with knots at both edges of the
+    tropopause smoothing region. Density, sonic speed and viscosity are then
+    completed from the interpolated temperature and pressure with
+    utils.compute_state, so lookups return the same dict as
+    utils.compute_atmosphere. Derivatives are those of the interpolant, which
+    keeps partials consistent with the values. Altitudes outside
+    [h_min, h_max] fall back to the analytic model.
+
+    The table is cached on disk as an .npz file keyed by the constants in
+    atmosphere/constants.py and the table layout. max_error holds the largest
+    relative error of every quantity (and of its altitude derivative,
+    relative to the largest derivative) against the analytic model, measured
+    at the quarter points of every interval when the table is built.
+    """
+
+    def __init__(self, h_min=-1000., h_max=25000., spacing=25., cache_dir=None):
+        for h_knot in [h_lower, h_upper, h_max]:
+            if abs((h_knot - h_min) / spacing - round((h_knot - h_min) / spacing)) > 1e-9:
+                raise ValueError(
+                    'The table spacing must place knots at {}, {} and h_max'.format(
+                        h_lower, h_upper))
+
+        self.h_min = float(h_min)
+        self.h_max = float(h_max)
+        self.spacing = float(spacing)
+        self.num_intervals = int(round((h_max - h_min) / spacing))
+
+        if cache_dir is None:
+            cache_dir = default_cache_dir
+        self.key = get_constants_key(h_min, h_max, spacing)
+        self.file_path = os.path.join(cache_dir, 'atmosphere_table_{}.npz'.format(self.key))
+
+        if os.path.isfile(self.file_path):
+            self._load()
+        else:
+            self._build()
+            self._save()
+
+    def _build(self):
+        h_knots = self.h_min + self.spacing * np.arange(self.num_intervals + 1)
+        atm = compute_atmosphere(h_knots)
+
+        self.values = np.array([atm['temperature'], atm['pressure']])
+        self.derivs = np.array([atm['dtemperature_dh'], atm['dpressure_dh']])
+        self._compute_coeffs()
+
+        h_test = self.h_min + self.spacing * (
+            np.arange(self.num_intervals)[:, None] + np.array([0.25, 0.5, 0.75])).flatten()
+        exact = compute_atmosphere(h_test)
+        approx = self.evaluate(h_test)
+
+        self.max_error = {}
+        for name in error_names:
+            self.max_error[name] = np.max(np.abs(approx[name] - exact[name]) / np.abs(exact[name]))
+
+            deriv_name = 'd{}_dh'.format(name)
+            self.max_error[deriv_name] = np.max(np.abs(approx[deriv_name] - exact[deriv_name])) \
+                / np.max(np.abs(exact[deriv_name]))
+
+    def _compute_coeffs(self):
+        # Hermite form rewritten as a cubic in the local coordinate t in [0, 1]
+        f0 = self.values[:, :-1]
+        f1 = self.values[:, 1:]
+        d0 = self.derivs[:, :-1] * self.spacing
+        d1 = self.derivs[:, 1:] * self.spacing
+
+        self.coeffs = np.array([
+            f0,
+            d0,
+            3 * (f1 - f0) - 2 * d0 - d1,
+            2 * (f0 - f1) + d0 + d1,
+        ]).transpose(1, 0, 2).copy()
+
+    def _save(self):
+        directory = os.path.dirname(self.file_path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        names = sorted(self.max_error)
+        np.savez(self.file_path, values=self.values, derivs=self.derivs,
+            error_names=np.array(names),
+            errors=np.array([self.max_error[name] for name in names]))
+
+    def _load(self):
+        data = np.load(self.file_path)
+        self.values = data['values']
+        self.derivs = data['derivs']
+        self.max_error = dict(zip(
+            [str(name) for name in data['error_names']], data['errors']))
+        self._compute_coeffs()
+
+    def evaluate(self, h_m, derivs=True, delta_T=0.):
+        h_m = np.asarray(h_m)
+
+        h_real = np.real(h_m)
+        in_range = np.logical_and(h_real >= self.h_min, h_real <= self.h_max)
+        all_in_range = np.all(in_range)
+
+        s = (np.where(in_range, h_m, self.h_min) - self.h_min) / self.spacing
+        index = np.clip(np.real(s).astype(int), 0, self.num_intervals - 1)
+        t = s - index
+
+        results = []
+        for coeffs in self.coeffs:
+            c0, c1, c2, c3 = np.take(coeffs, index, axis=1)
+
+            results.append(((c3 * t + c2) * t + c1) * t + c0)
+            if derivs:
+                results.append(((3 * c3 * t + 2 * c2) * t + c1) / self.spacing)
+            else:
+                results.append(None)
+
+        temp_K, dtemp_dh, p_Pa, dp_dh = results
+
+        if not all_in_range:
+            exact = compute_atmosphere(h_m, derivs=derivs)
+
+            temp_K = np.where(in_range, temp_K, exact['temperature'])
+            p_Pa = np.where(in_range, p_Pa, exact['pressure'])
+            if derivs:
+                dtemp_dh = np.where(in_range, dtemp_dh, exact['dtemperature_dh'])
+                dp_dh = np.where(in_range, dp_dh, exact['dpressure_dh'])
+
+        # the ISA offset only shifts the temperature, as in utils.compute_atmosphere
+        return compute_state(temp_K + delta_T, p_Pa, dtemp_dh, dp_dh)
+
+
+if __name__ == '__main__':
+    table = get_atmosphere_table()
+
+    print('Atmosphere table:', table.file_path)
+    print('Maximum error against the analytic model:')
+    for name in sorted(table.max_error):
+        print('  {:<24} {:.3e}'.format(name, table.max_error[name]))
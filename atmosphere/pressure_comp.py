@@ -3,7 +3,7 @@ import numpy as np
 
 from lsdo_utils.api import ArrayExplicitComponent
 
-from utils import \
+from .utils import \
     get_mask_arrays, compute_pressures, compute_pressure_derivs
 
 
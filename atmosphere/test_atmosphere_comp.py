@@ -0,0 +1,98 @@
+import unittest
+
+import numpy as np
+
+from .atmosphere_comp import AtmosphereComp
+from .utils import get_mask_arrays, compute_temps, compute_pressures
+
+from openmdao.api import Problem
+from components.complex_step import setup_problem, check_partials
+
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+#  test for the fused atmosphere component
+
+class TestAtmosphereComp(unittest.TestCase):
+
+    def setUp(self):
+        # troposphere, tropopause smoothing region and stratosphere
+        self.altitude = np.array([0., 5000., 10700., 11000., 11300., 15000.])
+        self.speed = np.array([100., 150., 200., 230., 250., 270.])
+
+    def test_component_and_derivatives(self):
+        shape = self.altitude.shape
+
+        prob = Problem()
+        prob.model = AtmosphereComp(shape=shape, with_reynolds=True)
+        setup_problem(prob)
+        prob['altitude'] = self.altitude
+        prob['speed'] = self.speed
+        prob['characteristic_length'] = 5.
+        prob.run_model()
+
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-3, rtol=1.e-3)
+
+    def test_values(self):
+        shape = self.altitude.shape
+
+        prob = Problem()
+        prob.model = AtmosphereComp(shape=shape)
+        setup_problem(prob)
+        prob['altitude'] = self.altitude
+        prob['speed'] = self.speed
+        prob.run_model()
+
+        mask_arrays = get_mask_arrays(self.altitude)
+        temp_K = compute_temps(self.altitude, *mask_arrays)
+        p_Pa = compute_pressures(self.altitude, *mask_arrays)
+
+        assert_near_equal(prob['temperature'], temp_K, 1e-12)
+        assert_near_equal(prob['pressure_MPa'], p_Pa / 1e6, 1e-12)
+        assert_near_equal(prob['density'][0], 1.225, 1e-3)
+        assert_near_equal(prob['sonic_speed'][0], 340.3, 1e-3)
+        assert_near_equal(prob['mach_number'], self.speed / prob['sonic_speed'], 1e-12)
+        assert_near_equal(prob['dynamic_pressure'],
+            0.5 * prob['density'] * self.speed ** 2, 1e-12)
+
+    def test_scenarios(self):
+        shape = self.altitude.shape
+        delta_T = np.array([-15., 0., 20.])
+
+        prob = Problem()
+        prob.model = AtmosphereComp(shape=shape, num_scenarios=delta_T.size, with_reynolds=True)
+        setup_problem(prob)
+        prob['altitude'] = self.altitude
+        prob['speed'] = self.speed
+        prob['delta_T'] = delta_T
+        prob['characteristic_length'] = 5.
+        prob.run_model()
+
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-3, rtol=1.e-3)
+
+        mask_arrays = get_mask_arrays(self.altitude)
+        temp_K = compute_temps(self.altitude, *mask_arrays)
+        p_Pa = compute_pressures(self.altitude, *mask_arrays)
+
+        for ind in range(delta_T.size):
+            assert_near_equal(prob['temperature'][ind], temp_K + delta_T[ind], 1e-12)
+            assert_near_equal(prob['pressure_MPa'][ind], p_Pa / 1e6, 1e-12)
+            assert_near_equal(prob['density'][ind],
+                p_Pa / 287.058 / (temp_K + delta_T[ind]), 1e-12)
+
+        # the standard day matches the component without scenarios
+        std_prob = Problem()
+        std_prob.model = AtmosphereComp(shape=shape, with_reynolds=True)
+        std_prob.setup()
+        std_prob['altitude'] = self.altitude
+        std_prob['speed'] = self.speed
+        std_prob['characteristic_length'] = 5.
+        std_prob.run_model()
+
+        for name in ['density', 'sonic_speed', 'mach_number', 'dynamic_pressure', 're']:
+            assert_near_equal(prob[name][1], std_prob[name], 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from .atmosphere_comp import AtmosphereComp
+from .atmosphere_table import AtmosphereTable, error_names
+from .utils import compute_atmosphere
+
+from openmdao.api import Problem
+from components.complex_step import setup_problem, check_partials
+
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+#  test for the spline-table atmosphere
+
+class TestAtmosphereTable(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.table = AtmosphereTable(cache_dir=self.cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_error_bound(self):
+        for name in error_names:
+            self.assertLess(self.table.max_error[name], 1e-6)
+
+    def test_values(self):
+        # includes points outside of the table, which use the analytic model
+        h_m = np.linspace(-2000., 30000., 1001)
+
+        exact = compute_atmosphere(h_m)
+        approx = self.table.evaluate(h_m)
+
+        for name in error_names:
+            assert_near_equal(approx[name], exact[name], 1e-6)
+
+    def test_cache(self):
+        table = AtmosphereTable(cache_dir=self.cache_dir)
+
+        assert_near_equal(table.values, self.table.values, 1e-15)
+        self.assertEqual(table.max_error, self.table.max_error)
+
+    def test_component_and_derivatives(self):
+        altitude = np.array([0., 5000., 10700., 11000., 11300., 15000.])
+
+        prob = Problem()
+        prob.model = AtmosphereComp(shape=altitude.shape, table=self.table)
+        setup_problem(prob)
+        prob['altitude'] = altitude
+        prob['speed'] = 250.
+        prob.run_model()
+
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-3, rtol=1.e-3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,10 @@
 from __future__ import division
 import numpy as np
 
-from constants import epsilon, h_trans
-from constants import T0, T1, L, R
-from constants import p0, p1, g, gamma
+from .constants import epsilon, h_trans
+from .constants import T0, T1, L, R
+from .constants import p0, p1, g, gamma
+from .constants import mu2, T2, Ts
 
 
 g_L_R = g / L / R
@@ -39,8 +40,10 @@ temp_coeffs = np.linalg.solve(tropopause_matrix, temp_rhs)
 
 # functions
 def get_mask_arrays(h_m):
-    tropos_mask = h_m <= h_lower
-    strato_mask = h_m >  h_upper
+    # branch on the real part only so that complex-step perturbations pass through
+    h_real = np.real(h_m)
+    tropos_mask = h_real <= h_lower
+    strato_mask = h_real >  h_upper
     smooth_mask = np.logical_and(~tropos_mask, ~strato_mask)
     return tropos_mask, strato_mask, smooth_mask
 
@@ -82,4 +85,82 @@ def compute_temp_derivs(h_m, tropos_mask, strato_mask, smooth_mask):
     derivs += tropos_mask * -L
     derivs += smooth_mask * (3 * a * h_m ** 2 + 2 * b * h_m + c)
 
-    return derivs
\ No newline at end of file
+    return derivs
+
+def compute_densities(p_Pa, temp_K):
+    return p_Pa / R / temp_K
+
+def compute_sonic_speeds(temp_K):
+    return np.sqrt(gamma * R * temp_K)
+
+def compute_sonic_speed_derivs(temp_K):
+    return 0.5 * np.sqrt(gamma * R / temp_K)
+
+def compute_viscosities(temp_K):
+    return mu2 * (temp_K / T2) ** 1.5 * (T2 + Ts) / (temp_K + Ts)
+
+def compute_viscosity_derivs(temp_K):
+    return (
+        1.5 * mu2 * temp_K ** 0.5 / T2 ** 1.5 * (T2 + Ts) / (temp_K + Ts)
+        - mu2 * (temp_K / T2) ** 1.5 * (T2 + Ts) / (temp_K + Ts) ** 2
+    )
+
+def compute_atmosphere(h_m, derivs=True, delta_T=0.):
+    """
+    Evaluates the full standard-atmosphere state in a single pass, computing
+    the tropopause masks only once.
+
+    Returns a dict of arrays with the same shape as h_m. If derivs is True,
+    it also holds the derivatives with respect to altitude in meters, named
+    'd<name>_dh'.
+
+    delta_T is an ISA temperature offset [K]; h_m is then the pressure
+    altitude, so the pressure is unchanged and the temperature is shifted.
+    It is broadcast against h_m, so e.g. a (M, 1) offset with (N,) altitudes
+    gives the (M, N) states of M non-standard days.
+    """
+    mask_arrays = get_mask_arrays(h_m)
+
+    temp_K = compute_temps(h_m, *mask_arrays) + delta_T
+    p_Pa = compute_pressures(h_m, *mask_arrays)
+
+    if derivs:
+        dtemp_dh = compute_temp_derivs(h_m, *mask_arrays)
+        dp_dh = compute_pressure_derivs(h_m, *mask_arrays)
+    else:
+        dtemp_dh = dp_dh = None
+
+    return compute_state(temp_K, p_Pa, dtemp_dh, dp_dh)
+
+def compute_state(temp_K, p_Pa, dtemp_dh=None, dp_dh=None):
+    """
+    Completes the atmosphere state from temperature and pressure, chaining
+    their altitude derivatives through when they are given.
+    """
+    density = compute_densities(p_Pa, temp_K)
+
+    state = dict(
+        temperature=temp_K,
+        pressure=p_Pa,
+        density=density,
+        sonic_speed=compute_sonic_speeds(temp_K),
+        dynamic_viscosity=compute_viscosities(temp_K),
+    )
+
+    if dtemp_dh is not None:
+        state.update(
+            dtemperature_dh=dtemp_dh,
+            dpressure_dh=dp_dh,
+            ddensity_dh=dp_dh / R / temp_K - density / temp_K * dtemp_dh,
+            dsonic_speed_dh=compute_sonic_speed_derivs(temp_K) * dtemp_dh,
+            ddynamic_viscosity_dh=compute_viscosity_derivs(temp_K) * dtemp_dh,
+        )
+
+        # sensitivities to the temperature at fixed pressure, i.e. to an ISA offset
+        state.update(
+            ddensity_ddT=-density / temp_K,
+            dsonic_speed_ddT=compute_sonic_speed_derivs(temp_K),
+            ddynamic_viscosity_ddT=compute_viscosity_derivs(temp_K),
+        )
+
+    return state
@@ -0,0 +1,101 @@
+"""
+Runs the run_opt design problem with and without the LRU cache of the aero
+point (PerformanceGroup with aero_cache_size), and reports the model
+evaluations, the VLM solves, the hit rates and the wall time. The optimizers
+move the flight condition at almost every step, so the cache rarely hits
+there; it is compared as well on a range trade study, which evaluates the
+fuel burn and its gradient at the same wing and flight condition for a sweep
+of ranges.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_aero_cache
+"""
+from __future__ import print_function
+import timeit
+
+from openmdao.api import Problem, ScipyOptimizeDriver
+
+from components.performance_group import PerformanceGroup, add_design_problem
+from components.surface import get_surface
+from benchmarks.timing import print_table
+
+
+optimizers = ['COBYLA', 'SLSQP']
+cache_sizes = [0, 100]
+
+ranges = [1.e6 + 5.e4 * ind for ind in range(20)]
+
+
+def build_problem(surface, optimizer, cache_size):
+    prob = Problem()
+    prob.model.add_subsystem('performance_group',
+        PerformanceGroup(surface=surface, aero_cache_size=cache_size), promotes=['*'])
+    add_design_problem(prob.model)
+
+    prob.driver = ScipyOptimizeDriver(optimizer=optimizer, tol=1e-9, maxiter=500, disp=False)
+    prob.setup()
+    return prob
+
+
+def get_vlm_solves(prob, cache_size):
+    if cache_size:
+        return prob.model.performance_group.oas_group.aero_point_0.cached_point \
+            .cache_info()['misses']
+    return prob.model.iter_count
+
+
+def run_range_study(prob):
+    for rnge in ranges:
+        prob['rnge'] = rnge
+        prob.run_model()
+        prob.compute_totals()
+
+
+if __name__ == '__main__':
+    surface = get_surface(num_y=11, num_x=5)
+
+    rows = []
+    for optimizer in optimizers:
+        for cache_size in cache_sizes:
+            prob = build_problem(surface, optimizer, cache_size)
+
+            start = timeit.default_timer()
+            prob.run_driver()
+            wall_time = timeit.default_timer() - start
+
+            vlm_solves = get_vlm_solves(prob, cache_size)
+            if cache_size:
+                info = prob.model.performance_group.oas_group.aero_point_0.cached_point \
+                    .cache_info()
+                hit_rates = '%.2f / %.2f' % (info['hit_rate'], info['partials_hit_rate'])
+            else:
+                hit_rates = 'n/a'
+
+            rows.append([
+                optimizer,
+                cache_size,
+                prob.model.iter_count,
+                vlm_solves,
+                hit_rates,
+                '%.2f' % wall_time,
+                '%.3f' % prob['fuelburn'][0],
+            ])
+
+    print_table(['optimizer', 'cache size', 'model evals', 'VLM solves',
+        'hit rate values / partials', 'wall time [s]', 'fuelburn [kg]'], rows)
+    print()
+
+    rows = []
+    for cache_size in cache_sizes:
+        prob = build_problem(surface, 'SLSQP', cache_size)
+
+        start = timeit.default_timer()
+        run_range_study(prob)
+        wall_time = timeit.default_timer() - start
+
+        # run_model resets the iteration count, so without the cache every range is a VLM solve
+        vlm_solves = get_vlm_solves(prob, cache_size) if cache_size else len(ranges)
+        rows.append([cache_size, len(ranges), vlm_solves, '%.2f' % wall_time])
+
+    print_table(['cache size', 'ranges', 'VLM solves', 'wall time [s]'], rows)
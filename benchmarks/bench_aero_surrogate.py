@@ -0,0 +1,63 @@
+"""
+Builds (or loads from the cache) the Kriging AeroSurrogate of the run_opt
+aerodynamics and reports its cross-validation errors, then compares
+run_model, compute_totals and the SLSQP run of the run_opt design problem
+with OASGroup against the surrogate.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_aero_surrogate
+"""
+from __future__ import print_function
+import timeit
+
+from openmdao.api import Problem, ScipyOptimizeDriver
+
+from components.aero_surrogate.aero_surrogate import get_aero_surrogate, output_names
+from components.performance_group import PerformanceGroup, add_design_problem
+from components.surface import get_surface
+from benchmarks.timing import best_time, print_table
+
+
+def build_problem(surface, surrogate):
+    prob = Problem()
+    prob.model.add_subsystem('performance_group',
+        PerformanceGroup(surface=surface, aero_surrogate=surrogate), promotes=['*'])
+    add_design_problem(prob.model)
+
+    prob.driver = ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, maxiter=500, disp=False)
+    prob.setup()
+    prob.run_model()
+    return prob
+
+
+if __name__ == '__main__':
+    surface = get_surface(num_y=11, num_x=5)
+
+    start = timeit.default_timer()
+    surrogate = get_aero_surrogate(surface)
+    build_time = timeit.default_timer() - start
+
+    print('%s the surrogate from %d OASGroup runs in %.2f s' % (
+        'Built' if surrogate.num_solves else 'Loaded', surrogate.num_samples, build_time))
+    print_table(['output', 'cross-validation RMS error / std'],
+        [[name, '%.4f' % surrogate.cv_errors[name]] for name in output_names])
+    print()
+
+    rows = []
+    for name, each_surrogate in [('OASGroup', None), ('surrogate', surrogate)]:
+        prob = build_problem(surface, each_surrogate)
+        run_time = best_time(prob.run_model)
+        totals_time = best_time(prob.compute_totals)
+
+        start = timeit.default_timer()
+        failed = prob.run_driver()
+        wall_time = timeit.default_timer() - start
+
+        rows.append([name, '%.3e' % run_time, '%.3e' % totals_time,
+            'no' if failed else 'yes', prob.model.iter_count, '%.2f' % wall_time,
+            '%.3f' % prob['fuelburn'][0], '%.3f' % prob['alpha'][0],
+            '%.1f' % prob['altitude'][0], '%.2f' % prob['span'][0]])
+
+    print_table(['aerodynamics', 'run_model [s]', 'compute_totals [s]', 'converged',
+        'model evals', 'wall time [s]', 'fuelburn [kg]', 'alpha', 'altitude', 'span'], rows)
@@ -0,0 +1,87 @@
+"""
+Evaluates the aerostructural model of run_opt2 (AerostructGroup) along a
+sequence of small design steps, as a driver would, with every coupled
+solver, warm-started from the states of the previous evaluation (the
+OpenMDAO default) and cold-started from the initial states, and reports the
+coupling iterations and wall time per evaluation and the time of
+compute_totals.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_aerostruct_solvers
+"""
+from __future__ import print_function
+import timeit
+
+import numpy as np
+
+from openmdao.api import Problem
+
+from components.aerostruct_group import AerostructGroup, coupled_solvers
+from components.surface import get_aerostruct_surface
+from benchmarks.timing import best_time, print_table
+
+
+num_steps = 20
+
+
+def build_problem(surface, coupled_solver):
+    prob = Problem()
+    prob.model.add_subsystem('aerostruct_group',
+        AerostructGroup(surface=surface, coupled_solver=coupled_solver), promotes=['*'])
+    prob.model.add_design_var('alpha')
+    prob.model.add_design_var('wing.thickness_cp')
+    prob.model.add_constraint('AS_point_0.L_equals_W')
+    prob.model.add_objective('AS_point_0.fuelburn')
+    prob.setup()
+    return prob
+
+
+def get_steps():
+    # a random walk of small steps in alpha and the thickness
+    np.random.seed(0)
+    alpha = 2.5 + np.cumsum(np.random.uniform(-0.05, 0.05, num_steps))
+    thickness_cp = np.array([.1, .2, .3]) * (1 + np.cumsum(
+        np.random.uniform(-0.01, 0.01, (num_steps, 3)), axis=0))
+    return alpha, thickness_cp
+
+
+def run_steps(prob, warm_start):
+    coupled = prob.model.aerostruct_group.AS_point_0.coupled
+    alpha, thickness_cp = get_steps()
+
+    # the states before the first solve
+    initial_states = dict(
+        (name, meta['val'].copy()) for name, meta in prob.model.list_outputs(
+            includes=['*AS_point_0.coupled.*'], out_stream=None))
+
+    iterations = 0
+    start = timeit.default_timer()
+    for ind in range(num_steps):
+        if not warm_start:
+            for name, value in initial_states.items():
+                prob[name] = value
+        prob['alpha'] = alpha[ind]
+        prob['wing.thickness_cp'] = thickness_cp[ind]
+        prob.run_model()
+        iterations += coupled.nonlinear_solver._iter_count
+
+    return iterations / num_steps, (timeit.default_timer() - start) / num_steps
+
+
+if __name__ == '__main__':
+    surface = get_aerostruct_surface(num_y=11, num_x=3)
+
+    rows = []
+    for coupled_solver in coupled_solvers:
+        for warm_start in [False, True]:
+            prob = build_problem(surface, coupled_solver)
+            iterations, eval_time = run_steps(prob, warm_start)
+            totals_time = best_time(prob.compute_totals)
+
+            rows.append([coupled_solver, 'warm' if warm_start else 'cold', '%.1f' % iterations,
+                '%.3e' % eval_time, '%.3e' % totals_time,
+                '%.6f' % prob['AS_point_0.fuelburn'][0]])
+
+    print_table(['coupled solver', 'start', 'iterations / eval', 'time / eval [s]',
+        'compute_totals [s]', 'fuelburn [kg]'], rows)
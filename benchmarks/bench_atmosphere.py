@@ -0,0 +1,68 @@
+"""
+Compares the fused AtmosphereComp against the original component chain of
+AtmosphereGroup (altitude_km -> temperature -> pressure -> density ->
+sonic_speed -> viscosity -> Mach number / dynamic pressure), and the
+fused component in its analytic and spline-table modes.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_atmosphere
+"""
+from __future__ import print_function
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp
+
+from atmosphere.atmosphere_group import AtmosphereGroup
+from benchmarks.timing import best_time, print_table
+
+
+sizes = [1, 1000, 1000000]
+
+
+def build_problem(size, fused, mode='analytic'):
+    shape = (size,)
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('altitude', val=np.linspace(0., 20000., size))
+    comp.add_output('speed', val=np.linspace(100., 270., size))
+    prob.model.add_subsystem('inputs_comp', comp, promotes=['*'])
+
+    group = AtmosphereGroup(shape=shape, fused=fused, mode=mode)
+    prob.model.add_subsystem('atmosphere_group', group, promotes=['*'])
+
+    prob.setup()
+    prob.run_model()
+    return prob
+
+
+if __name__ == '__main__':
+    variants = [
+        ('chain', dict(fused=False)),
+        ('fused', dict(fused=True)),
+        ('table', dict(fused=True, mode='table')),
+    ]
+
+    run_rows = []
+    linearize_rows = []
+    for size in sizes:
+        repeat = 3 if size > 1000 else 20
+        run_row = [size]
+        linearize_row = [size]
+        for name, kwargs in variants:
+            prob = build_problem(size, **kwargs)
+            run_row.append('%.3e' % best_time(prob.run_model, repeat=repeat))
+            linearize_row.append('%.3e' % best_time(prob.model.run_linearize, repeat=repeat))
+
+        run_rows.append(run_row)
+        linearize_rows.append(linearize_row)
+
+    header = ['N'] + ['%s [s]' % name for name, kwargs in variants]
+
+    print('run_model')
+    print_table(header, run_rows)
+    print()
+    print('run_linearize')
+    print_table(header, linearize_rows)
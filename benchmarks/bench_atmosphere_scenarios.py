@@ -0,0 +1,79 @@
+"""
+Compares one vectorized evaluation of M non-standard days (ISA temperature
+offsets) x N altitudes with the fused AtmosphereComp against looping
+Problem.run_model over the scenarios with a one-scenario problem.
+
+Memory of the vectorized problem grows as O(M * N): every output and every
+declared partial holds one value per scenario and altitude.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_atmosphere_scenarios
+"""
+from __future__ import print_function
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp
+
+from atmosphere.atmosphere_group import AtmosphereGroup
+from benchmarks.timing import best_time, print_table
+
+
+sizes = [(10, 100), (100, 100), (100, 10000)]
+
+
+def build_problem(num_altitudes, num_scenarios=None):
+    shape = (num_altitudes,)
+
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('altitude', val=np.linspace(0., 12000., num_altitudes))
+    comp.add_output('speed', val=np.linspace(100., 250., num_altitudes))
+    if num_scenarios is not None:
+        comp.add_output('delta_T', val=np.linspace(-30., 30., num_scenarios))
+    prob.model.add_subsystem('inputs_comp', comp, promotes=['*'])
+
+    group = AtmosphereGroup(shape=shape, num_scenarios=num_scenarios)
+    prob.model.add_subsystem('atmosphere_group', group, promotes=['*'])
+
+    prob.setup()
+    prob.run_model()
+    return prob
+
+
+def run_loop(prob, delta_T):
+    for value in delta_T:
+        prob['delta_T'] = value
+        prob.run_model()
+
+
+def get_memory(prob):
+    # bytes held by the atmosphere outputs and their partials
+    comp = prob.model.atmosphere_group.atmosphere_comp
+    num_bytes = sum(meta['val'].nbytes for meta in comp._subjacs_info.values())
+    num_bytes += sum(comp._outputs[name].nbytes for name in comp._var_rel_names['output'])
+    return num_bytes
+
+
+if __name__ == '__main__':
+    rows = []
+    for num_scenarios, num_altitudes in sizes:
+        repeat = 3 if num_scenarios * num_altitudes > 10000 else 10
+
+        loop_prob = build_problem(num_altitudes, 1)
+        delta_T = np.linspace(-30., 30., num_scenarios)
+        loop_time = best_time(lambda: run_loop(loop_prob, delta_T), repeat=repeat)
+
+        prob = build_problem(num_altitudes, num_scenarios)
+        vectorized_time = best_time(prob.run_model, repeat=repeat)
+        linearize_time = best_time(prob.model.run_linearize, repeat=repeat)
+
+        rows.append([
+            num_scenarios, num_altitudes,
+            '%.3e' % loop_time, '%.3e' % vectorized_time, '%.1f' % (loop_time / vectorized_time),
+            '%.3e' % linearize_time, '%.1f' % (get_memory(prob) / 1e6),
+        ])
+
+    print_table(['M', 'N', 'loop [s]', 'vectorized [s]', 'speedup',
+        'linearize [s]', 'memory [MB]'], rows)
@@ -0,0 +1,59 @@
+"""
+Times DragBuildupComp against the number of components in its table, to
+show that adding components only adds columns to the same array
+computation rather than new subsystems.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_drag_buildup
+"""
+from __future__ import print_function
+import numpy as np
+
+from openmdao.api import Problem
+
+from components.zero_lift_drag.drag_buildup_comp import DragBuildupComp, default_components
+from benchmarks.timing import best_time, print_table
+
+
+sizes = [1, 1000]
+
+num_components_list = [2, 6, 10, 50]
+
+
+def get_components(num_components):
+    return [
+        dict(default_components[ind % len(default_components)], name='component_{}'.format(ind))
+        for ind in range(num_components)
+    ]
+
+
+def build_problem(size, num_components):
+    shape = (size,)
+
+    prob = Problem()
+    comp = DragBuildupComp(shape=shape, components=get_components(num_components))
+    prob.model.add_subsystem('drag_buildup_comp', comp, promotes=['*'])
+    prob.setup()
+
+    prob['density'] = np.linspace(1.2, 0.3, size)
+    prob['speed'] = np.linspace(100., 250., size)
+    prob['dynamic_viscosity'] = np.linspace(1.8e-5, 1.4e-5, size)
+    prob['Mach_number'] = np.linspace(0.3, 0.85, size)
+    prob.run_model()
+    return prob
+
+
+if __name__ == '__main__':
+    rows = []
+    for size in sizes:
+        for num_components in num_components_list:
+            prob = build_problem(size, num_components)
+            num_systems = len(list(prob.model.system_iter(recurse=True)))
+            rows.append([
+                size, num_components, num_systems,
+                '%.3e' % best_time(prob.run_model, repeat=20),
+                '%.3e' % best_time(prob.model.run_linearize, repeat=20),
+            ])
+
+    print_table(['N', 'components', 'subsystems', 'run_model [s]', 'run_linearize [s]'], rows)
@@ -0,0 +1,78 @@
+"""
+Compares evaluating CD with OASGroup and ZeroLiftComp, one point per
+run_model, against looking it up in a DragPolarTable with DragPolarComp for
+a whole sweep at once. The one-time cost of building the table is reported
+as well; later runs load it from the cache.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_drag_polar
+"""
+from __future__ import print_function
+import tempfile
+import shutil
+import timeit
+
+import numpy as np
+
+from openmdao.api import Problem
+
+from components.oas_group import OASGroup
+from components.drag_polar.drag_polar_table import DragPolarTable
+from components.drag_polar.drag_polar_comp import DragPolarComp
+from components.surface import get_surface
+from benchmarks.timing import best_time, print_table
+
+
+sizes = [1, 1000, 100000]
+
+
+def build_oas_problem(surface):
+    prob = Problem()
+    prob.model.add_subsystem('oas_group', OASGroup(surface=surface), promotes=['*'])
+    prob.setup()
+    prob.run_model()
+    return prob
+
+
+def build_polar_problem(size, table):
+    prob = Problem()
+    prob.model.add_subsystem('drag_polar_comp', DragPolarComp(shape=(size,), table=table),
+        promotes=['*'])
+    prob.setup()
+
+    prob['CL'] = np.random.uniform(0.2, 0.7, size)
+    prob['Mach_number'] = np.random.uniform(0.65, 0.85, size)
+    prob['altitude'] = np.random.uniform(8500., 12500., size)
+    prob.run_model()
+    return prob
+
+
+if __name__ == '__main__':
+    surface = get_surface(num_y=11, num_x=5)
+    cache_dir = tempfile.mkdtemp()
+
+    start = timeit.default_timer()
+    table = DragPolarTable(surface, cache_dir=cache_dir)
+    build_time = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    DragPolarTable(surface, cache_dir=cache_dir)
+    load_time = timeit.default_timer() - start
+    shutil.rmtree(cache_dir)
+
+    print('table build: %.3f s (%d OAS solves), load from cache: %.2e s' % (
+        build_time, table.num_solves, load_time))
+    print()
+
+    # the zero-lift part is cheap next to the VLM solve, so one OAS run bounds a point from below
+    oas_time = best_time(build_oas_problem(surface).run_model, repeat=10)
+
+    rows = []
+    for size in sizes:
+        prob = build_polar_problem(size, table)
+        polar_time = best_time(prob.run_model, repeat=10)
+        rows.append([size, '%.3e' % (oas_time * size), '%.3e' % polar_time,
+            '%.0f' % (oas_time * size / polar_time)])
+
+    print_table(['N', 'OAS per point [s]', 'table [s]', 'speedup'], rows)
@@ -0,0 +1,88 @@
+"""
+Compares evaluating the thrust of N mission points with one thrustComp per
+point against a single vectorized EngineDeckComp, which also returns the
+fuel flow. Both run_model and the evaluation of the partial derivatives
+(run_linearize) are timed.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_engine_deck
+"""
+from __future__ import print_function
+
+import numpy as np
+
+from openmdao.api import Problem, Group, IndepVarComp
+
+from components.aeroprop.thrust_comp import thrustComp
+from components.aeroprop.engine_deck import get_engine_deck
+from components.aeroprop.engine_deck_comp import EngineDeckComp
+from benchmarks.timing import best_time, print_table
+
+
+sizes = [10, 100, 1000, 10000]
+
+# one component per point gets slow to set up, so larger N is only run vectorized
+max_scalar_size = 1000
+
+
+def build_scalar_problem(size):
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('altitude_km', val=np.random.uniform(0., 13., size))
+    prob.model.add_subsystem('inputs_comp', comp)
+
+    for ind in range(size):
+        prob.model.add_subsystem('thrust_comp_%d' % ind, thrustComp())
+        prob.model.connect('inputs_comp.altitude_km', 'thrust_comp_%d.altitude_km' % ind,
+            src_indices=[ind])
+
+    prob.setup()
+    prob.run_model()
+    return prob
+
+
+def build_deck_problem(size):
+    prob = Problem()
+
+    comp = IndepVarComp()
+    comp.add_output('altitude_km', val=np.random.uniform(0., 13., size))
+    comp.add_output('Mach_number', val=np.random.uniform(0.3, 0.85, size))
+    comp.add_output('throttle', val=np.random.uniform(0.4, 1., size))
+    prob.model.add_subsystem('inputs_comp', comp, promotes=['*'])
+    prob.model.add_subsystem('engine_deck_comp', EngineDeckComp(shape=(size,)),
+        promotes=['*'])
+
+    prob.setup()
+    prob.run_model()
+    return prob
+
+
+if __name__ == '__main__':
+    # build the shared interpolants outside of the timings
+    get_engine_deck()
+    build_deck_problem(1)
+
+    rows = []
+    for size in sizes:
+        if size <= max_scalar_size:
+            prob = build_scalar_problem(size)
+            scalar_times = [best_time(prob.run_model), best_time(prob.model.run_linearize)]
+        else:
+            scalar_times = [None, None]
+
+        prob = build_deck_problem(size)
+        deck_times = [best_time(prob.run_model), best_time(prob.model.run_linearize)]
+
+        row = [size]
+        for scalar_time, deck_time in zip(scalar_times, deck_times):
+            if scalar_time is None:
+                row += ['n/a', '%.3e' % deck_time, 'n/a']
+            else:
+                row += ['%.3e' % scalar_time, '%.3e' % deck_time,
+                    '%.1f' % (scalar_time / deck_time)]
+        rows.append(row)
+
+    print_table(['N', 'run thrustComp [s]', 'run deck [s]', 'speedup',
+        'partials thrustComp [s]', 'partials deck [s]', 'speedup'], rows)
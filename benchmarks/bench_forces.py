@@ -0,0 +1,87 @@
+"""
+Compares evaluating lift and drag at N flight points with one liftComp and
+one dragComp per point against a single vectorized ForcesComp. Both
+run_model and the evaluation of the partial derivatives (run_linearize) are
+timed.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_forces
+"""
+from __future__ import print_function
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp
+
+from components.aeroprop.lift_comp import liftComp
+from components.aeroprop.drag_comp import dragComp
+from components.aeroprop.forces_comp import ForcesComp
+from benchmarks.timing import best_time, print_table
+
+
+sizes = [10, 100, 1000, 10000]
+
+# one component per point gets slow to set up, so larger N is only run vectorized
+max_scalar_size = 1000
+
+
+def add_inputs(prob, size, **kwargs):
+    comp = IndepVarComp()
+    comp.add_output('speed', val=np.random.uniform(80., 260., size))
+    comp.add_output('density', val=np.random.uniform(0.3, 1.2, size))
+    comp.add_output('S_w', val=157. * np.ones(size))
+    comp.add_output('CL', val=np.random.uniform(0.2, 0.7, size))
+    comp.add_output('CD', val=np.random.uniform(0.02, 0.05, size))
+    prob.model.add_subsystem('inputs_comp', comp, **kwargs)
+
+
+def build_scalar_problem(size):
+    prob = Problem()
+    add_inputs(prob, size)
+
+    for ind in range(size):
+        for comp_class, comp_name, coeff_name in [
+                (liftComp, 'lift_comp', 'CL'), (dragComp, 'drag_comp', 'CD')]:
+            prob.model.add_subsystem('%s_%d' % (comp_name, ind), comp_class())
+            for name in ['speed', 'density', 'S_w', coeff_name]:
+                prob.model.connect('inputs_comp.' + name,
+                    '%s_%d.%s' % (comp_name, ind, name), src_indices=[ind])
+
+    prob.setup()
+    prob.run_model()
+    return prob
+
+
+def build_forces_problem(size):
+    prob = Problem()
+    add_inputs(prob, size, promotes=['*'])
+    prob.model.add_subsystem('forces_comp', ForcesComp(shape=(size,)), promotes=['*'])
+    prob.setup()
+    prob.run_model()
+    return prob
+
+
+if __name__ == '__main__':
+    rows = []
+    for size in sizes:
+        if size <= max_scalar_size:
+            prob = build_scalar_problem(size)
+            scalar_times = [best_time(prob.run_model), best_time(prob.model.run_linearize)]
+        else:
+            scalar_times = [None, None]
+
+        prob = build_forces_problem(size)
+        forces_times = [best_time(prob.run_model), best_time(prob.model.run_linearize)]
+
+        row = [size]
+        for scalar_time, forces_time in zip(scalar_times, forces_times):
+            if scalar_time is None:
+                row += ['n/a', '%.3e' % forces_time, 'n/a']
+            else:
+                row += ['%.3e' % scalar_time, '%.3e' % forces_time,
+                    '%.1f' % (scalar_time / forces_time)]
+        rows.append(row)
+
+    print_table(['N', 'run lift+drag [s]', 'run forces [s]', 'speedup',
+        'partials lift+drag [s]', 'partials forces [s]', 'speedup'], rows)
@@ -0,0 +1,79 @@
+"""
+Tracks the cold-start import time of every entry point.
+
+For each run script, the top-level import statements are extracted and
+executed in a fresh interpreter, so the time measured is what the script
+pays before it builds its model. The same is done for a few single names
+from the lazy api module to show what analysis-only runs pay. Scripts whose
+imports cannot be resolved in the current environment report the missing
+module instead of a time.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_import_time
+"""
+from __future__ import print_function
+import ast
+import os
+import subprocess
+import sys
+
+from benchmarks.timing import print_table
+
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+entry_points = ['run.py', 'run_opt.py', 'run_with_viz.py', 'runWeightGroup.py', 'viz.py']
+
+api_names = ['weightCompGroup', 'AtmosphereComp', 'ZeroLiftGroup', 'OASGroup']
+
+repeat = 5
+
+timer_code = """
+import time
+start = time.perf_counter()
+{}
+print(time.perf_counter() - start)
+"""
+
+
+def get_import_code(file_name):
+    with open(os.path.join(root_dir, file_name)) as f:
+        source = f.read()
+
+    lines = []
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            lines.append(ast.get_source_segment(source, node))
+    return '\n'.join(lines)
+
+
+def time_imports(code):
+    """
+    Returns the best import time over several fresh interpreters [s], or the
+    last line of the error if the imports fail.
+    """
+    times = []
+    for ind in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-c', timer_code.format(code)],
+            cwd=root_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        if result.returncode != 0:
+            return result.stderr.strip().splitlines()[-1]
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+
+    return '%.3f' % min(times)
+
+
+if __name__ == '__main__':
+    rows = []
+    for file_name in entry_points:
+        rows.append([file_name, time_imports(get_import_code(file_name))])
+
+    rows.append(['import api', time_imports('import api')])
+    for name in api_names:
+        rows.append(['from api import %s' % name, time_imports('from api import %s' % name)])
+
+    print_table(['entry point', 'import time [s]'], rows)
@@ -0,0 +1,42 @@
+"""
+Minimizes the drag of the run.py wing at CL = 0.5 over alpha and the twist
+on the finest mesh of default_levels, once directly from the default design
+and once by coarse-to-fine mesh continuation, and reports the iterations,
+model evaluations and wall time of every level and in total.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_mesh_continuation
+"""
+from __future__ import print_function
+import timeit
+
+from components.mesh_continuation import default_levels, build_design_problem, \
+    run_mesh_continuation
+from benchmarks.timing import print_table
+
+
+if __name__ == '__main__':
+    rows = []
+
+    prob = build_design_problem(*default_levels[-1])
+    start = timeit.default_timer()
+    failed = prob.run_driver()
+    direct_time = timeit.default_timer() - start
+    rows.append(['direct', '%d x %d' % default_levels[-1][:2], 'no' if failed else 'yes',
+        prob.driver.result.nit, prob.model.iter_count, '%.2f' % direct_time,
+        '%.6f' % prob['aero_point_0.CD'][0]])
+
+    _, results = run_mesh_continuation()
+    for result in results:
+        rows.append(['continuation', '%d x %d' % result['level'][:2],
+            'yes' if result['converged'] else 'no', result['iterations'],
+            result['model_evals'], '%.2f' % result['wall_time'], '%.6f' % result['objective']])
+
+    continuation_time = sum(result['wall_time'] for result in results)
+    rows.append(['continuation', 'total', '', sum(result['iterations'] for result in results),
+        sum(result['model_evals'] for result in results), '%.2f' % continuation_time, ''])
+
+    print_table(['run', 'mesh', 'converged', 'iterations', 'model evals', 'wall time [s]',
+        'CD'], rows)
+    print('speedup: %.1f' % (direct_time / continuation_time))
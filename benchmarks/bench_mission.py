@@ -0,0 +1,100 @@
+"""
+Compares a mission of N segments modeled as a chain of Breguet ExecComps,
+one per segment with the end weight of each feeding the next, against a
+single MissionComp. Both run_model and the total derivatives of the fuel
+burn with respect to every segment input, as the optimizer needs them,
+are timed.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_mission
+"""
+from __future__ import print_function
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExecComp
+
+from components.breguet_range.mission_comp import MissionComp
+from benchmarks.timing import best_time, print_table
+
+
+sizes = [10, 100, 1000]
+
+segment_names = ['CL', 'CD', 'CT', 'speed', 'segment_range']
+
+
+def add_inputs(prob, size, **kwargs):
+    # the same segments for both models
+    np.random.seed(size)
+
+    comp = IndepVarComp()
+    comp.add_output('CL', val=np.random.uniform(0.4, 0.6, size))
+    comp.add_output('CD', val=np.random.uniform(0.02, 0.03, size))
+    comp.add_output('CT', val=1.6e-4 * np.ones(size))
+    comp.add_output('speed', val=250. * np.ones(size))
+    comp.add_output('segment_range', val=6e6 / size * np.ones(size))
+    comp.add_output('landing_weight', val=100000.)
+    prob.model.add_subsystem('inputs_comp', comp, **kwargs)
+
+
+def build_chain_problem(size):
+    prob = Problem()
+    add_inputs(prob, size)
+
+    # integrated backwards from the landing weight, like MissionComp
+    source = 'inputs_comp.landing_weight'
+    for ind in reversed(range(size)):
+        name = 'segment_%d' % ind
+        prob.model.add_subsystem(name, ExecComp(
+            'W_start = W_end * exp(segment_range * CT / speed * CD / CL)'))
+        prob.model.connect(source, name + '.W_end')
+        for in_name in segment_names:
+            prob.model.connect('inputs_comp.' + in_name, name + '.' + in_name,
+                src_indices=[ind])
+        source = name + '.W_start'
+
+    prob.model.add_subsystem('fuelburn_comp', ExecComp('fuelburn = W_takeoff - W_landing'))
+    prob.model.connect(source, 'fuelburn_comp.W_takeoff')
+    prob.model.connect('inputs_comp.landing_weight', 'fuelburn_comp.W_landing')
+
+    return setup(prob, 'inputs_comp.', 'fuelburn_comp.fuelburn')
+
+
+def build_mission_problem(size):
+    prob = Problem()
+    add_inputs(prob, size, promotes=['*'])
+    prob.model.add_subsystem('mission_comp', MissionComp(num_segments=size), promotes=['*'])
+
+    return setup(prob, '', 'fuelburn')
+
+
+def setup(prob, prefix, objective):
+    for name in segment_names:
+        prob.model.add_design_var(prefix + name)
+    prob.model.add_objective(objective)
+
+    prob.setup(mode='rev')
+    prob.run_model()
+    return prob
+
+
+if __name__ == '__main__':
+    rows = []
+    for size in sizes:
+        chain_prob = build_chain_problem(size)
+        mission_prob = build_mission_problem(size)
+
+        row = [size]
+        for method_name in ['run_model', 'compute_totals']:
+            chain_time = best_time(getattr(chain_prob, method_name))
+            mission_time = best_time(getattr(mission_prob, method_name))
+            row += ['%.3e' % chain_time, '%.3e' % mission_time,
+                '%.1f' % (chain_time / mission_time)]
+        rows.append(row)
+
+        # both give the same fuel burn
+        assert np.allclose(chain_prob['fuelburn_comp.fuelburn'], mission_prob['fuelburn'])
+
+    print_table(['segments', 'run chain [s]', 'run mission [s]', 'speedup',
+        'totals chain [s]', 'totals mission [s]', 'speedup'], rows)
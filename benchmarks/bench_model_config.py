@@ -0,0 +1,61 @@
+"""
+Runs the models of the example configs in model_config/configs for a sweep
+of input values, once building and setting up the problem for every run
+and once with a ModelCache, which builds every model structure only once.
+Reports the build and setup time per run and the time the cache saves.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_model_config
+"""
+from __future__ import division, print_function
+import os
+import timeit
+
+from model_config.config import load_config, update_config
+from model_config.model_builder import ModelCache, build_problem
+from benchmarks.timing import print_table
+
+
+num_runs = 10
+
+# (config, swept input, first value, last value), analyzed with run_model
+sweeps = [
+    ('run_opt.yaml', 'altitude', 9000., 12000.),
+    ('run.yaml', 'rnge', 1.e6, 2.e6),
+    ('run_opt2.yaml', 'span', 50., 62.),
+]
+
+
+def get_configs(file_name, name, first, last):
+    config = load_config(os.path.join('model_config', 'configs', file_name))
+    config['run'] = 'model'
+    return [update_config(config, {name: first + (last - first) * ind / (num_runs - 1)})
+        for ind in range(num_runs)]
+
+
+if __name__ == '__main__':
+    rows = []
+    for file_name, name, first, last in sweeps:
+        configs = get_configs(file_name, name, first, last)
+
+        start = timeit.default_timer()
+        for config in configs:
+            prob = build_problem(config)
+            for input_name, value in config['inputs'].items():
+                prob[input_name] = value
+            prob.run_model()
+        fresh_time = timeit.default_timer() - start
+
+        cache = ModelCache()
+        start = timeit.default_timer()
+        for config in configs:
+            cache.get_problem(config).run_model()
+        cached_time = timeit.default_timer() - start
+
+        rows.append([file_name, num_runs, '%.3f' % (fresh_time / num_runs),
+            '%.3f' % (cached_time / num_runs), '%.3f' % (cache.build_time / cache.misses),
+            '%.2f' % cache.saved_time, '%.1f' % (fresh_time / cached_time)])
+
+    print_table(['config', 'runs', 'built every run [s/run]', 'cached [s/run]',
+        'build + setup [s]', 'setup saved [s]', 'speedup'], rows)
@@ -0,0 +1,91 @@
+"""
+Evaluates N flight conditions with one single-point OASGroup, changing the
+conditions between run_model calls, against one multi-point OASGroup whose
+N aero points share the geometry group, for the run and for the total
+derivatives of CL and CD of every point with respect to the twist. Under MPI, for example
+
+    mpirun -n 4 python -m benchmarks.bench_multipoint
+
+the multi-point group puts its points in a ParallelGroup.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_multipoint
+"""
+from __future__ import print_function
+
+import numpy as np
+
+from openmdao.api import Problem
+from openmdao.utils.mpi import MPI
+
+from components.oas_group import OASGroup
+from components.surface import get_surface
+from benchmarks.timing import best_time, print_table
+
+
+sizes = [1, 3, 10, 30]
+
+
+def get_conditions(size):
+    np.random.seed(size)
+    return dict(
+        alpha=np.random.uniform(0., 8., size),
+        Mach_number=np.random.uniform(0.6, 0.85, size),
+        rho=np.random.uniform(0.35, 1.2, size),
+    )
+
+
+def build_problem(surface, num_points):
+    prob = Problem()
+    prob.model.add_subsystem('oas_group',
+        OASGroup(surface=surface, num_points=num_points, parallel=MPI is not None),
+        promotes=['*'])
+    # a shared geometry variable, as in a multi-point design problem
+    prob.model.add_design_var('wing.twist_cp')
+    for ind in range(num_points):
+        prob.model.add_constraint('aero_point_%d.CL' % ind)
+        prob.model.add_constraint('aero_point_%d.CD' % ind)
+    prob.setup()
+    return prob
+
+
+def run_points(prob, conditions, totals):
+    for ind in range(conditions['alpha'].size):
+        for name, value in conditions.items():
+            prob[name] = value[ind]
+        prob.run_model()
+        if totals:
+            prob.compute_totals()
+
+
+def run_multipoint(prob, conditions, totals):
+    for name, value in conditions.items():
+        prob[name] = value
+    prob.run_model()
+    if totals:
+        prob.compute_totals()
+
+
+if __name__ == '__main__':
+    surface = get_surface(num_y=11, num_x=5)
+
+    rows = []
+    for size in sizes:
+        conditions = get_conditions(size)
+
+        prob = build_problem(surface, 1)
+        points_time = best_time(lambda: run_points(prob, conditions, False))
+        points_totals_time = best_time(lambda: run_points(prob, conditions, True))
+
+        prob = build_problem(surface, size)
+        multipoint_time = best_time(lambda: run_multipoint(prob, conditions, False))
+        multipoint_totals_time = best_time(lambda: run_multipoint(prob, conditions, True))
+
+        rows.append([size, '%.3e' % points_time, '%.3e' % multipoint_time,
+            '%.1f' % (points_time / multipoint_time), '%.3e' % points_totals_time,
+            '%.3e' % multipoint_totals_time, '%.1f' % (points_totals_time / multipoint_totals_time)])
+
+    if MPI is None or MPI.COMM_WORLD.rank == 0:
+        print_table(['N', 'run points [s]', 'run multipoint [s]', 'speedup',
+            'totals points [s]', 'totals multipoint [s]', 'speedup'], rows)
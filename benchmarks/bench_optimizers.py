@@ -0,0 +1,58 @@
+"""
+Runs the run_opt design problem (PerformanceGroup with add_design_problem)
+with COBYLA, which only uses function values, and with SLSQP, which uses
+the analytic total derivatives, and reports the model and gradient
+evaluations, the wall time and the optimum of both.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_optimizers
+"""
+from __future__ import print_function
+import timeit
+
+from openmdao.api import Problem, ScipyOptimizeDriver
+
+from components.performance_group import PerformanceGroup, add_design_problem
+from components.surface import get_surface
+from benchmarks.timing import print_table
+
+
+optimizers = ['COBYLA', 'SLSQP']
+
+
+def build_problem(surface, optimizer):
+    prob = Problem()
+    prob.model.add_subsystem('performance_group', PerformanceGroup(surface=surface),
+        promotes=['*'])
+    add_design_problem(prob.model)
+
+    prob.driver = ScipyOptimizeDriver(optimizer=optimizer, tol=1e-9, maxiter=500, disp=False)
+    prob.setup()
+    return prob
+
+
+if __name__ == '__main__':
+    surface = get_surface(num_y=11, num_x=5)
+
+    rows = []
+    for optimizer in optimizers:
+        prob = build_problem(surface, optimizer)
+
+        start = timeit.default_timer()
+        failed = prob.run_driver()
+        wall_time = timeit.default_timer() - start
+
+        rows.append([
+            optimizer,
+            'no' if failed else 'yes',
+            prob.model.iter_count,
+            getattr(prob.driver.result, 'njev', 0),
+            '%.2f' % wall_time,
+            '%.3f' % prob['fuelburn'][0],
+            '%.4f' % prob['LD'][0],
+            '%.2e' % prob['LOW'][0],
+        ])
+
+    print_table(['optimizer', 'converged', 'model evals', 'gradient evals', 'wall time [s]',
+        'fuelburn [kg]', 'LD', 'LOW'], rows)
@@ -0,0 +1,71 @@
+"""
+Runs the run_opt design problem with the gross weight W0 sized in three
+ways: by the optimizer, with W0 as a design variable and the W0_residual
+equality constraint (add_sizing_constraint), and inside the model by the
+Newton or Aitken-accelerated Gauss-Seidel sizing_solver of the
+PerformanceGroup. Reports the sizing iterations of one model evaluation
+from the default W0, and the evaluations, wall time and optimum of SLSQP.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_sizing
+"""
+from __future__ import print_function
+import timeit
+
+from openmdao.api import Problem, ScipyOptimizeDriver
+
+from components.performance_group import PerformanceGroup, add_design_problem, \
+    add_sizing_constraint
+from components.surface import get_surface
+from benchmarks.timing import print_table
+
+
+sizing_solvers = [None, 'newton', 'aitken']
+
+
+def build_problem(surface, sizing_solver):
+    prob = Problem()
+    prob.model.add_subsystem('performance_group',
+        PerformanceGroup(surface=surface, sizing_solver=sizing_solver), promotes=['*'])
+    add_design_problem(prob.model)
+    if sizing_solver is None:
+        add_sizing_constraint(prob.model)
+
+    prob.driver = ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, maxiter=500, disp=False)
+    prob.setup()
+    return prob
+
+
+if __name__ == '__main__':
+    surface = get_surface(num_y=11, num_x=5)
+
+    rows = []
+    for sizing_solver in sizing_solvers:
+        prob = build_problem(surface, sizing_solver)
+
+        prob.run_model()
+        if sizing_solver is None:
+            sizing_iterations = 'n/a'
+        else:
+            sizing_iterations = prob.model.performance_group.sizing_group \
+                .nonlinear_solver._iter_count
+
+        start = timeit.default_timer()
+        failed = prob.run_driver()
+        wall_time = timeit.default_timer() - start
+
+        rows.append([
+            sizing_solver or 'constraint',
+            sizing_iterations,
+            'no' if failed else 'yes',
+            prob.driver.result.nit,
+            prob.model.iter_count,
+            prob.driver.result.njev,
+            '%.2f' % wall_time,
+            '%.3f' % prob['fuelburn'][0],
+            '%.1f' % prob['W0'][0],
+        ])
+
+    print_table(['W0 sizing', 'sizing iterations', 'converged', 'optimizer iterations',
+        'model evals', 'gradient evals', 'wall time [s]', 'fuelburn [kg]', 'W0 [lb]'], rows)
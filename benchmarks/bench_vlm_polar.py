@@ -0,0 +1,66 @@
+"""
+Compares tracing a drag polar of 200 angles of attack with OASGroup, one
+run_model per alpha, against VLMPolar, which factors the VLM system once and
+evaluates the whole batch by superposition, and reports the largest
+difference in CL and CDi between the two.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_vlm_polar
+"""
+from __future__ import print_function
+
+import numpy as np
+
+from openmdao.api import Problem
+
+from components.oas_group import OASGroup
+from components.drag_polar.vlm_polar import VLMPolar
+from components.surface import get_surface
+from benchmarks.timing import best_time, print_table
+
+
+alpha = np.linspace(-4., 12., 200)
+
+
+def build_oas_problem(surface):
+    prob = Problem()
+    prob.model.add_subsystem('oas_group', OASGroup(surface=surface), promotes=['*'])
+    prob.setup()
+    return prob
+
+
+def run_oas_polar(prob):
+    CL = np.zeros(alpha.size)
+    CDi = np.zeros(alpha.size)
+    for ind, alpha_value in enumerate(alpha):
+        prob['alpha'] = alpha_value
+        prob.run_model()
+        CL[ind] = prob['aero_point_0.wing_perf.CL'][0]
+        CDi[ind] = prob['aero_point_0.wing_perf.CDi'][0]
+    return CL, CDi
+
+
+if __name__ == '__main__':
+    surface = get_surface(num_y=11, num_x=5)
+
+    prob = build_oas_problem(surface)
+    oas_time = best_time(lambda: run_oas_polar(prob), repeat=1)
+    single_time = best_time(prob.run_model)
+    CL, CDi = run_oas_polar(prob)
+
+    build_time = best_time(lambda: VLMPolar(surface))
+    polar = VLMPolar(surface)
+    compute_time = best_time(lambda: polar.compute(alpha))
+    values = polar.compute(alpha)
+
+    print_table(['method', 'time [s]', 'in run_model calls'], [
+        ['OASGroup, 1 run_model', '%.3e' % single_time, '1.0'],
+        ['OASGroup, 200 alphas', '%.3e' % oas_time, '%.1f' % (oas_time / single_time)],
+        ['VLMPolar build', '%.3e' % build_time, '%.1f' % (build_time / single_time)],
+        ['VLMPolar, 200 alphas', '%.3e' % compute_time, '%.3f' % (compute_time / single_time)],
+    ])
+    print()
+    print('largest relative difference over alpha = {} to {} deg:'.format(alpha[0], alpha[-1]))
+    print('    CL  {:.2e}'.format(np.max(np.abs(values['CL'] - CL) / np.abs(CL).max())))
+    print('    CDi {:.2e}'.format(np.max(np.abs(values['CDi'] - CDi) / np.abs(CDi).max())))
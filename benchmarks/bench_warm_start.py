@@ -0,0 +1,94 @@
+"""
+Runs the run_opt design problem with SLSQP and COBYLA with the direct VLM
+solve of OpenAeroStruct and with the GMRES solve of WarmStartAeroPoint,
+seeded from zero (cold) or from the previous solution (warm). Reports the
+GMRES iterations per model evaluation and per derivative solve, the
+iterations the warm start saves per driver step, the refactorizations of
+the preconditioner and the wall time of the optimization.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_warm_start
+"""
+from __future__ import division, print_function
+import timeit
+
+from openmdao.api import Problem, ScipyOptimizeDriver
+
+from components.performance_group import PerformanceGroup, add_design_problem
+from components.surface import get_surface
+from benchmarks.timing import print_table
+
+
+optimizers = ['SLSQP', 'COBYLA']
+
+# (label, aero_vlm_solver, warm_start)
+variants = [
+    ('direct', 'direct', None),
+    ('gmres cold', 'gmres', False),
+    ('gmres warm', 'gmres', True),
+]
+
+
+def build_problem(surface, optimizer, vlm_solver, warm_start):
+    prob = Problem()
+    prob.model.add_subsystem('performance_group',
+        PerformanceGroup(surface=surface, sizing_solver='newton', aero_vlm_solver=vlm_solver),
+        promotes=['*'])
+    add_design_problem(prob.model)
+
+    prob.driver = ScipyOptimizeDriver(optimizer=optimizer, tol=1e-9, maxiter=500, disp=False)
+    prob.setup()
+
+    if warm_start is not None:
+        get_solve_matrix(prob).options['warm_start'] = warm_start
+    return prob
+
+
+def get_solve_matrix(prob):
+    return prob.model.performance_group.oas_group.aero_point_0.aero_states.solve_matrix
+
+
+if __name__ == '__main__':
+    surface = get_surface(num_y=11, num_x=5)
+
+    rows = []
+    for optimizer in optimizers:
+        cold_iterations = None
+        for label, vlm_solver, warm_start in variants:
+            prob = build_problem(surface, optimizer, vlm_solver, warm_start)
+
+            start = timeit.default_timer()
+            prob.run_driver()
+            wall_time = timeit.default_timer() - start
+
+            row = [optimizer, label, prob.model.iter_count, '%.2f' % wall_time,
+                '%.3f' % prob['fuelburn'][0]]
+            if vlm_solver == 'direct':
+                rows.append(row + ['-', '-', '-', '-'])
+                continue
+
+            totals = get_solve_matrix(prob).solve_totals
+            nonlinear = totals['nonlinear']
+            derivative = dict((name, totals['fwd'][name] + totals['rev'][name])
+                for name in ['solves', 'iterations', 'refactored'])
+
+            # a driver step is a model evaluation with the derivative solves that follow it
+            iterations = (nonlinear['iterations'] + derivative['iterations']) / nonlinear['solves']
+            if warm_start:
+                saved = '%.1f' % (cold_iterations - iterations)
+            else:
+                cold_iterations = iterations
+                saved = '-'
+
+            rows.append(row + [
+                '%.1f' % (nonlinear['iterations'] / nonlinear['solves']),
+                '%.1f' % (derivative['iterations'] / derivative['solves'])
+                    if derivative['solves'] else '-',
+                saved,
+                nonlinear['refactored'] + derivative['refactored'],
+            ])
+
+    print_table(['optimizer', 'VLM solve', 'model evals', 'wall time [s]', 'fuelburn [kg]',
+        'GMRES its / eval', 'GMRES its / derivative solve', 'its saved / step', 'LU factorizations'],
+        rows)
@@ -0,0 +1,77 @@
+"""
+Screens N random configurations with the table-driven weight engine, as the
+numpy function compute_weights and as weightEngineComp, against
+weightCompGroup with one vectorized component per weight.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_weight_engine
+"""
+from __future__ import print_function
+
+import numpy as np
+
+from openmdao.api import Problem
+
+from weight_component.weightEngine import compute_weights, input_defaults
+from weight_component.weightGroup import weightCompGroup
+from benchmarks.timing import best_time, print_table
+
+
+sizes = [1000, 10000, 100000, 1000000]
+
+# the OpenMDAO vectors and Jacobians of larger problems do not fit in memory here,
+# so larger N is only run through the function
+max_problem_size = 100000
+
+
+def get_inputs(size):
+    # every input scattered by +-20 % around its default
+    return dict(
+        (name, value * np.random.uniform(0.8, 1.2, size))
+        for name, value in input_defaults.items()
+    )
+
+
+def build_problem(size, inputs, fused):
+    prob = Problem()
+    prob.model.add_subsystem('weight_group', weightCompGroup(shape=(size,), fused=fused),
+        promotes=['*'])
+    prob.setup()
+
+    for name, value in inputs.items():
+        prob[name] = value
+    prob.run_model()
+    return prob
+
+
+if __name__ == '__main__':
+    rows = []
+    for size in sizes:
+        inputs = get_inputs(size)
+
+        function_time = best_time(lambda: compute_weights(inputs, derivs=False))
+        derivs_time = best_time(lambda: compute_weights(inputs))
+
+        row = [size, '%.3e' % function_time, '%.3e' % derivs_time]
+        if size > max_problem_size:
+            rows.append(row + ['n/a'] * 6)
+            continue
+
+        prob = build_problem(size, inputs, fused=True)
+        engine_time = best_time(prob.run_model)
+        engine_partials_time = best_time(prob.model.run_linearize)
+        del prob
+
+        prob = build_problem(size, inputs, fused=False)
+        group_time = best_time(prob.run_model)
+        group_partials_time = best_time(prob.model.run_linearize)
+        del prob
+
+        rows.append(row + ['%.3e' % engine_time, '%.3e' % group_time,
+            '%.1f' % (group_time / engine_time), '%.3e' % engine_partials_time,
+            '%.3e' % group_partials_time, '%.1f' % (group_partials_time / engine_partials_time)])
+
+    print_table(['N', 'function [s]', 'function + derivs [s]', 'run engine [s]',
+        'run group [s]', 'speedup', 'partials engine [s]', 'partials group [s]', 'speedup'],
+        rows)
@@ -0,0 +1,71 @@
+"""
+Compares three ways of sweeping the load factor N and wing sweep of
+weightCompGroup over K configurations: a new Problem set up for every
+point, one set-up Problem whose inputs are changed between run_model calls,
+and one Problem with shape=(K,) evaluating all points at once.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_weight_sweep
+"""
+from __future__ import print_function
+
+import numpy as np
+
+from openmdao.api import Problem
+
+from weight_component.weightGroup import weightCompGroup
+from benchmarks.timing import best_time, print_table
+
+
+sizes = [10, 100, 1000]
+
+
+def build_problem(shape=(1,)):
+    prob = Problem()
+    prob.model.add_subsystem('weight_group', weightCompGroup(shape=shape), promotes=['*'])
+    prob.setup()
+    prob['S_w'] = 400.
+    return prob
+
+
+def sweep_setup(N, sweep):
+    for ind in range(N.size):
+        prob = build_problem()
+        prob['N'] = N[ind]
+        prob['sweep_w'] = sweep[ind]
+        prob.run_model()
+
+
+def sweep_inputs(prob, N, sweep):
+    for ind in range(N.size):
+        prob['N'] = N[ind]
+        prob['sweep_w'] = sweep[ind]
+        prob.run_model()
+
+
+def sweep_vectorized(prob, N, sweep):
+    prob['N'] = N
+    prob['sweep_w'] = sweep
+    prob.run_model()
+
+
+if __name__ == '__main__':
+    rows = []
+    for size in sizes:
+        N = np.random.uniform(2.5, 4.5, size)
+        sweep = np.random.uniform(20., 35., size)
+
+        setup_time = best_time(lambda: sweep_setup(N, sweep), repeat=1)
+
+        prob = build_problem()
+        inputs_time = best_time(lambda: sweep_inputs(prob, N, sweep))
+
+        prob = build_problem((size,))
+        vectorized_time = best_time(lambda: sweep_vectorized(prob, N, sweep))
+
+        rows.append([size, '%.3e' % setup_time, '%.3e' % inputs_time, '%.3e' % vectorized_time,
+            '%.0f' % (setup_time / inputs_time), '%.0f' % (setup_time / vectorized_time)])
+
+    print_table(['K', 'setup per point [s]', 'inputs [s]', 'vectorized [s]',
+        'speedup inputs', 'speedup vectorized'], rows)
@@ -0,0 +1,65 @@
+"""
+Compares the per-evaluation latency of ZeroLiftGroup with its subsystem
+chain (atmosphere, Re, Re_cutoff, min, Cf, SWet, FormDragCo, C0 and CD0
+components) against the same group with fused=True, which computes CD0 in a
+single ZeroLiftComp, and with the table-driven drag build-up. The chain
+needs lsdo_utils; if it is not installed, its timings are reported as n/a.
+
+Run from the repository root with
+
+    python -m benchmarks.bench_zero_lift
+"""
+from __future__ import print_function
+
+from openmdao.api import Problem
+
+from components.zero_lift_drag.zero_lift_group import ZeroLiftGroup
+from components.zero_lift_drag.drag_buildup_comp import default_components
+from benchmarks.timing import best_time, print_table
+
+
+sizes = [1, 1000]
+
+variants = [
+    ('chain', dict()),
+    ('fused', dict(fused=True)),
+    ('buildup', dict(buildup_table=default_components)),
+]
+
+
+def build_problem(size, **kwargs):
+    prob = Problem()
+    prob.model.add_subsystem('zero_lift_group', ZeroLiftGroup(shape=(size,), **kwargs),
+        promotes=['*'])
+    prob.setup()
+    prob.run_model()
+    return prob
+
+
+if __name__ == '__main__':
+    run_rows = []
+    linearize_rows = []
+    for size in sizes:
+        run_row = [size]
+        linearize_row = [size]
+        for name, kwargs in variants:
+            try:
+                prob = build_problem(size, **kwargs)
+            except ImportError:
+                run_row.append('n/a')
+                linearize_row.append('n/a')
+                continue
+
+            run_row.append('%.3e' % best_time(prob.run_model, repeat=20))
+            linearize_row.append('%.3e' % best_time(prob.model.run_linearize, repeat=20))
+
+        run_rows.append(run_row)
+        linearize_rows.append(linearize_row)
+
+    header = ['N'] + ['%s [s]' % name for name, kwargs in variants]
+
+    print('run_model')
+    print_table(header, run_rows)
+    print()
+    print('run_linearize')
+    print_table(header, linearize_rows)
@@ -0,0 +1,25 @@
+from __future__ import print_function
+import timeit
+
+
+def best_time(func, number=1, repeat=3):
+    """
+    Returns the best wall time per call of func over several repeats [s].
+    """
+    times = timeit.repeat(func, number=number, repeat=repeat)
+    return min(times) / number
+
+
+def print_table(header, rows):
+    """
+    Prints a simple fixed-width table of benchmark results.
+    """
+    widths = [
+        max(len(str(row[ind])) for row in [header] + rows)
+        for ind in range(len(header))
+    ]
+    line = ' | '.join('{:>%d}' % width for width in widths)
+    print(line.format(*header))
+    print('-+-'.join('-' * width for width in widths))
+    for row in rows:
+        print(line.format(*row))
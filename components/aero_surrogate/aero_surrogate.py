@@ -0,0 +1,175 @@
+from __future__ import division, print_function
+import os
+
+import numpy as np
+
+from openmdao.api import Problem
+from openmdao.surrogate_models.kriging import KrigingSurrogate
+
+from atmosphere.utils import compute_atmosphere
+from components.definition_key import get_definition_key
+
+
+# Version of the on-disk sample format; bump it to invalidate old caches
+surrogate_version = 1
+
+default_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_cache')
+
+# (name, lower, upper) of the inputs of the surrogate, around the run_opt design space
+default_bounds = [
+    ('span', 40., 70.),
+    ('sweep', 20., 35.),
+    ('dihedral', 0., 6.),
+    ('alpha', 0., 6.),
+    ('Mach_number', 0.7, 0.88),
+    ('altitude', 8000., 15000.),
+]
+
+# outputs of PerformanceGroup that are fitted, each with its own Kriging model
+output_names = ['CL', 'CD', 'L', 'D', 'S_ref']
+
+_surrogates = {}
+
+
+def get_aero_surrogate(surface, **kwargs):
+    """
+    Returns a shared AeroSurrogate, sampling and training it only once per process.
+    """
+    key = get_definition_key(surrogate_version, surface, sorted(kwargs.items()))
+    if key not in _surrogates:
+        _surrogates[key] = AeroSurrogate(surface, **kwargs)
+    return _surrogates[key]
+
+
+def get_latin_hypercube(num_samples, num_dims, seed=0):
+    """
+    Returns a (num_samples, num_dims) Latin hypercube sample of the unit cube:
+    every dimension has exactly one sample in each of num_samples strata.
+    """
+    rng = np.random.RandomState(seed)
+    strata = np.column_stack([rng.permutation(num_samples) for _ in range(num_dims)])
+    return (strata + rng.uniform(size=(num_samples, num_dims))) / num_samples
+
+
+class AeroSurrogate(object):
+    """
+    Kriging surrogates of CL, CD, L, D and S_ref of the PerformanceGroup
+    aerodynamics (OASGroup at the flight condition of the standard
+    atmosphere) over span, sweep, dihedral, alpha, Mach_number and altitude.
+
+    The model is sampled at a Latin hypercube of num_samples points within
+    bounds, with v = Mach_number * sonic speed. The sample, the k-fold
+    cross-validation errors and the trained Kriging models are cached on
+    disk, keyed by a hash of the surface dict, the bounds and the sampling
+    settings, so the OpenAeroStruct runs and the training only happen the
+    first time.
+    """
+
+    def __init__(self, surface, bounds=default_bounds, num_samples=150, num_folds=5, seed=0,
+            cache_dir=None):
+        self.surface = surface
+        self.bounds = [(name, float(lower), float(upper)) for name, lower, upper in bounds]
+        self.input_names = [name for name, _, _ in self.bounds]
+        self.num_samples = num_samples
+        self.num_folds = num_folds
+        self.seed = seed
+
+        if cache_dir is None:
+            cache_dir = default_cache_dir
+        self.key = get_definition_key(surrogate_version, surface, self.bounds, num_samples,
+            num_folds, seed)
+        self.file_path = os.path.join(cache_dir, 'aero_surrogate_{}.npz'.format(self.key))
+
+        self.num_solves = 0
+        if os.path.isfile(self.file_path):
+            self._load()
+        else:
+            self._sample()
+            self.cv_errors = self._cross_validate()
+            self._save()
+
+        self._train()
+
+    def predict(self, x):
+        """
+        Returns a dict with the (n,) predictions of every output at the
+        (n, num_inputs) points x.
+        """
+        x = np.atleast_2d(x)
+        return dict(
+            (name, self.models[name].predict(x).flatten()) for name in output_names)
+
+    def linearize(self, x):
+        """
+        Returns a dict with the (n, num_inputs) derivatives of every output at
+        the (n, num_inputs) points x.
+        """
+        x = np.atleast_2d(x)
+        return dict(
+            (name, np.array([self.models[name].linearize(point)[0] for point in x]))
+            for name in output_names)
+
+    def _sample(self):
+        from components.performance_group import PerformanceGroup
+
+        prob = Problem()
+        prob.model.add_subsystem('performance_group', PerformanceGroup(surface=self.surface),
+            promotes=['*'])
+        prob.setup()
+
+        lower = np.array([lower for _, lower, _ in self.bounds])
+        upper = np.array([upper for _, _, upper in self.bounds])
+        self.x = lower + (upper - lower) * get_latin_hypercube(self.num_samples,
+            len(self.bounds), self.seed)
+
+        self.y = np.zeros((self.num_samples, len(output_names)))
+        for ind, point in enumerate(self.x):
+            inputs = dict(zip(self.input_names, point))
+
+            # the flight speed is an input of the model and the Mach number follows from it
+            atm = compute_atmosphere(np.array([inputs['altitude']]), derivs=False)
+            prob['v'] = inputs.pop('Mach_number') * atm['sonic_speed']
+            for name, value in inputs.items():
+                prob[name] = value
+            prob.run_model()
+            self.num_solves += 1
+
+            self.y[ind] = [prob[name][0] for name in output_names]
+
+    def _cross_validate(self):
+        # RMS error of each output on the held-out folds, relative to its standard deviation
+        folds = np.arange(self.num_samples) % self.num_folds
+        errors = np.zeros((self.num_samples, len(output_names)))
+        for fold in range(self.num_folds):
+            train = folds != fold
+            for ind, name in enumerate(output_names):
+                model = KrigingSurrogate()
+                model.train(self.x[train], self.y[train, ind:ind + 1])
+                errors[~train, ind] = model.predict(self.x[~train]).flatten() \
+                    - self.y[~train, ind]
+
+        std = np.std(self.y, axis=0)
+        std[std == 0.] = 1.
+        return dict(zip(output_names, np.sqrt(np.mean(errors ** 2, axis=0)) / std))
+
+    def _train(self):
+        self.models = {}
+        for ind, name in enumerate(output_names):
+            model = KrigingSurrogate(training_cache=self.file_path.replace(
+                '.npz', '_{}.npz'.format(name)))
+            model.train(self.x, self.y[:, ind:ind + 1])
+            self.models[name] = model
+
+    def _save(self):
+        directory = os.path.dirname(self.file_path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        np.savez(self.file_path, x=self.x, y=self.y,
+            cv_errors=np.array([self.cv_errors[name] for name in output_names]))
+
+    def _load(self):
+        data = np.load(self.file_path)
+        self.x = data['x']
+        self.y = data['y']
+        self.cv_errors = dict(zip(output_names, data['cv_errors']))
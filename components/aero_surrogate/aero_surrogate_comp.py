@@ -0,0 +1,54 @@
+import numpy as np
+from openmdao.api import ExplicitComponent
+
+from .aero_surrogate import output_names
+
+#
+#    Evaluates the Kriging surrogates of an AeroSurrogate in place of OASGroup, so early design
+#    exploration does not run the VLM
+#
+
+# units of the inputs; Mach_number is unitless
+input_units = dict(span='m', sweep='deg', dihedral='deg', alpha='deg', altitude='m',
+    Mach_number=None)
+
+
+class AeroSurrogateComp(ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('surrogate', desc='AeroSurrogate')
+
+    def setup(self):
+        shape = self.options['shape']
+        surrogate = self.options['surrogate']
+        arange = np.arange(int(np.prod(shape)))
+
+        for name, lower, upper in surrogate.bounds:
+            self.add_input(name, val=0.5 * (lower + upper), shape=shape,
+                units=input_units.get(name))
+        for name in output_names:
+            self.add_output(name, shape=shape)
+
+        # every point only depends on its own inputs
+        self.declare_partials(output_names, surrogate.input_names, rows=arange, cols=arange)
+
+    def compute(self, inputs, outputs):
+        shape = self.options['shape']
+
+        values = self.options['surrogate'].predict(self._get_points(inputs))
+        for name in output_names:
+            outputs[name] = values[name].reshape(shape)
+
+    def compute_partials(self, inputs, partials):
+        surrogate = self.options['surrogate']
+
+        derivs = surrogate.linearize(self._get_points(inputs))
+        for out_name in output_names:
+            for ind, in_name in enumerate(surrogate.input_names):
+                partials[out_name, in_name] = derivs[out_name][:, ind]
+
+    def _get_points(self, inputs):
+        return np.column_stack([
+            inputs[name].flatten() for name in self.options['surrogate'].input_names
+        ])
@@ -0,0 +1,99 @@
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from .aero_surrogate import AeroSurrogate, output_names
+from .aero_surrogate_comp import AeroSurrogateComp
+from ..performance_group import PerformanceGroup
+from ..surface import get_surface
+
+from openmdao.api import Problem
+from ..complex_step import setup_problem, check_partials, check_totals
+
+from openmdao.utils.assert_utils import assert_check_partials
+
+#  test for the Kriging surrogate of the PerformanceGroup aerodynamics
+
+class TestAeroSurrogate(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cache_dir = tempfile.mkdtemp()
+        cls.surface = get_surface()
+        cls.kwargs = dict(num_samples=40, num_folds=4, cache_dir=cls.cache_dir)
+        cls.surrogate = AeroSurrogate(cls.surface, **cls.kwargs)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.cache_dir)
+
+    def test_sample(self):
+        surrogate = self.surrogate
+        self.assertEqual(surrogate.num_solves, 40)
+
+        # Latin hypercube: one sample per stratum of every input
+        for ind, (_, lower, upper) in enumerate(surrogate.bounds):
+            strata = np.floor((surrogate.x[:, ind] - lower) / (upper - lower) * 40)
+            self.assertEqual(sorted(strata), list(range(40)))
+
+        # even from 40 samples, CL and the reference area are fitted to 1 % of their spread
+        for name in ['CL', 'S_ref']:
+            self.assertLess(surrogate.cv_errors[name], 0.01, name)
+
+    def test_cache(self):
+        surrogate = AeroSurrogate(self.surface, **self.kwargs)
+        self.assertEqual(surrogate.num_solves, 0)
+
+        x = self.surrogate.x[:5] * 1.01
+        values = surrogate.predict(x)
+        ref_values = self.surrogate.predict(x)
+        for name in output_names:
+            np.testing.assert_allclose(values[name], ref_values[name], rtol=1e-12)
+        for name in output_names:
+            self.assertEqual(surrogate.cv_errors[name], self.surrogate.cv_errors[name])
+
+    def test_derivs(self):
+        prob = Problem()
+        prob.model.add_subsystem('aero_surrogate_comp',
+            AeroSurrogateComp(shape=(3,), surrogate=self.surrogate), promotes=['*'])
+        setup_problem(prob)
+        for ind, name in enumerate(self.surrogate.input_names):
+            prob[name] = self.surrogate.x[:3, ind] * 0.99
+        prob.run_model()
+
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1e-6, rtol=1e-6)
+
+    def test_performance_group(self):
+        prob = Problem()
+        prob.model.add_subsystem('performance_group',
+            PerformanceGroup(surface=self.surface, aero_surrogate=self.surrogate),
+            promotes=['*'])
+        prob.model.add_design_var('alpha')
+        prob.model.add_design_var('altitude')
+        prob.model.add_design_var('span')
+        prob.model.add_objective('fuelburn')
+        prob.model.add_constraint('LOW')
+        setup_problem(prob)
+        prob.run_model()
+
+        ref_prob = Problem()
+        ref_prob.model.add_subsystem('performance_group', PerformanceGroup(surface=self.surface),
+            promotes=['*'])
+        ref_prob.setup()
+        ref_prob.run_model()
+
+        # at the default design, within the bounds of the sample
+        for name in ['CL', 'L', 'S_ref']:
+            np.testing.assert_allclose(prob[name], ref_prob[name], rtol=1e-2, err_msg=name)
+
+        data = check_totals(prob, out_stream=None)
+        for key, pair_data in data.items():
+            if pair_data['magnitude'].fd > 1e-10:
+                self.assertLess(pair_data['rel error'].forward, 1e-6, key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+from __future__ import division, print_function
+import os
+
+import numpy as np
+from openmdao.components.interp_util.interp import InterpND
+
+from atmosphere.utils import compute_atmosphere
+
+
+default_altitude_km = np.linspace(0., 15., 16)
+default_mach = np.linspace(0., 0.95, 20)
+default_throttle = np.linspace(0.2, 1., 9)
+
+# thrust specific fuel consumption [kg/(N s)] at the reference cruise condition
+default_tsfc = 1.6e-5
+reference_mach = 0.84
+reference_altitude_km = 10.
+
+_decks = {}
+
+
+def get_engine_deck(file_path=None, **kwargs):
+    """
+    Returns a shared EngineDeck, loading or synthesizing it only once per
+    process, so every component using it also shares its interpolants.
+    """
+    key = (file_path, tuple(sorted(kwargs.items())))
+    if key not in _decks:
+        _decks[key] = EngineDeck(file_path, **kwargs)
+    return _decks[key]
+
+
+class EngineDeck(object):
+    """
+    Tables of thrust [kN] and fuel flow [kg/s] over (altitude [km], Mach
+    number, throttle setting).
+
+    If file_path is given, the grids and tables are loaded from that .npz
+    file (as written by save). Otherwise a deck is synthesized with the
+    altitude lapse of thrustComp for the given bypass ratio and maximum
+    thrust, so at full throttle it reproduces thrustComp, and a TSFC that
+    grows with the Mach number, the square root of the temperature ratio and
+    at part power.
+
+    The interpolants are built once per deck and method by get_interp.
+    """
+
+    def __init__(self, file_path=None, BPR=5., max_thrust=490., tsfc=default_tsfc,
+            altitude_km=default_altitude_km, mach=default_mach, throttle=default_throttle):
+        self._interps = {}
+
+        if file_path is not None:
+            self.file_path = file_path
+            self._load()
+        else:
+            self.file_path = None
+            self.altitude_km = np.array(altitude_km, dtype=float)
+            self.mach = np.array(mach, dtype=float)
+            self.throttle = np.array(throttle, dtype=float)
+            self._synthesize(BPR, max_thrust, tsfc)
+
+    @property
+    def points(self):
+        return (self.altitude_km, self.mach, self.throttle)
+
+    def get_interp(self, name, method='3D-lagrange3', extrapolate=True):
+        """
+        Returns the interpolant of the 'thrust' or 'fuel_flow' table.
+        """
+        key = (name, method, extrapolate)
+        if key not in self._interps:
+            self._interps[key] = InterpND(method=method, points=self.points,
+                values=getattr(self, name), extrapolate=extrapolate)
+        return self._interps[key]
+
+    def _synthesize(self, BPR, max_thrust, tsfc):
+        h, mach, throttle = np.meshgrid(*self.points, indexing='ij')
+
+        lapse = ((0.0013 * BPR) - 0.0397) * h - (0.0248 * BPR) + 0.7125
+        self.thrust = max_thrust * lapse * throttle
+
+        temp_K = compute_atmosphere(1e3 * h, derivs=False)['temperature']
+        temp_ref = compute_atmosphere(np.array([1e3 * reference_altitude_km]),
+            derivs=False)['temperature'][0]
+        tsfc = tsfc * (1 + 0.5 * (mach - reference_mach)) * np.sqrt(temp_K / temp_ref) \
+            * (1 + 0.1 * (1 - throttle) ** 2)
+        self.fuel_flow = tsfc * 1e3 * self.thrust
+
+    def save(self, file_path):
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        np.savez(file_path, altitude_km=self.altitude_km, mach=self.mach,
+            throttle=self.throttle, thrust=self.thrust, fuel_flow=self.fuel_flow)
+
+    def _load(self):
+        data = np.load(self.file_path)
+        for name in ['altitude_km', 'mach', 'throttle', 'thrust', 'fuel_flow']:
+            setattr(self, name, data[name])
+
+        shape = tuple(grid.size for grid in self.points)
+        if self.thrust.shape != shape or self.fuel_flow.shape != shape:
+            raise ValueError('The tables in {} do not match the shape {} of its '
+                'grids'.format(self.file_path, shape))
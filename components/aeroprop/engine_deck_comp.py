@@ -0,0 +1,78 @@
+import numpy as np
+from openmdao.api import ExplicitComponent
+import openmdao.api as om
+
+from .engine_deck import EngineDeck, get_engine_deck
+
+#
+#    Looks up the thrust [kN] and fuel flow [kg/s] of an EngineDeck at any number of flight
+#    points in one vectorized call; with the default deck it can replace thrustComp
+#
+
+class EngineDeckComp(ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('deck', default=None, types=EngineDeck, allow_none=True)
+        self.options.declare('method', default='3D-lagrange3', types=str)
+        self.options.declare('extrapolate', default=True, types=bool)
+
+    def setup(self):
+        shape = self.options['shape']
+        deck = self.options['deck']
+        arange = np.arange(int(np.prod(shape)))
+
+        if deck is None:
+            deck = get_engine_deck()
+
+        self.interps = dict(
+            (name, deck.get_interp(name, self.options['method'], self.options['extrapolate']))
+            for name in ['thrust', 'fuel_flow']
+        )
+
+        self.add_input('altitude_km', val=12., shape=shape)
+        self.add_input('Mach_number', val=0.84, shape=shape)
+        self.add_input('throttle', val=1., shape=shape)
+        self.add_output('thrust', shape=shape)
+        self.add_output('fuel_flow', shape=shape)
+
+        # every point only depends on its own inputs
+        for out_name in ['thrust', 'fuel_flow']:
+            for in_name in ['altitude_km', 'Mach_number', 'throttle']:
+                self.declare_partials(out_name, in_name, rows=arange, cols=arange)
+
+    def compute(self, inputs, outputs):
+        shape = self.options['shape']
+        points = self._get_points(inputs)
+
+        for name, interp in self.interps.items():
+            outputs[name] = interp.interpolate(points, compute_derivative=False).reshape(shape)
+
+    def compute_partials(self, inputs, partials):
+        points = self._get_points(inputs)
+
+        for name, interp in self.interps.items():
+            _, derivs = interp.interpolate(points, compute_derivative=True)
+
+            partials[name, 'altitude_km'] = derivs[:, 0]
+            partials[name, 'Mach_number'] = derivs[:, 1]
+            partials[name, 'throttle'] = derivs[:, 2]
+
+    def _get_points(self, inputs):
+        return np.column_stack([
+            inputs['altitude_km'].flatten(),
+            inputs['Mach_number'].flatten(),
+            inputs['throttle'].flatten(),
+        ])
+
+
+# runs a test to see if calculated values make sense
+if __name__ == "__main__":
+    prob = om.Problem()
+    prob.model.add_subsystem('engine_deck_comp', EngineDeckComp(shape=(4,)), promotes=['*'])
+    prob.setup()
+    prob['altitude_km'] = np.linspace(0., 12., 4)
+    prob.run_model()
+
+    print('thrust', prob['thrust'])
+    print('fuel_flow', prob['fuel_flow'])
@@ -0,0 +1,88 @@
+import numpy as np
+from openmdao.api import ExplicitComponent
+import openmdao.api as om
+
+#
+#    Computes the dynamic pressure once per flight point and from it the lift and drag (and
+#    optionally the side force) of liftComp and dragComp, for any number of points at once
+#
+
+class ForcesComp(ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('with_side_force', default=False, types=bool)
+
+    def setup(self):
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
+
+        self.add_input('speed', val=1., shape=shape)
+        self.add_input('density', val=1., shape=shape)
+        self.add_input('S_w', val=1., shape=shape)
+        self.add_output('dynamic_pressure', shape=shape)
+
+        # every point only depends on its own inputs
+        self.declare_partials('dynamic_pressure', 'speed', rows=arange, cols=arange)
+        self.declare_partials('dynamic_pressure', 'density', rows=arange, cols=arange)
+
+        for coeff_name, force_name in self._get_forces():
+            self.add_input(coeff_name, val=1., shape=shape)
+            self.add_output(force_name, shape=shape)
+
+            for in_name in ['speed', 'density', 'S_w', coeff_name]:
+                self.declare_partials(force_name, in_name, rows=arange, cols=arange)
+
+    def compute(self, inputs, outputs):
+        q = 0.5 * inputs['density'] * inputs['speed'] ** 2
+        qS = q * inputs['S_w']
+
+        outputs['dynamic_pressure'] = q
+        for coeff_name, force_name in self._get_forces():
+            outputs[force_name] = inputs[coeff_name] * qS
+
+    def compute_partials(self, inputs, partials):
+        speed = inputs['speed'].flatten()
+        density = inputs['density'].flatten()
+        S_w = inputs['S_w'].flatten()
+
+        q = 0.5 * density * speed ** 2
+        dq_dspeed = density * speed
+        dq_ddensity = 0.5 * speed ** 2
+
+        partials['dynamic_pressure', 'speed'] = dq_dspeed
+        partials['dynamic_pressure', 'density'] = dq_ddensity
+
+        for coeff_name, force_name in self._get_forces():
+            coeff = inputs[coeff_name].flatten()
+
+            partials[force_name, 'speed'] = coeff * dq_dspeed * S_w
+            partials[force_name, 'density'] = coeff * dq_ddensity * S_w
+            partials[force_name, 'S_w'] = coeff * q
+            partials[force_name, coeff_name] = q * S_w
+
+    def _get_forces(self):
+        forces = [('CL', 'lift'), ('CD', 'drag')]
+        if self.options['with_side_force']:
+            forces.append(('CY', 'side_force'))
+        return forces
+
+
+# runs a test to see if calculated values make sense
+if __name__ == "__main__":
+    prob = om.Problem()
+    prob.model.add_subsystem('forces_comp', ForcesComp(shape=(3,), with_side_force=True),
+        promotes=['*'])
+    prob.setup()
+    prob['speed'] = np.linspace(100., 250., 3)
+    prob['density'] = 0.4
+    prob['S_w'] = 157.
+    prob['CL'] = 0.5
+    prob['CD'] = 0.03
+    prob['CY'] = 0.01
+    prob.run_model()
+
+    print('dynamic_pressure', prob['dynamic_pressure'])
+    print('lift', prob['lift'])
+    print('drag', prob['drag'])
+    print('side_force', prob['side_force'])
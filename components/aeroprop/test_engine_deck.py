@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from .engine_deck import EngineDeck, get_engine_deck
+from .engine_deck_comp import EngineDeckComp
+from .thrust_comp import thrustComp
+
+from openmdao.api import Problem
+from ..complex_step import setup_problem, check_partials
+
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+#  test for the tabulated engine deck
+
+def build_problem(size, deck=None):
+    prob = Problem()
+    prob.model.add_subsystem('engine_deck_comp', EngineDeckComp(shape=(size,), deck=deck),
+        promotes=['*'])
+    setup_problem(prob)
+
+    prob['altitude_km'] = np.linspace(0.5, 14.3, size)
+    prob['Mach_number'] = np.linspace(0.2, 0.88, size)
+    prob['throttle'] = np.linspace(0.35, 1., size)
+    prob.run_model()
+    return prob
+
+
+class TestEngineDeck(unittest.TestCase):
+
+    def test_derivatives(self):
+        prob = build_problem(5)
+
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-6, rtol=1.e-6)
+
+    def test_matches_thrust_comp(self):
+        # at full throttle, the default deck follows the altitude lapse of thrustComp
+        prob = build_problem(4)
+        prob['throttle'] = 1.
+        prob.run_model()
+
+        for ind, altitude_km in enumerate(prob['altitude_km']):
+            thrust_prob = Problem()
+            thrust_prob.model.add_subsystem('thrust_comp', thrustComp(), promotes=['*'])
+            thrust_prob.setup()
+            thrust_prob['altitude_km'] = altitude_km
+            thrust_prob.run_model()
+
+            assert_near_equal(prob['thrust'][ind], thrust_prob['thrust'][0], 1e-12)
+
+    def test_save_and_load(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            file_path = os.path.join(cache_dir, 'deck.npz')
+            EngineDeck(BPR=8., max_thrust=300.).save(file_path)
+
+            deck = get_engine_deck(file_path)
+            self.assertIs(get_engine_deck(file_path), deck)
+            self.assertIs(deck.get_interp('thrust'), deck.get_interp('thrust'))
+
+            prob = build_problem(3, deck=deck)
+            ref_prob = build_problem(3, deck=EngineDeck(BPR=8., max_thrust=300.))
+            for name in ['thrust', 'fuel_flow']:
+                assert_near_equal(prob[name], ref_prob[name], 1e-15)
+        finally:
+            shutil.rmtree(cache_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
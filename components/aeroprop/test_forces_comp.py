@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+
+from .forces_comp import ForcesComp
+from .lift_comp import liftComp
+from .drag_comp import dragComp
+
+from openmdao.api import Problem
+from ..complex_step import setup_problem, check_partials
+
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+#  test for forces_comp
+
+def build_problem(size, with_side_force=False):
+    prob = Problem()
+    prob.model.add_subsystem('forces_comp',
+        ForcesComp(shape=(size,), with_side_force=with_side_force), promotes=['*'])
+    setup_problem(prob)
+
+    prob['speed'] = np.linspace(80., 260., size)
+    prob['density'] = np.linspace(1.2, 0.3, size)
+    prob['S_w'] = 157.
+    prob['CL'] = np.linspace(0.2, 0.7, size)
+    prob['CD'] = np.linspace(0.02, 0.05, size)
+    if with_side_force:
+        prob['CY'] = np.linspace(-0.01, 0.01, size)
+    prob.run_model()
+    return prob
+
+
+class TestForcesComp(unittest.TestCase):
+
+    def test_derivatives(self):
+        prob = build_problem(4, with_side_force=True)
+
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-6, rtol=1.e-6)
+
+    def test_matches_lift_and_drag_comps(self):
+        prob = build_problem(3)
+
+        for comp_class, coeff_name, force_name in [
+                (liftComp, 'CL', 'lift'), (dragComp, 'CD', 'drag')]:
+            for ind in range(3):
+                ref_prob = Problem()
+                ref_prob.model.add_subsystem('comp', comp_class(), promotes=['*'])
+                ref_prob.setup()
+                for name in ['speed', 'density', 'S_w', coeff_name]:
+                    ref_prob[name] = prob[name][ind]
+                ref_prob.run_model()
+
+                assert_near_equal(prob[force_name][ind], ref_prob[force_name][0], 1e-14)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import unittest
 from .thrust_comp import thrustComp
 
 from openmdao.api import Problem
+from ..complex_step import setup_problem, check_partials
 
 from openmdao.utils.assert_utils import assert_check_partials
 
@@ -13,10 +14,10 @@ class testThrust(unittest.TestCase):
     def test_component_and_derivatives(self):
         prob = Problem()
         prob.model = thrustComp()
-        prob.setup()
+        setup_problem(prob)
         prob.run_model()
 
-        data = prob.check_partials(out_stream=None)
+        data = check_partials(prob, out_stream=None)
         assert_check_partials(data, atol=1.e-3, rtol=1.e-3)
 
 
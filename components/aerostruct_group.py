@@ -0,0 +1,98 @@
+import numpy as np
+
+import openmdao.api as om
+
+from openaerostruct.integration.aerostruct_groups import AerostructGeometry, AerostructPoint
+from openaerostruct.utils.constants import grav_constant
+from openmdao.api import Group
+
+#
+#    OpenAeroStruct aerostructural analysis of one lifting surface, as in run_opt2: the
+#    aerostructural geometry and one AerostructPoint, with a selectable solver for the coupled
+#    aero/structure group:
+#
+#        'aitken'  nonlinear block Gauss-Seidel with Aitken relaxation (the OpenAeroStruct
+#                  default, without its iteration printout)
+#        'nlbgs'   nonlinear block Gauss-Seidel without relaxation
+#        'newton'  Newton with a direct solve of the coupled Jacobian
+#
+#    Like every OpenMDAO solver, these start from the states of the previous evaluation, so
+#    consecutive driver iterations are warm-started
+#
+
+coupled_solvers = ['aitken', 'nlbgs', 'newton']
+
+
+class AerostructGroup(Group):
+
+    def initialize(self):
+        self.options.declare('surface', types=dict)
+        self.options.declare('coupled_solver', default='aitken', values=coupled_solvers)
+        self.options.declare('atol', default=1e-7, types=float)
+
+    def setup(self):
+        surface = self.options['surface']
+        name = surface['name']
+
+        indep_var_comp = om.IndepVarComp()
+        indep_var_comp.add_output('v', val=250, units='m/s')
+        indep_var_comp.add_output('alpha', val=2.5, units='deg')
+        indep_var_comp.add_output('load_factor', val=1.)
+        indep_var_comp.add_output('empty_cg', val=np.zeros((3)), units='m')
+        self.add_subsystem('prob_vars', indep_var_comp, promotes=['*'])
+
+        self.add_subsystem(name, AerostructGeometry(surface=surface))
+
+        point_name = 'AS_point_0'
+        self.add_subsystem(point_name, AerostructPoint(surfaces=[surface],
+            user_specified_Sref=True),
+            promotes_inputs=['v', 'alpha', 'Mach_number', 're', 'rho', 'CT', 'R',
+                'W0', 'speed_of_sound', 'empty_cg', 'load_factor', 'S_ref_total'])
+
+        # defaults of run_opt2 for the inputs left unconnected
+        self.set_input_defaults('Mach_number', val=0.84)
+        self.set_input_defaults('re', val=1.e6, units='1/m')
+        self.set_input_defaults('rho', val=0.38, units='kg/m**3')
+        self.set_input_defaults('CT', val=grav_constant * 17.e-6, units='1/s')
+        self.set_input_defaults('R', val=1.3e6, units='m')
+        self.set_input_defaults('W0', val=54412.4, units='kg')
+        self.set_input_defaults('speed_of_sound', val=295.4, units='m/s')
+        self.set_input_defaults('S_ref_total', val=430, units='m**2')
+
+        com_name = point_name + '.' + name + '_perf'
+        self.connect(name + '.local_stiff_transformed',
+            point_name + '.coupled.' + name + '.local_stiff_transformed')
+        self.connect(name + '.nodes', point_name + '.coupled.' + name + '.nodes')
+
+        # Connect aerodyamic mesh to coupled group mesh
+        self.connect(name + '.mesh', point_name + '.coupled.' + name + '.mesh')
+
+        # Connect performance calculation variables
+        self.connect(name + '.radius', com_name + '.radius')
+        self.connect(name + '.thickness', com_name + '.thickness')
+        self.connect(name + '.nodes', com_name + '.nodes')
+        self.connect(name + '.cg_location',
+            point_name + '.total_perf.' + name + '_cg_location')
+        self.connect(name + '.structural_mass',
+            point_name + '.total_perf.' + name + '_structural_mass')
+        self.connect(name + '.t_over_c', com_name + '.t_over_c')
+
+    def configure(self):
+        # AerostructPoint sets its solvers in its setup, so they are replaced here. Newton takes its
+        # steps with the linear solver of the group, so that is set to the direct solve explicitly;
+        # the Gauss-Seidel solvers keep the linear solver of AerostructPoint
+        coupled = self.AS_point_0.coupled
+        coupled_solver = self.options['coupled_solver']
+
+        if coupled_solver == 'newton':
+            coupled.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
+            coupled.nonlinear_solver.options['maxiter'] = 20
+            coupled.linear_solver = om.DirectSolver(assemble_jac=True)
+        else:
+            coupled.nonlinear_solver = om.NonlinearBlockGS(
+                use_aitken=coupled_solver == 'aitken')
+            coupled.nonlinear_solver.options['maxiter'] = 100
+        coupled.nonlinear_solver.options['atol'] = self.options['atol']
+        coupled.nonlinear_solver.options['rtol'] = 1e-30
+        coupled.nonlinear_solver.options['iprint'] = 0
+        coupled.nonlinear_solver.options['err_on_non_converge'] = True
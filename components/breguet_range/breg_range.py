@@ -76,20 +76,24 @@ class BregRange(ExplicitComponent):
         CL = inputs['CL']
         CD = inputs['CD']
 
-        dfb_dCL = -(emptyTotal) * np.exp(rnge * CT / a / M * CD / CL) \
+        # mass at the end of cruise [kg], from the empty weight [lb] plus the payload
+        W_end = emptyTotal*4.45/9.81 + 42760
+        ratio = np.exp(rnge * CT / a / M * CD / CL)
+
+        dfb_dCL = -W_end * ratio \
             * rnge * CT / a / M * CD / CL ** 2
-        dfb_dCD = (emptyTotal) * np.exp(rnge * CT / a / M * CD / CL) \
+        dfb_dCD = W_end * ratio \
             * rnge * CT / a / M / CL
-        dfb_dCT = (emptyTotal) * np.exp(rnge * CT / a / M * CD / CL) \
+        dfb_dCT = W_end * ratio \
             * rnge / a / M / CL * CD
-        dfb_drnge = (emptyTotal) * np.exp(rnge * CT / a / M * CD / CL) \
+        dfb_drnge = W_end * ratio \
             / a / M / CL * CD * CT
-        dfb_da = -(emptyTotal) * np.exp(rnge * CT / a / M * CD / CL) \
+        dfb_da = -W_end * ratio \
             * rnge * CT / a**2 / M * CD / CL
-        dfb_dM = -(emptyTotal) * np.exp(rnge * CT / a / M * CD / CL) \
+        dfb_dM = -W_end * ratio \
             * rnge * CT / a / M**2 * CD / CL
 
-        dfb_dW = np.exp(rnge * CT / a / M * CD / CL) - 1
+        dfb_dW = (ratio - 1) * 4.45/9.81
 
         partials['fuelburn', 'CL'] = dfb_dCL
         partials['fuelburn', 'CD'] = dfb_dCD
@@ -40,9 +40,9 @@ class BregRangeCo(ExplicitComponent):
         W0 = inputs['W0']
 
         partials['W_f', 'v'] = (rnge*W0*np.exp(-1*rnge/(LD*v*isp)))/(LD*(v**2)*isp)
-        partials['W_f', 'LD'] = (rnge * W0 * np.exp(-1*rnge/(v*LD*isp))) / v * (LD**2) * isp
+        partials['W_f', 'LD'] = (rnge * W0 * np.exp(-1*rnge/(v*LD*isp))) / (v * (LD**2) * isp)
         partials['W_f', 'rnge'] = (-1 * W0 * np.exp(-1*rnge/(LD*v*isp))) / (LD * v * isp)
-        partials['W_f', 'isp'] = (rnge * W0 * np.exp(-1*rnge/(LD*v*isp))) / LD * v * (isp**2)
+        partials['W_f', 'isp'] = (rnge * W0 * np.exp(-1*rnge/(LD*v*isp))) / (LD * v * (isp**2))
         partials['W_f', 'W0'] = 1 / ( np.exp(rnge/(v * LD * isp)))
 
 
@@ -0,0 +1,181 @@
+from __future__ import division, print_function
+import numpy as np
+from openmdao.api import ExplicitComponent
+import openmdao.api as om
+
+
+# a climb, three step cruises, the descent and a reserve (a 45 min loiter at 150 m/s)
+example_segments = dict(
+    CL=np.array([0.5, 0.5, 0.52, 0.54, 0.4, 0.6]),
+    CD=np.array([0.035, 0.025, 0.026, 0.027, 0.03, 0.035]),
+    CT=np.array([1.8e-4, 1.6e-4, 1.6e-4, 1.6e-4, 1.2e-4, 1.7e-4]),
+    speed=np.array([200., 250., 250., 250., 200., 150.]),
+    altitude=np.array([10000., 10000., 11000., 12000., 450., 450.]),
+    segment_range=np.array([150e3, 2000e3, 2000e3, 1500e3, 200e3, 150. * 2700.]),
+)
+
+
+class MissionComp(ExplicitComponent):
+    """
+    Computes the fuel burn of a mission made of num_segments consecutive
+    segments, e.g. climb, step cruises, descent and reserve, each flown at
+    its own CL, CD, specific fuel consumption CT and speed.
+
+    Each segment ends at its altitude input, starting from the end altitude
+    of the previous segment (or from initial_altitude). With the thrust
+    balancing the drag and the climb, T = D + W dh/dx, and L = W, the
+    weight follows
+
+        ln(W_start / W_end) = CT / speed * (CD / CL * segment_range + dh)
+
+    so a segment of constant altitude is the Breguet range equation of
+    BregRange. Starting from the weight at the end of the mission
+    (landing_weight), the segments are integrated backwards all at once.
+
+    Parameters
+    ----------
+    CL, CD, CT, speed, altitude, segment_range : ndarray
+        The lift and drag coefficients, specific fuel consumption [1/s],
+        speed [m/s], end altitude [m] and ground distance [m] of every
+        segment.
+    initial_altitude : float
+        Altitude at the start of the first segment [m].
+    landing_weight : float
+        Mass at the end of the last segment [kg], i.e. the zero-fuel mass
+        plus any unused fuel.
+
+    Returns
+    -------
+    weight : ndarray
+        Mass at the start of every segment [kg].
+    segment_fuel : ndarray
+        Fuel burned in every segment [kg].
+    fuelburn : float
+        Fuel burned over the whole mission [kg].
+    """
+
+    def initialize(self):
+        self.options.declare('num_segments', default=1, types=int)
+
+    def setup(self):
+        num = self.options['num_segments']
+
+        self.add_input('CL', val=0.7, shape=num)
+        self.add_input('CD', val=0.02, shape=num)
+        self.add_input('CT', val=0.25, shape=num, units='1/s')
+        self.add_input('speed', val=250., shape=num, units='m/s')
+        self.add_input('altitude', val=0., shape=num, units='m')
+        self.add_input('segment_range', val=3000., shape=num, units='m')
+        self.add_input('initial_altitude', val=0., units='m')
+        self.add_input('landing_weight', val=120000., units='kg')
+
+        self.add_output('weight', val=1., shape=num, units='kg')
+        self.add_output('segment_fuel', val=1., shape=num, units='kg')
+        self.add_output('fuelburn', val=1., units='kg')
+
+        # a segment only changes the weight of the segments before it
+        rows, cols = np.triu_indices(num)
+        alt_rows, alt_cols = np.triu_indices(num, k=-1)
+        self._indices = dict(rows=rows, cols=cols, alt_rows=alt_rows, alt_cols=alt_cols)
+
+        for out_name in ['weight', 'segment_fuel']:
+            for in_name in ['CL', 'CD', 'CT', 'speed', 'segment_range']:
+                self.declare_partials(out_name, in_name, rows=rows, cols=cols)
+            self.declare_partials(out_name, 'altitude', rows=alt_rows, cols=alt_cols)
+            self.declare_partials(out_name, 'initial_altitude', rows=[0], cols=[0])
+            self.declare_partials(out_name, 'landing_weight')
+
+        self.declare_partials('fuelburn', '*')
+
+    def compute(self, inputs, outputs):
+        weight, segment_fuel = self._integrate(inputs)[:2]
+
+        outputs['weight'] = weight
+        outputs['segment_fuel'] = segment_fuel
+        outputs['fuelburn'] = weight[0] - inputs['landing_weight']
+
+    def compute_partials(self, inputs, partials):
+        weight, segment_fuel, dlog_ratio = self._integrate(inputs, derivs=True)
+        rows, cols, alt_rows, alt_cols = [self._indices[name]
+            for name in ['rows', 'cols', 'alt_rows', 'alt_cols']]
+
+        # the weight at the start of segment i scales with the weight ratio of every segment
+        # j >= i, so its sensitivity to their log is the weight itself; the fuel of segment i
+        # is the weight of segment i minus that of segment i + 1
+        dweight = weight[rows]
+        dfuel = np.where(cols == rows, weight[rows], segment_fuel[rows])
+
+        for in_name in ['CL', 'CD', 'CT', 'speed', 'segment_range']:
+            partials['weight', in_name] = dweight * dlog_ratio[in_name][cols]
+            partials['segment_fuel', in_name] = dfuel * dlog_ratio[in_name][cols]
+
+        # the end altitude of segment k is also the start altitude of segment k + 1
+        dh = dlog_ratio['dh'][alt_cols]
+        dh_next = np.append(dlog_ratio['dh'][1:], 0.)[alt_cols]
+        before = alt_cols >= alt_rows
+
+        partials['weight', 'altitude'] = weight[alt_rows] * (dh * before - dh_next)
+        dfuel = np.where(alt_cols == alt_rows, weight[alt_rows], segment_fuel[alt_rows])
+        dfuel_next = np.where(alt_cols + 1 == alt_rows, weight[alt_rows], segment_fuel[alt_rows])
+        partials['segment_fuel', 'altitude'] = dfuel * dh * before - dfuel_next * dh_next
+
+        partials['weight', 'initial_altitude'] = -weight[0] * dlog_ratio['dh'][0]
+        partials['segment_fuel', 'initial_altitude'] = -weight[0] * dlog_ratio['dh'][0]
+
+        landing_weight = inputs['landing_weight']
+        partials['weight', 'landing_weight'] = weight / landing_weight
+        partials['segment_fuel', 'landing_weight'] = segment_fuel / landing_weight
+
+        for in_name in ['CL', 'CD', 'CT', 'speed', 'segment_range']:
+            partials['fuelburn', in_name] = weight[0] * dlog_ratio[in_name]
+        partials['fuelburn', 'altitude'] = weight[0] * (dlog_ratio['dh'] - np.append(
+            dlog_ratio['dh'][1:], 0.))
+        partials['fuelburn', 'initial_altitude'] = -weight[0] * dlog_ratio['dh'][0]
+        partials['fuelburn', 'landing_weight'] = weight[0] / landing_weight - 1.
+
+    def _integrate(self, inputs, derivs=False):
+        CL = inputs['CL']
+        CD = inputs['CD']
+        CT = inputs['CT']
+        speed = inputs['speed']
+        segment_range = inputs['segment_range']
+        altitude = inputs['altitude']
+
+        dh = np.diff(np.concatenate([inputs['initial_altitude'], altitude]))
+        distance = CD / CL * segment_range + dh
+        log_ratio = CT / speed * distance
+
+        # log of the weight at the start of each segment over the landing weight
+        log_weight = np.cumsum(log_ratio[::-1])[::-1]
+        weight = inputs['landing_weight'] * np.exp(log_weight)
+        segment_fuel = weight - np.append(weight[1:], inputs['landing_weight'])
+
+        if not derivs:
+            return weight, segment_fuel, None
+
+        dlog_ratio = dict(
+            CL=-CT / speed * CD / CL ** 2 * segment_range,
+            CD=CT / speed / CL * segment_range,
+            CT=distance / speed,
+            speed=-log_ratio / speed,
+            segment_range=CT / speed * CD / CL,
+            dh=CT / speed,
+        )
+        return weight, segment_fuel, dlog_ratio
+
+
+# runs a test to see if calculated values make sense
+if __name__ == "__main__":
+    num = example_segments['CL'].size
+
+    prob = om.Problem()
+    prob.model.add_subsystem('mission_comp', MissionComp(num_segments=num), promotes=['*'])
+    prob.setup()
+    for name, value in example_segments.items():
+        prob[name] = value
+    prob['landing_weight'] = 100000.
+    prob.run_model()
+
+    print('weight', prob['weight'])
+    print('segment_fuel', prob['segment_fuel'])
+    print('fuelburn', prob['fuelburn'])
@@ -0,0 +1,31 @@
+import unittest
+
+from .breg_range import BregRange
+
+from openmdao.api import Problem
+from ..complex_step import setup_problem, check_partials
+
+from openmdao.utils.assert_utils import assert_check_partials
+
+
+class TestBregRange(unittest.TestCase):
+
+    def test_component_and_derivatives(self):
+        prob = Problem()
+        prob.model.add_subsystem('breguet_range_comp', BregRange(shape=(1,)), promotes=['*'])
+        setup_problem(prob)
+        prob['CT'] = 1. / 10193
+        prob['CL'] = 0.5
+        prob['CD'] = 0.03
+        prob['sonic_speed'] = 295.
+        prob['rnge'] = 1.3e6
+        prob['Mach_number'] = 0.84
+        prob['emptyTotal'] = 300000.
+        prob.run_model()
+
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-6, rtol=1.e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import unittest
 from .breguet_range_comp import BregRangeCo
 
 from openmdao.api import Problem
+from ..complex_step import setup_problem, check_partials
 
 from openmdao.utils.assert_utils import assert_check_partials
 
@@ -12,12 +13,26 @@ class TestBregRangeCo(unittest.TestCase):
     def test_component_and_derivatives(self):
         prob = Problem()
         prob.model = BregRangeCo()
-        prob.setup()
+        setup_problem(prob)
         prob.run_model()
 
-        data = prob.check_partials(out_stream=None)
+        data = check_partials(prob, out_stream=None)
         assert_check_partials(data, atol=1.e-3, rtol=1.e-3)
 
+    def test_cruise_derivatives(self):
+        prob = Problem()
+        prob.model.add_subsystem('breguet_range_comp', BregRangeCo(), promotes=['*'])
+        setup_problem(prob)
+        prob['v'] = 250.
+        prob['LD'] = 18.
+        prob['rnge'] = 6.e6
+        prob['isp'] = 5000.
+        prob['W0'] = 250000.
+        prob.run_model()
+
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-6, rtol=1.e-6)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+
+from .mission_comp import MissionComp, example_segments
+from .breg_range import BregRange
+
+from openmdao.api import Problem
+from ..complex_step import setup_problem, check_partials
+
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+#  test for the multi-segment mission fuel integrator
+
+def build_problem(segments, landing_weight=100000.):
+    prob = Problem()
+    prob.model.add_subsystem('mission_comp',
+        MissionComp(num_segments=segments['CL'].size), promotes=['*'])
+    setup_problem(prob)
+
+    for name, value in segments.items():
+        prob[name] = value
+    prob['landing_weight'] = landing_weight
+    prob.run_model()
+    return prob
+
+
+class TestMissionComp(unittest.TestCase):
+
+    def test_derivatives(self):
+        prob = build_problem(example_segments)
+        prob['initial_altitude'] = 200.
+        prob.run_model()
+
+        # fuel in kg, so the absolute errors of O(1e5) partials are scaled away
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-3, rtol=1.e-6)
+
+    def test_segments(self):
+        prob = build_problem(example_segments)
+
+        assert_near_equal(prob['segment_fuel'].sum(), prob['fuelburn'][0], 1e-12)
+
+        # integrating the segments one by one, forwards from the takeoff weight
+        weight = prob['weight'][0]
+        altitude = 0.
+        for ind in range(example_segments['CL'].size):
+            segment = dict((name, value[ind]) for name, value in example_segments.items())
+            dh = segment['altitude'] - altitude
+            altitude = segment['altitude']
+
+            end_weight = weight / np.exp(segment['CT'] / segment['speed']
+                * (segment['CD'] / segment['CL'] * segment['segment_range'] + dh))
+            assert_near_equal(prob['segment_fuel'][ind], weight - end_weight, 1e-10)
+            weight = end_weight
+
+        assert_near_equal(weight, 100000., 1e-10)
+
+    def test_matches_breguet(self):
+        # one segment at constant altitude is the Breguet range equation
+        segments = dict((name, value[1:2]) for name, value in example_segments.items())
+        prob = build_problem(segments)
+        prob['initial_altitude'] = segments['altitude']
+        prob.run_model()
+
+        breg_prob = Problem()
+        breg_prob.model.add_subsystem('breguet_range_comp', BregRange(shape=(1,)),
+            promotes=['*'])
+        breg_prob.setup()
+        for name in ['CL', 'CD', 'CT']:
+            breg_prob[name] = segments[name]
+        breg_prob['sonic_speed'] = segments['speed'] / 0.85
+        breg_prob['Mach_number'] = 0.85
+        breg_prob['rnge'] = segments['segment_range']
+        breg_prob['emptyTotal'] = (100000. - 42760) * 9.81 / 4.45
+        breg_prob.run_model()
+
+        assert_near_equal(prob['fuelburn'], breg_prob['fuelburn'], 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
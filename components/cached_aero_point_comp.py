@@ -0,0 +1,205 @@
+from __future__ import division, print_function
+from collections import OrderedDict
+import hashlib
+
+import numpy as np
+
+from openmdao.api import ExplicitComponent, Group, IndepVarComp, Problem
+
+from openaerostruct.aerodynamics.aero_groups import AeroPoint as AeroPointGroup
+
+#
+#    An OpenAeroStruct aero point behind an in-memory LRU cache. The VLM runs in a problem of its
+#    own; its outputs and their derivatives are stored under a hash of every input (deformed
+#    mesh, t_over_c, v, alpha, Mach_number, re, rho and cg), so re-evaluating a design whose wing
+#    and flight condition did not change, e.g. when an optimizer only moved a weight variable,
+#    skips the VLM solve
+#
+#    The sub-problem is real and OpenAeroStruct is not complex-step safe, so complex-stepping
+#    through this component raises an error instead of silently dropping the imaginary part;
+#    approximate its totals with finite differences
+#
+
+# (name, units) of the flow inputs, promoted as in AeroPoint
+flow_inputs = [
+    ('v', 'm/s'),
+    ('alpha', 'deg'),
+    ('Mach_number', None),
+    ('re', '1/m'),
+    ('rho', 'kg/m**3'),
+]
+
+
+def get_cached_outputs(name):
+    """
+    Returns the promoted names, within the aero point, of the outputs that
+    are cached for a surface of the given name.
+    """
+    return ['CL', 'CD', 'CM', name + '_perf.CL', name + '_perf.CD', name + '_perf.L',
+        name + '_perf.D', name + '.S_ref']
+
+
+class CachedAeroPointComp(ExplicitComponent):
+    """
+    Computes the outputs of get_cached_outputs of an AeroPoint of one
+    surface, named with '_' for '.', from the deformed mesh, t_over_c and
+    the flow inputs. At most cache_size evaluations are kept, the least
+    recently used is evicted first, and cache_info reports the hits and
+    misses of the values and of the partials.
+    """
+
+    def initialize(self):
+        self.options.declare('surface', types=dict)
+        self.options.declare('cache_size', default=100, types=int)
+
+    def setup(self):
+        surface = self.options['surface']
+        mesh = surface['mesh']
+
+        self.add_input('def_mesh', val=mesh, units='m')
+        self.add_input('t_over_c', shape=mesh.shape[1] - 1)
+        for name, units in flow_inputs:
+            self.add_input(name, val=1., units=units)
+        self.add_input('cg', val=np.zeros(3), units='m')
+
+        self.cached_outputs = get_cached_outputs(surface['name'])
+        for name in self.cached_outputs:
+            shape = (3,) if name == 'CM' else (1,)
+            self.add_output(name.replace('.', '_'), shape=shape)
+
+        self.declare_partials('*', '*')
+        self.set_check_partial_options(wrt='*', method='fd', form='central', step=1e-6,
+            step_calc='rel')
+
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.partials_hits = 0
+        self.partials_misses = 0
+
+        self._prob = None
+        self._prob_key = None
+
+    def compute(self, inputs, outputs):
+        if self.under_complex_step:
+            raise ValueError('The cached aero point cannot be complex-stepped; use finite '
+                'differences instead')
+
+        entry = self._get_entry(inputs)
+
+        if entry['outputs'] is None:
+            self.misses += 1
+            self._run(inputs, entry['key'])
+            entry['outputs'] = dict(
+                (name, self._prob['aero_point.' + name].copy()) for name in self.cached_outputs)
+        else:
+            self.hits += 1
+
+        for name in self.cached_outputs:
+            outputs[name.replace('.', '_')] = entry['outputs'][name]
+
+    def compute_partials(self, inputs, partials):
+        entry = self._get_entry(inputs)
+
+        if entry['partials'] is None:
+            self.partials_misses += 1
+            self._run(inputs, entry['key'])
+            entry['partials'] = self._prob.compute_totals(
+                of=['aero_point.' + name for name in self.cached_outputs],
+                wrt=self._get_input_names())
+        else:
+            self.partials_hits += 1
+
+        for out_name in self.cached_outputs:
+            for in_name in self._get_input_names():
+                partials[out_name.replace('.', '_'), in_name] = \
+                    entry['partials']['aero_point.' + out_name, in_name]
+
+    def cache_info(self):
+        """
+        Returns a dict with the hit and miss counts of the values and the
+        partials, their hit rate, and the current and maximum cache size.
+        """
+        info = dict(hits=self.hits, misses=self.misses, partials_hits=self.partials_hits,
+            partials_misses=self.partials_misses, size=len(self.cache),
+            max_size=self.options['cache_size'])
+        for prefix in ['', 'partials_']:
+            total = info[prefix + 'hits'] + info[prefix + 'misses']
+            info[prefix + 'hit_rate'] = info[prefix + 'hits'] / total if total else 0.
+        return info
+
+    def _get_input_names(self):
+        return ['def_mesh', 't_over_c'] + [name for name, _ in flow_inputs] + ['cg']
+
+    def _get_entry(self, inputs):
+        key = hashlib.sha1(np.ascontiguousarray(inputs.asarray()).tobytes()).hexdigest()
+
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        else:
+            self.cache[key] = dict(key=key, outputs=None, partials=None)
+            while len(self.cache) > self.options['cache_size']:
+                self.cache.popitem(last=False)
+        return self.cache[key]
+
+    def _run(self, inputs, key):
+        if self._prob is None:
+            self._prob = self._build_problem()
+
+        # the problem still holds the solution of the last miss
+        if self._prob_key != key:
+            for name in self._get_input_names():
+                self._prob[name] = inputs[name]
+            self._prob.run_model()
+            self._prob_key = key
+
+    def _build_problem(self):
+        surface = self.options['surface']
+        mesh = surface['mesh']
+        name = surface['name']
+
+        comp = IndepVarComp()
+        comp.add_output('def_mesh', val=mesh, units='m')
+        comp.add_output('t_over_c', shape=mesh.shape[1] - 1)
+        for flow_name, units in flow_inputs:
+            comp.add_output(flow_name, val=1., units=units)
+        comp.add_output('cg', val=np.zeros(3), units='m')
+
+        prob = Problem()
+        prob.model.add_subsystem('inputs_comp', comp, promotes=['*'])
+        prob.model.add_subsystem('aero_point', AeroPointGroup(surfaces=[surface]),
+            promotes_inputs=[flow_name for flow_name, _ in flow_inputs] + ['cg'])
+
+        prob.model.connect('def_mesh', 'aero_point.' + name + '.def_mesh')
+        prob.model.connect('def_mesh', 'aero_point.aero_states.' + name + '_def_mesh')
+        prob.model.connect('t_over_c', 'aero_point.' + name + '_perf.t_over_c')
+
+        prob.setup(mode='rev')
+        return prob
+
+
+class CachedAeroPointGroup(Group):
+    """
+    A CachedAeroPointComp with its variables promoted under the names of
+    the AeroPoint it replaces, e.g. wing.def_mesh, wing_perf.t_over_c, CL
+    and wing_perf.L.
+    """
+
+    def initialize(self):
+        self.options.declare('surface', types=dict)
+        self.options.declare('cache_size', default=100, types=int)
+
+    def setup(self):
+        surface = self.options['surface']
+        name = surface['name']
+
+        comp = CachedAeroPointComp(surface=surface, cache_size=self.options['cache_size'])
+        self.add_subsystem('cached_point', comp,
+            promotes_inputs=[
+                ('def_mesh', name + '.def_mesh'),
+                ('t_over_c', name + '_perf.t_over_c'),
+                'cg',
+            ] + [flow_name for flow_name, _ in flow_inputs],
+            promotes_outputs=[
+                (out_name.replace('.', '_'), out_name) for out_name in get_cached_outputs(name)
+            ])
@@ -0,0 +1,40 @@
+import os
+
+#
+#    Switch for the method of the derivative checks of the tests: setup_problem, check_partials
+#    and check_totals use complex step by default, which needs a single evaluation per input and
+#    is exact to machine precision. Set the environment variable MAE155B_APPROX_METHOD=fd to fall
+#    back to finite differences.
+#
+#    Complex step is only valid for the complex-step safe components (branches and masks only
+#    look at the real part): those in atmosphere/, weight_component/, components/aeroprop,
+#    components/breguet_range, components/zero_lift_drag, DragPolarComp and AeroSurrogateComp.
+#    OpenAeroStruct is not complex-step safe, so the totals of OASGroup, CachedAeroPointComp,
+#    WarmStartAeroPoint, AerostructGroup and of the PerformanceGroup that contains them are
+#    checked with finite differences
+#
+
+approx_method = os.environ.get('MAE155B_APPROX_METHOD', 'cs')
+
+if approx_method not in ['cs', 'fd']:
+    raise ValueError("MAE155B_APPROX_METHOD must be 'cs' or 'fd', not '{}'".format(approx_method))
+
+
+def use_complex_step():
+    return approx_method == 'cs'
+
+
+def setup_problem(prob, **kwargs):
+    # complex vectors are needed to complex-step checks and totals
+    kwargs.setdefault('force_alloc_complex', use_complex_step())
+    prob.setup(**kwargs)
+
+
+def check_partials(prob, **kwargs):
+    kwargs.setdefault('method', approx_method)
+    return prob.check_partials(**kwargs)
+
+
+def check_totals(prob, **kwargs):
+    kwargs.setdefault('method', approx_method)
+    return prob.check_totals(**kwargs)
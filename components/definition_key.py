@@ -0,0 +1,36 @@
+from __future__ import division, print_function
+import hashlib
+
+import numpy as np
+
+#
+#    Hash of the definition of a cached object (a surface dict with its mesh and other arrays, the
+#    grids or sample settings, a model config), used to name on-disk caches and to look up shared
+#    instances. Every cache passes the version of its own format, so bumping it only invalidates
+#    that cache
+#
+
+
+def get_definition_key(version, *args):
+    """
+    Returns a hash of the version of a cache format and the arguments, which
+    may be nested dicts, lists, tuples, arrays and other values with a repr.
+    """
+    sha = hashlib.sha1(repr(version).encode('utf-8'))
+
+    def update(value):
+        if isinstance(value, dict):
+            for name in sorted(value):
+                sha.update(repr(name).encode('utf-8'))
+                update(value[name])
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                update(item)
+        elif isinstance(value, np.ndarray):
+            sha.update(repr(value.shape).encode('utf-8'))
+            sha.update(np.ascontiguousarray(value, dtype=float).tobytes())
+        else:
+            sha.update(repr(value).encode('utf-8'))
+
+    update(list(args))
+    return sha.hexdigest()[:16]
@@ -0,0 +1,56 @@
+import numpy as np
+from openmdao.api import ExplicitComponent
+from openmdao.components.interp_util.interp import InterpND
+
+from .drag_polar_table import DragPolarTable
+
+#
+#    Looks up the drag coefficient CD(CL, Mach, altitude) in a DragPolarTable, so range and
+#    envelope sweeps interpolate instead of running the VLM and zero-lift models
+#
+
+class DragPolarComp(ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('table', types=DragPolarTable)
+        self.options.declare('method', default='3D-lagrange3', types=str)
+        self.options.declare('extrapolate', default=True, types=bool)
+
+    def setup(self):
+        shape = self.options['shape']
+        table = self.options['table']
+        arange = np.arange(int(np.prod(shape)))
+
+        self.interp = InterpND(method=self.options['method'], points=table.points,
+            values=table.values, extrapolate=self.options['extrapolate'])
+
+        self.add_input('CL', val=0.5, shape=shape)
+        self.add_input('Mach_number', val=0.84, shape=shape)
+        self.add_input('altitude', val=10000., shape=shape)
+        self.add_output('CD', shape=shape)
+
+        # every point only depends on its own inputs
+        self.declare_partials('CD', 'CL', rows=arange, cols=arange)
+        self.declare_partials('CD', 'Mach_number', rows=arange, cols=arange)
+        self.declare_partials('CD', 'altitude', rows=arange, cols=arange)
+
+    def compute(self, inputs, outputs):
+        shape = self.options['shape']
+
+        CD = self.interp.interpolate(self._get_points(inputs), compute_derivative=False)
+        outputs['CD'] = CD.reshape(shape)
+
+    def compute_partials(self, inputs, partials):
+        _, dCD = self.interp.interpolate(self._get_points(inputs), compute_derivative=True)
+
+        partials['CD', 'CL'] = dCD[:, 0]
+        partials['CD', 'Mach_number'] = dCD[:, 1]
+        partials['CD', 'altitude'] = dCD[:, 2]
+
+    def _get_points(self, inputs):
+        return np.column_stack([
+            inputs['CL'].flatten(),
+            inputs['Mach_number'].flatten(),
+            inputs['altitude'].flatten(),
+        ])
@@ -0,0 +1,159 @@
+from __future__ import division, print_function
+import os
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+from openmdao.api import Problem
+
+from atmosphere.utils import compute_atmosphere
+from components.definition_key import get_definition_key
+
+
+# Version of the on-disk table format; bump it to invalidate old caches
+table_version = 2
+
+default_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_cache')
+
+default_CL = np.linspace(0.1, 0.8, 8)
+default_mach = np.linspace(0.6, 0.88, 8)
+default_altitude = np.linspace(8000., 13000., 6)
+
+# angles of attack [deg] sampled at every (Mach, altitude) to trace the polar
+default_alpha = np.linspace(-4., 12., 9)
+
+_tables = {}
+
+
+def get_drag_polar_table(surface, **kwargs):
+    """
+    Returns a shared DragPolarTable, building or loading it only once per process.
+    """
+    key = get_definition_key(table_version, surface, sorted(kwargs.items()))
+    if key not in _tables:
+        _tables[key] = DragPolarTable(surface, **kwargs)
+    return _tables[key]
+
+
+class DragPolarTable(object):
+    """
+    Table of the drag coefficient CD(CL, Mach, altitude) of a lifting surface.
+
+    At every (Mach, altitude) of the grid, OASGroup is run over an alpha
+    sweep at the flight speed and Reynolds number of the standard atmosphere,
+    and its CD is interpolated onto the CL grid with a cubic spline in CL.
+    The OAS CD already includes the CD0 and, with with_viscous, the skin
+    friction and form drag of the wing, so if with_zero_lift is True only
+    the fuselage zero-lift drag of ZeroLiftComp at the same flight condition
+    (with the inputs in zero_lift_inputs overriding its defaults) is added,
+    rescaled from its reference area S_f to the S_ref of the OAS run.
+
+    The table is cached on disk as an .npz file keyed by a hash of the
+    surface dict (mesh included), the grids and the zero-lift settings, so
+    the OpenAeroStruct runs only happen the first time.
+    """
+
+    def __init__(self, surface, CL=default_CL, mach=default_mach, altitude=default_altitude,
+            alpha=default_alpha, with_zero_lift=True, zero_lift_inputs=None, cache_dir=None):
+        self.surface = surface
+        self.CL = np.array(CL, dtype=float)
+        self.mach = np.array(mach, dtype=float)
+        self.altitude = np.array(altitude, dtype=float)
+        self.alpha = np.array(alpha, dtype=float)
+        self.with_zero_lift = with_zero_lift
+        self.zero_lift_inputs = dict(zero_lift_inputs or {})
+
+        if cache_dir is None:
+            cache_dir = default_cache_dir
+        self.key = get_definition_key(table_version, surface, self.CL, self.mach, self.altitude,
+            self.alpha, with_zero_lift, self.zero_lift_inputs)
+        self.file_path = os.path.join(cache_dir, 'drag_polar_{}.npz'.format(self.key))
+
+        if os.path.isfile(self.file_path):
+            self._load()
+        else:
+            self._build()
+            self._save()
+
+    @property
+    def points(self):
+        return (self.CL, self.mach, self.altitude)
+
+    def _build(self):
+        from components.oas_group import OASGroup
+
+        prob = Problem()
+        prob.model.add_subsystem('oas_group', OASGroup(surface=self.surface), promotes=['*'])
+        prob.setup()
+
+        # flight conditions of every (Mach, altitude) pair
+        mach, altitude = np.meshgrid(self.mach, self.altitude, indexing='ij')
+        atm = compute_atmosphere(altitude, derivs=False)
+        speed = mach * atm['sonic_speed']
+
+        self.values = np.zeros((self.CL.size, self.mach.size, self.altitude.size))
+        self.num_solves = 0
+        S_ref = None
+
+        for ind_mach in range(self.mach.size):
+            for ind_h in range(self.altitude.size):
+                density = atm['density'][ind_mach, ind_h]
+
+                prob['v'] = speed[ind_mach, ind_h]
+                prob['Mach_number'] = mach[ind_mach, ind_h]
+                prob['rho'] = density
+                prob['re'] = density * speed[ind_mach, ind_h] \
+                    / atm['dynamic_viscosity'][ind_mach, ind_h]
+
+                CL_sweep = np.zeros(self.alpha.size)
+                CD_sweep = np.zeros(self.alpha.size)
+                for ind_alpha, alpha in enumerate(self.alpha):
+                    prob['alpha'] = alpha
+                    prob.run_model()
+                    self.num_solves += 1
+
+                    CL_sweep[ind_alpha] = prob['aero_point_0.CL'][0]
+                    CD_sweep[ind_alpha] = prob['aero_point_0.CD'][0]
+                    S_ref = prob['aero_point_0.wing.S_ref'][0]
+
+                if np.any(np.diff(CL_sweep) <= 0):
+                    raise ValueError('CL is not increasing over the alpha sweep at Mach {}, '
+                        'altitude {} m'.format(mach[ind_mach, ind_h], altitude[ind_mach, ind_h]))
+                if self.CL[0] < CL_sweep[0] or self.CL[-1] > CL_sweep[-1]:
+                    raise ValueError('The CL grid exceeds the range {} - {} reached by the '
+                        'alpha sweep'.format(CL_sweep[0], CL_sweep[-1]))
+
+                self.values[:, ind_mach, ind_h] = CubicSpline(CL_sweep, CD_sweep)(self.CL)
+
+        if self.with_zero_lift:
+            self.values += self._compute_zero_lift(speed, altitude, S_ref)[None, :, :]
+
+    def _compute_zero_lift(self, speed, altitude, S_ref):
+        # C0_fuselage is referenced to S_f and the OAS CD to S_ref of the wing
+        from components.zero_lift_drag.zero_lift_comp import ZeroLiftComp
+
+        prob = Problem()
+        prob.model.add_subsystem('zero_lift_comp', ZeroLiftComp(shape=speed.shape),
+            promotes=['*'])
+        prob.setup()
+
+        for name, value in self.zero_lift_inputs.items():
+            prob[name] = value
+        prob['speed'] = speed
+        prob['altitude'] = altitude
+        prob.run_model()
+
+        return prob['C0_fuselage'] * prob['S_f'] / S_ref
+
+    def _save(self):
+        directory = os.path.dirname(self.file_path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        np.savez(self.file_path, values=self.values, CL=self.CL, mach=self.mach,
+            altitude=self.altitude)
+
+    def _load(self):
+        data = np.load(self.file_path)
+        self.values = data['values']
+        self.num_solves = 0
@@ -0,0 +1,129 @@
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from .drag_polar_table import DragPolarTable
+from .drag_polar_comp import DragPolarComp
+from ..oas_group import OASGroup
+from ..surface import get_surface
+from ..zero_lift_drag.zero_lift_comp import ZeroLiftComp
+from atmosphere.utils import compute_atmosphere
+
+from openmdao.api import Problem
+from ..complex_step import setup_problem, check_partials
+
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+#  test for the cached drag-polar surrogate
+
+
+class TestDragPolar(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cache_dir = tempfile.mkdtemp()
+        cls.surface = get_surface()
+        cls.kwargs = dict(
+            CL=np.linspace(0.2, 0.6, 4),
+            mach=np.linspace(0.7, 0.85, 4),
+            altitude=np.linspace(9000., 12000., 4),
+            alpha=np.linspace(-2., 10., 7),
+            cache_dir=cls.cache_dir,
+        )
+        cls.table = DragPolarTable(cls.surface, **cls.kwargs)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.cache_dir)
+
+    def test_cache(self):
+        table = DragPolarTable(self.surface, **self.kwargs)
+        self.assertEqual(table.num_solves, 0)
+        assert_near_equal(table.values, self.table.values, 1e-15)
+
+        # a different mesh is a different table
+        table = DragPolarTable(get_surface(num_y=9), **self.kwargs)
+        self.assertNotEqual(table.key, self.table.key)
+        self.assertGreater(table.num_solves, 0)
+
+    def test_grid_value(self):
+        # at a (Mach, altitude) node, the table follows the OAS drag plus the zero-lift drag in CL
+        mach, altitude = self.table.mach[1], self.table.altitude[2]
+        atm = compute_atmosphere(np.array([altitude]), derivs=False)
+        speed = mach * atm['sonic_speed'][0]
+
+        prob = Problem()
+        prob.model.add_subsystem('oas_group', OASGroup(surface=self.surface), promotes=['*'])
+        prob.setup()
+        prob['v'] = speed
+        prob['Mach_number'] = mach
+        prob['rho'] = atm['density'][0]
+        prob['re'] = atm['density'][0] * speed / atm['dynamic_viscosity'][0]
+        prob['alpha'] = 4.
+        prob.run_model()
+        CL = prob['aero_point_0.CL'][0]
+        CD = prob['aero_point_0.CD'][0]
+
+        zero_lift_prob = Problem()
+        zero_lift_prob.model.add_subsystem('comp', ZeroLiftComp(), promotes=['*'])
+        zero_lift_prob.setup()
+        zero_lift_prob['speed'] = speed
+        zero_lift_prob['altitude'] = altitude
+        zero_lift_prob.run_model()
+
+        polar_prob = Problem()
+        polar_prob.model.add_subsystem('comp', DragPolarComp(table=self.table), promotes=['*'])
+        polar_prob.setup()
+        polar_prob['CL'] = CL
+        polar_prob['Mach_number'] = mach
+        polar_prob['altitude'] = altitude
+        polar_prob.run_model()
+
+        fuselage_CD = zero_lift_prob['C0_fuselage'][0] * zero_lift_prob['S_f'][0] \
+            / prob['aero_point_0.wing.S_ref'][0]
+        assert_near_equal(polar_prob['CD'][0], CD + fuselage_CD, 1e-3)
+
+    def test_zero_lift(self):
+        # at a grid point, only the fuselage zero-lift drag, rescaled to the wing S_ref, is added
+        # to the OAS drag
+        kwargs = dict(self.kwargs, mach=[0.78], altitude=[10500.])
+        table = DragPolarTable(self.surface, **kwargs)
+        wing_table = DragPolarTable(self.surface, with_zero_lift=False, **kwargs)
+
+        atm = compute_atmosphere(np.array([10500.]), derivs=False)
+
+        prob = Problem()
+        prob.model.add_subsystem('oas_group', OASGroup(surface=self.surface), promotes=['*'])
+        prob.setup()
+        prob.run_model()
+
+        zero_lift_prob = Problem()
+        zero_lift_prob.model.add_subsystem('comp', ZeroLiftComp(), promotes=['*'])
+        zero_lift_prob.setup()
+        zero_lift_prob['speed'] = 0.78 * atm['sonic_speed'][0]
+        zero_lift_prob['altitude'] = 10500.
+        zero_lift_prob.run_model()
+
+        fuselage_CD = zero_lift_prob['C0_fuselage'][0] * zero_lift_prob['S_f'][0] \
+            / prob['aero_point_0.wing.S_ref'][0]
+        assert_near_equal(table.values - wing_table.values,
+            np.full(wing_table.values.shape, fuselage_CD), 1e-12)
+
+    def test_derivatives(self):
+        prob = Problem()
+        prob.model.add_subsystem('comp', DragPolarComp(shape=(5,), table=self.table),
+            promotes=['*'])
+        setup_problem(prob)
+        prob['CL'] = np.linspace(0.25, 0.55, 5)
+        prob['Mach_number'] = np.linspace(0.72, 0.83, 5)
+        prob['altitude'] = np.linspace(9500., 11500., 5)
+        prob.run_model()
+
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-6, rtol=1.e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
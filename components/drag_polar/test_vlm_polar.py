@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from .vlm_polar import VLMPolar
+from ..surface import get_surface
+from ..oas_group import OASGroup
+
+from openmdao.api import Problem
+
+from openmdao.utils.assert_utils import assert_near_equal
+
+#  test for the alpha-superposition VLM polar
+
+class TestVLMPolar(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.surface = get_surface()
+        cls.twist_cp = np.array([2., 4., 6.])
+        cls.polar = VLMPolar(cls.surface, alpha_ref=4.,
+            geometry_inputs={'wing.twist_cp': cls.twist_cp})
+
+        prob = Problem()
+        prob.model.add_subsystem('oas_group', OASGroup(surface=cls.surface), promotes=['*'])
+        prob.setup()
+        prob['wing.twist_cp'] = cls.twist_cp
+        cls.prob = prob
+
+    def run_oas(self, alpha):
+        self.prob['alpha'] = alpha
+        self.prob.run_model()
+        return dict((name, self.prob['aero_point_0.wing_perf.' + name])
+            for name in ['CL', 'CDi', 'sec_forces'])
+
+    def test_reference_alpha(self):
+        # at alpha_ref the polar is the VLM solution
+        values = self.polar.compute(4.)
+        oas_values = self.run_oas(4.)
+        for name in ['CL', 'CDi', 'sec_forces']:
+            assert_near_equal(values[name][0], oas_values[name], 1e-10)
+
+    def test_polar(self):
+        # elsewhere it only differs by the alignment of the trailing vortices
+        alpha = np.array([-2., 1., 7., 10.])
+        values = self.polar.compute(alpha)
+        self.assertEqual(values['CL'].shape, (4,))
+        self.assertEqual(values['sec_forces'].shape, (4, 1, 6, 3))
+
+        for ind, alpha_value in enumerate(alpha):
+            oas_values = self.run_oas(alpha_value)
+            assert_near_equal(values['CL'][ind], oas_values['CL'], 2e-3)
+            assert_near_equal(values['CDi'][ind], oas_values['CDi'], 2e-2)
+
+
+if __name__ == '__main__':
+    unittest.main()
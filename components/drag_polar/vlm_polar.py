@@ -0,0 +1,111 @@
+from __future__ import division, print_function
+
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+
+from openmdao.api import Problem
+
+#
+#    Drag polars of the OpenAeroStruct VLM by superposition. With the freestream
+#    v * (cos(alpha), 0, sin(alpha)) the right-hand side of the VLM system, and so the
+#    circulations, are linear in cos(alpha) and sin(alpha), and the Kutta-Joukowski panel forces
+#    are quadratic in them. The AIC matrix is factored once, the circulations of the two unit
+#    freestreams are solved for, and CL, CDi and the section forces of any batch of angles of
+#    attack follow from three force bases without further solves.
+#
+#    OpenAeroStruct aligns the trailing vortex legs with the freestream, so its AIC matrix
+#    depends weakly on alpha; here they stay aligned with the reference angle of attack
+#    alpha_ref, which the polar reproduces exactly
+#
+
+
+class VLMPolar(object):
+    """
+    Lift and induced drag of a lifting surface over the angle of attack,
+    from one VLM factorization.
+
+    OASGroup is run once at alpha_ref, with the geometry inputs in
+    geometry_inputs (e.g. {'wing.twist_cp': ...}) overriding its defaults,
+    and the AIC matrix, the induced velocities at the force points and the
+    bound vortex vectors of that geometry are kept. CL includes the CL0 of
+    the surface, as the CL of the aero point does.
+    """
+
+    def __init__(self, surface, alpha_ref=5., geometry_inputs=None):
+        self.surface = surface
+        self.alpha_ref = float(alpha_ref)
+        self.geometry_inputs = dict(geometry_inputs or {})
+
+        self._build()
+
+    def compute(self, alpha):
+        """
+        Returns a dict with the CL, CDi of shape (n,) and the section forces
+        sec_forces of shape (n, nx - 1, ny - 1, 3) [N] at the angles of
+        attack alpha [deg], with the v and rho of the reference run.
+        """
+        alpha = np.atleast_1d(np.asarray(alpha, dtype=float)) * np.pi / 180.
+        cosa = np.cos(alpha)
+        sina = np.sin(alpha)
+
+        # panel forces per unit rho * v**2, quadratic in cos(alpha) and sin(alpha)
+        forces = np.einsum('a,ij->aij', cosa ** 2, self.forces_xx) \
+            + np.einsum('a,ij->aij', cosa * sina, self.forces_xz) \
+            + np.einsum('a,ij->aij', sina ** 2, self.forces_zz)
+
+        lift = np.sum(-forces[:, :, 0] * sina[:, None] + forces[:, :, 2] * cosa[:, None], axis=1)
+        drag = np.sum(forces[:, :, 0] * cosa[:, None] + forces[:, :, 2] * sina[:, None], axis=1)
+        if self.surface['symmetry']:
+            lift *= 2.
+            drag *= 2.
+
+        mesh = self.surface['mesh']
+        return dict(
+            CL=lift / (0.5 * self.S_ref) + self.surface.get('CL0', 0.),
+            CDi=drag / (0.5 * self.S_ref),
+            sec_forces=self.rho * self.v ** 2 * forces.reshape(
+                (alpha.size, mesh.shape[0] - 1, mesh.shape[1] - 1, 3)),
+        )
+
+    def _build(self):
+        from components.oas_group import OASGroup
+
+        name = self.surface['name']
+
+        prob = Problem()
+        prob.model.add_subsystem('oas_group', OASGroup(surface=self.surface), promotes=['*'])
+        prob.setup()
+
+        for input_name, value in self.geometry_inputs.items():
+            prob[input_name] = value
+        prob['alpha'] = self.alpha_ref
+        prob.run_model()
+
+        states = prob.model.oas_group.aero_point_0.aero_states
+        normals = prob['aero_point_0.aero_states.{}_normals'.format(name)].reshape((-1, 3))
+        num = normals.shape[0]
+        vel_mtx = prob['aero_point_0.aero_states.{}_force_pts_vel_mtx'.format(name)].reshape(
+            (num, num, 3))
+        bound_vecs = prob['aero_point_0.aero_states.bound_vecs']
+
+        self.v = prob['v'][0]
+        self.rho = prob['rho'][0]
+        self.S_ref = prob['aero_point_0.{}.S_ref'.format(name)][0]
+
+        # ring circulations of the unit freestreams along x and z, from one factorization
+        lu = lu_factor(prob['aero_point_0.aero_states.mtx'])
+        circulations = lu_solve(lu, -normals[:, [0, 2]])
+        horseshoe_circulations = states.horseshoe_circulations.mtx.dot(circulations)
+
+        # velocities at the force points, induced by the vortex rings, and their cross products
+        # with the bound vortices
+        cross = []
+        for ind, unit in enumerate([[1., 0., 0.], [0., 0., 1.]]):
+            velocities = unit + np.einsum('ijk,j->ik', vel_mtx, circulations[:, ind])
+            cross.append(np.cross(velocities, bound_vecs))
+
+        gamma_x = horseshoe_circulations[:, 0:1]
+        gamma_z = horseshoe_circulations[:, 1:2]
+        self.forces_xx = gamma_x * cross[0]
+        self.forces_xz = gamma_x * cross[1] + gamma_z * cross[0]
+        self.forces_zz = gamma_z * cross[1]
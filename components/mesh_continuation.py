@@ -0,0 +1,86 @@
+from __future__ import division, print_function
+import timeit
+
+import numpy as np
+
+from openmdao.api import Problem, ScipyOptimizeDriver
+from components.oas_group import OASGroup
+from components.surface import get_surface
+
+#
+#    Coarse-to-fine mesh continuation: the design problem is optimized on a coarse OpenAeroStruct
+#    mesh first and then re-meshed at finer resolutions, every level starting from the optimum of
+#    the previous one, so most optimizer iterations are spent on the cheap meshes. Design
+#    variables whose size changes with the level, e.g. the twist control points, are
+#    interpolated linearly along the span
+#
+
+# (num_y, num_x, num_twist_cp) of every level, coarse to fine
+default_levels = [
+    (7, 2, 3),
+    (11, 3, 5),
+    (21, 5, 7),
+]
+
+
+def build_design_problem(num_y, num_x, num_twist_cp=3, optimizer='SLSQP', tol=1e-9):
+    """
+    Returns the set-up drag minimization of the wing of run.py, over alpha and
+    the twist control points at CL = 0.5, on a num_y x num_x mesh.
+    """
+    prob = Problem()
+    prob.model.add_subsystem('oas_group', OASGroup(surface=get_surface(num_y, num_x,
+        num_twist_cp)), promotes=['*'])
+    prob.model.add_design_var('alpha', lower=-5., upper=15.)
+    prob.model.add_design_var('wing.twist_cp', lower=-10., upper=15.)
+    prob.model.add_constraint('aero_point_0.CL', equals=0.5)
+    prob.model.add_objective('aero_point_0.CD', scaler=1e2)
+
+    prob.driver = ScipyOptimizeDriver(optimizer=optimizer, tol=tol, maxiter=500, disp=False)
+    prob.setup()
+    return prob
+
+
+def interpolate_control_points(values, num_points):
+    """
+    Linearly interpolates control point values onto num_points points with
+    the same spacing along the span.
+    """
+    values = np.asarray(values).flatten()
+    if values.size == num_points:
+        return values.copy()
+    return np.interp(np.linspace(0., 1., num_points), np.linspace(0., 1., values.size), values)
+
+
+def run_mesh_continuation(levels=default_levels, build_problem=build_design_problem,
+        out_stream=None):
+    """
+    Optimizes the problem returned by build_problem(*level) for every level,
+    starting each level from the optimum of the previous one. Returns the
+    problem of the last level and a list with a dict of the iterations,
+    model evaluations, wall time and objective of every level.
+    """
+    results = []
+    design = None
+    for level in levels:
+        prob = build_problem(*level)
+
+        start = timeit.default_timer()
+        if design is not None:
+            for name, value in design.items():
+                prob[name] = interpolate_control_points(value, prob[name].size).reshape(
+                    prob[name].shape)
+        failed = prob.run_driver()
+        wall_time = timeit.default_timer() - start
+
+        design = prob.driver.get_design_var_values(driver_scaling=False)
+        objective = list(prob.driver.get_objective_values(driver_scaling=False).values())[0]
+
+        results.append(dict(level=level, converged=not failed,
+            iterations=getattr(prob.driver.result, 'nit', 0), model_evals=prob.model.iter_count,
+            wall_time=wall_time, objective=objective[0]))
+        if out_stream is not None:
+            print('level {}: {} iterations, {:.2f} s, objective {}'.format(
+                level, results[-1]['iterations'], wall_time, objective[0]), file=out_stream)
+
+    return prob, results
@@ -6,18 +6,42 @@ from openaerostruct.geometry.geometry_group import Geometry as GeometryGroup
 from openaerostruct.aerodynamics.aero_groups import AeroPoint as AeroPointGroup
 from openmdao.api import ExplicitComponent, Group
 
+from components.cached_aero_point_comp import CachedAeroPointGroup
+from components.warm_start_aero_point import WarmStartAeroPoint
+
+
+#
+#    OpenAeroStruct aerodynamics of one lifting surface. With num_points > 1 the group has N aero
+#    points aero_point_0 ... aero_point_N-1 that share one geometry group, so the mesh is evaluated
+#    once for all flight conditions; v, alpha, Mach_number, re and rho then have shape (N,), one
+#    entry per point. With parallel=True the points are in a ParallelGroup and run on separate
+#    processes when the problem is run under MPI. With cache_size > 0 every aero point is a
+#    CachedAeroPointGroup, which skips the VLM solve for inputs it has already seen. With
+#    vlm_solver='gmres' every aero point is a WarmStartAeroPoint, which solves the VLM system by
+#    GMRES starting from the solution of the previous evaluation
+#
 
 class OASGroup(Group):
 
     def initialize(self):
         self.options.declare('surface', types=dict)
+        self.options.declare('num_points', default=1, types=int)
+        self.options.declare('parallel', default=False, types=bool)
+        self.options.declare('cache_size', default=0, types=int)
+        self.options.declare('vlm_solver', default='direct', values=['direct', 'gmres'])
 
     def setup(self):
         surface = self.options['surface']
+        num_points = self.options['num_points']
+        cache_size = self.options['cache_size']
+        vlm_solver = self.options['vlm_solver']
+
+        if cache_size > 0 and vlm_solver != 'direct':
+            raise ValueError('The cached aero point only supports the direct VLM solver')
 
         indep_var_comp = om.IndepVarComp()
-        indep_var_comp.add_output('v', val=257.222, units='m/s') 
-        indep_var_comp.add_output('alpha', val=5., units='deg')
+        indep_var_comp.add_output('v', val=257.222 * np.ones(num_points), units='m/s')
+        indep_var_comp.add_output('alpha', val=5. * np.ones(num_points), units='deg')
         # indep_var_comp.add_output('Mach_number', val=0.84)
         # indep_var_comp.add_output('re', val=1.e6, units='1/m')
         # indep_var_comp.add_output('rho', val=0.38, units='kg/m**3')
@@ -33,20 +57,51 @@ class OASGroup(Group):
         geom_group = GeometryGroup(surface=surface)
         self.add_subsystem(surface['name'], geom_group)
 
-        # Create the aero point group, which contains the actual aerodynamic
-        # analyses
-        aero_group = AeroPointGroup(surfaces=[surface])
-        point_name = 'aero_point_0'
-        self.add_subsystem(point_name, aero_group,
-            promotes_inputs=['v', 'alpha', 'Mach_number', 're', 'rho', 'cg'])
+        # the aero points are added to this group directly or, for several points, to a
+        # container whose variables are all promoted, so their promoted names are the same
+        if num_points == 1:
+            points_group = self
+        else:
+            if self.options['parallel']:
+                points_group = om.ParallelGroup()
+            else:
+                points_group = Group()
+            self.add_subsystem('points', points_group, promotes=['*'])
 
         name = surface['name']
+        for ind in range(num_points):
+            # Create the aero point group, which contains the actual aerodynamic
+            # analyses
+            if cache_size > 0:
+                aero_group = CachedAeroPointGroup(surface=surface, cache_size=cache_size)
+            elif vlm_solver == 'gmres':
+                aero_group = WarmStartAeroPoint(surfaces=[surface])
+            else:
+                aero_group = AeroPointGroup(surfaces=[surface])
+            point_name = 'aero_point_%d' % ind
+            points_group.add_subsystem(point_name, aero_group, promotes_inputs=['cg'])
+
+            # every point takes its own entry of the flow conditions
+            if num_points == 1:
+                points_group.promotes(point_name,
+                    inputs=['v', 'alpha', 'Mach_number', 're', 'rho'])
+            else:
+                points_group.promotes(point_name,
+                    inputs=['v', 'alpha', 'Mach_number', 're', 'rho'],
+                    src_indices=[ind], src_shape=(num_points,))
+
+            # Connect the mesh from the geometry component to the analysis point
+            self.connect(name + '.mesh', point_name + '.' + name + '.def_mesh')
 
-        # Connect the mesh from the geometry component to the analysis point
-        self.connect(name + '.mesh', point_name + '.' + name + '.def_mesh')
+            # Perform the connections with the modified names within the
+            # 'aero_states' group.
+            if cache_size == 0:
+                self.connect(name + '.mesh', point_name + '.aero_states.' + name + '_def_mesh')
 
-        # Perform the connections with the modified names within the
-        # 'aero_states' group.
-        self.connect(name + '.mesh', point_name + '.aero_states.' + name + '_def_mesh')
+            self.connect(name + '.t_over_c', point_name + '.' + name + '_perf.' + 't_over_c')
 
-        self.connect(name + '.t_over_c', point_name + '.' + name + '_perf.' + 't_over_c')
\ No newline at end of file
+        # defaults for flow conditions left unconnected, which the aero point subsystems
+        # declare with different values
+        self.set_input_defaults('Mach_number', val=0.84 * np.ones(num_points))
+        self.set_input_defaults('re', val=1.e6 * np.ones(num_points), units='1/m')
+        self.set_input_defaults('rho', val=0.38 * np.ones(num_points), units='kg/m**3')
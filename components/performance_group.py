@@ -0,0 +1,171 @@
+import numpy as np
+
+from openmdao.api import Group, IndepVarComp, ExecComp, NewtonSolver, NonlinearBlockGS, \
+    DirectSolver
+
+from components.oas_group import OASGroup
+from components.aero_surrogate.aero_surrogate_comp import AeroSurrogateComp
+from components.zero_lift_drag.atmosphere_group import AtmosphereGroup
+from components.breguet_range.breg_range import BregRange
+from components.aeroprop.engine_deck import get_engine_deck
+from components.aeroprop.engine_deck_comp import EngineDeckComp
+from weight_component.weightGroup import weightCompGroup
+
+#
+#    The aircraft performance model of run_opt: atmosphere, OpenAeroStruct aerodynamics, weights,
+#    Breguet fuel burn and engine deck, with the L/D, lift-over-weight (LOW) and thrust-over-drag
+#    (TOD) constraints. Every partial is analytic or complex-stepped, so total derivatives are
+#    exact and gradient-based optimizers can be used
+#
+#    With sizing_solver=None the gross weight W0 of the weight equations is fixed and W0_residual
+#    measures how far it is from empty weight + payload + fuel burn, for use as a constraint. With
+#    sizing_solver='newton' or 'aitken', sizing_group closes W0 = empty + payload + fuel inside
+#    the model, so every evaluation sees a consistent aircraft. aero_cache_size > 0 puts the aero
+#    point behind an LRU cache (see CachedAeroPointComp) and aero_vlm_solver='gmres' solves its VLM
+#    system by GMRES, warm-started between evaluations (see WarmStartAeroPoint). With an
+#    aero_surrogate, its Kriging models replace OASGroup
+#
+#    The engine deck is synthesized once for the BPR and max_thrust [kN] options, so the engine
+#    is fixed during an optimization and is not an input of the model
+#
+
+class PerformanceGroup(Group):
+
+    def initialize(self):
+        self.options.declare('surface', types=dict)
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('sizing_solver', default=None, values=[None, 'newton', 'aitken'])
+        self.options.declare('aero_cache_size', default=0, types=int)
+        self.options.declare('aero_vlm_solver', default='direct', values=['direct', 'gmres'])
+        self.options.declare('aero_surrogate', default=None, allow_none=True,
+            desc='AeroSurrogate that replaces OASGroup')
+        self.options.declare('BPR', default=5., types=float)
+        self.options.declare('max_thrust', default=490., types=float)
+
+    def setup(self):
+        shape = self.options['shape']
+        sizing_solver = self.options['sizing_solver']
+        aero_surrogate = self.options['aero_surrogate']
+
+        comp = IndepVarComp()
+        comp.add_output('rnge', val=1.3e6)
+        comp.add_output('CT', val= 1/10193)
+        comp.add_output('altitude', val = 10000, units='m')
+        comp.add_output('characteristic_length', val = 5)
+        comp.add_output('S_w', val = 400)
+        # wing parameters
+        comp.add_output('span', val = 59, units='m')
+        comp.add_output('dihedral', val = 3, units='deg')
+        comp.add_output('sweep', val = 27, units='deg')
+        if aero_surrogate is not None:
+            # otherwise inputs of OASGroup
+            comp.add_output('v', val=257.222, units='m/s')
+            comp.add_output('alpha', val=5., units='deg')
+        self.add_subsystem('flight_vars', comp, promotes=['*'])
+
+        comp = AtmosphereGroup(shape=shape)
+        self.add_subsystem('atmosphere_group', comp, promotes=['*'])
+
+        if aero_surrogate is None:
+            comp = OASGroup(surface=self.options['surface'],
+                cache_size=self.options['aero_cache_size'],
+                vlm_solver=self.options['aero_vlm_solver'])
+            self.add_subsystem('oas_group', comp, promotes=['*'])
+        else:
+            comp = AeroSurrogateComp(shape=shape, surrogate=aero_surrogate)
+            self.add_subsystem('aero_surrogate_comp', comp, promotes=['*'])
+
+        if sizing_solver is None:
+            group = self
+        else:
+            group = Group()
+
+        comp = weightCompGroup(fixed_W0=sizing_solver is None)
+        group.add_subsystem('weight_group', comp, promotes=['*'])
+
+        comp = BregRange(shape=shape)
+        group.add_subsystem('breguet_range_comp', comp, promotes=['*'])
+
+        # gross weight [lb] from the empty weight [lb], the payload and the fuel burn [kg]
+        W0_expr = '(emptyTotal + (42760 + fuelburn) * 9.81 / 4.45)'
+        if sizing_solver is None:
+            comp = ExecComp('W0_residual = W0 / %s - 1' % W0_expr)
+            self.add_subsystem('W0_residual_comp', comp, promotes=['*'])
+        else:
+            comp = ExecComp('W0 = %s' % W0_expr, W0={'val': 256000.})
+            group.add_subsystem('W0_comp', comp, promotes=['*'])
+
+            if sizing_solver == 'newton':
+                # with complex vectors allocated, linearizing an ExecComp overwrites its outputs,
+                # which is only harmless once the subsystems have been solved
+                group.nonlinear_solver = NewtonSolver(solve_subsystems=True)
+            else:
+                group.nonlinear_solver = NonlinearBlockGS(use_aitken=True)
+            group.nonlinear_solver.options['atol'] = 1e-10
+            group.nonlinear_solver.options['rtol'] = 1e-12
+            group.nonlinear_solver.options['maxiter'] = 50
+            group.nonlinear_solver.options['iprint'] = 0
+            group.nonlinear_solver.options['err_on_non_converge'] = True
+            group.linear_solver = DirectSolver()
+            self.add_subsystem('sizing_group', group, promotes=['*'])
+
+        # at full throttle, the same lapse as thrustComp for this BPR and max_thrust
+        comp = EngineDeckComp(shape=shape, deck=get_engine_deck(BPR=self.options['BPR'],
+            max_thrust=self.options['max_thrust']))
+        self.add_subsystem('thrust_comp', comp, promotes=['*'])
+
+        # Computes E = L/D for use in the breguet range component
+        comp = ExecComp('LD = CL/CD')
+        self.add_subsystem('ld_comp', comp, promotes=['*'])
+
+        comp = ExecComp('tot_weight = (fuelburn + emptyTotal*4.45/9.81 + 42760) * 9.81')
+        self.add_subsystem('total_weight_calculation', comp, promotes=['*'])
+
+        comp = ExecComp('LOW = 1 - L / tot_weight')
+        self.add_subsystem('LOW', comp, promotes=['*'])
+
+        comp = ExecComp('TOD = thrust * 1e3 - D')
+        self.add_subsystem('TOD', comp, promotes=['*'])
+
+        comp = ExecComp('aspect_ratio = span**2 / S_ref')
+        self.add_subsystem('aspect_ratio_comp', comp, promotes=['*'])
+
+        # the surrogate outputs and inputs are promoted under these names already
+        if aero_surrogate is None:
+            self.connect('aero_point_0.CL', 'CL')
+            self.connect('aero_point_0.CD', 'CD')
+            self.connect('aero_point_0.wing_perf.L', 'L')
+            self.connect('aero_point_0.wing_perf.D', 'D')
+            self.connect('dihedral', 'wing.mesh.dihedral.dihedral')
+            self.connect('sweep', 'wing.mesh.sweep.sweep')
+            self.connect('span', 'wing.mesh.stretch.span')
+            self.connect('aero_point_0.wing.S_ref', 'S_ref')
+
+
+def add_design_problem(model):
+    """
+    Adds the design variables, constraints and objective of run_opt to a model
+    that contains a PerformanceGroup with promoted variables. The LOW
+    constraint compares the lift with the weight, which is only consistent
+    with the weight equations if W0 is sized, either by the sizing_solver of
+    the PerformanceGroup or by add_sizing_constraint.
+    """
+    model.add_design_var('alpha', lower=-5, upper=15)
+    model.add_design_var('altitude', lower=8000, upper=15000, scaler=1e-3)
+    model.add_design_var('S_w', lower=300, upper=500, scaler=1e-2)
+    model.add_design_var('span', lower=40, upper=70, scaler=1e-1)
+
+    model.add_constraint('LD', lower=18.9, upper=19.1)
+    model.add_constraint('LOW', lower=-1e-3, upper=1e-3)
+    model.add_constraint('Mach_number', lower=0.84, upper=0.85)
+
+    model.add_objective('fuelburn', scaler=1e-3)
+
+
+def add_sizing_constraint(model):
+    """
+    Sizes W0 with the optimizer instead of a sizing_solver: W0 becomes a
+    design variable and W0_residual an equality constraint.
+    """
+    model.add_design_var('W0', lower=1e5, upper=5e5, scaler=1e-5)
+    model.add_constraint('W0_residual', equals=0.)
@@ -0,0 +1,51 @@
+from __future__ import division, print_function
+
+import numpy as np
+
+from openaerostruct.geometry.utils import generate_mesh
+
+#
+#    Surface dicts of the CRM wing used by the tests, benchmarks and mesh continuation: the
+#    aerodynamic wing of run_opt, and the aerostructural wing of run_opt2 with its tube structure.
+#    Entries passed as keyword arguments override the defaults
+#
+
+# structural entries of the aerostructural wing of run_opt2
+aerostruct_properties = {
+    'thickness_cp': np.array([.1, .2, .3]),
+    'E': 70.e9,
+    'G': 30.e9,
+    'yield': 500.e6 / 2.5,
+    'mrho': 3.e3,
+    'fem_origin': 0.35,
+    'wing_weight_ratio': 2.,
+    'struct_weight_relief': False,
+    'distributed_fuel_weight': False,
+    'exact_failure_constraint': False,
+}
+
+
+def get_surface(num_y=7, num_x=2, num_twist_cp=3, symmetry=False, **overrides):
+    """
+    Returns the CRM wing surface dict of run_opt on a num_y x num_x mesh.
+    """
+    mesh, twist_cp = generate_mesh({'num_y': num_y, 'num_x': num_x, 'wing_type': 'CRM',
+        'symmetry': symmetry, 'num_twist_cp': num_twist_cp})
+
+    surface = {
+        'name': 'wing', 'symmetry': symmetry, 'S_ref_type': 'wetted', 'fem_model_type': 'tube',
+        'twist_cp': twist_cp, 'mesh': mesh, 'CL0': 0.2, 'CD0': 0.013, 'k_lam': 0.05,
+        't_over_c_cp': np.array([0.14]), 'c_max_t': .303,
+        'with_viscous': True, 'with_wave': True,
+    }
+    surface.update(overrides)
+    return surface
+
+
+def get_aerostruct_surface(num_y=5, num_x=2, num_twist_cp=5, **overrides):
+    """
+    Returns the symmetric CRM wing surface dict of run_opt2, with the
+    structural entries of aerostruct_properties, on a num_y x num_x mesh.
+    """
+    return get_surface(num_y, num_x, num_twist_cp, symmetry=True,
+        **dict(aerostruct_properties, **overrides))
@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+
+from .aerostruct_group import AerostructGroup, coupled_solvers
+from .surface import get_aerostruct_surface
+
+from openmdao.api import Problem
+from .complex_step import setup_problem, check_totals
+
+#  tests for the coupled solvers of the aerostructural model of run_opt2
+
+
+def build_problem(coupled_solver):
+    prob = Problem()
+    prob.model.add_subsystem('aerostruct_group',
+        AerostructGroup(surface=get_aerostruct_surface(), coupled_solver=coupled_solver, atol=1e-8),
+        promotes=['*'])
+    prob.model.add_design_var('alpha')
+    prob.model.add_design_var('S_ref_total')
+    prob.model.add_design_var('wing.thickness_cp')
+    prob.model.add_constraint('AS_point_0.L_equals_W')
+    prob.model.add_objective('AS_point_0.fuelburn')
+    setup_problem(prob)
+    return prob
+
+
+class TestAerostructGroup(unittest.TestCase):
+
+    def test_coupled_solvers(self):
+        results = {}
+        for coupled_solver in coupled_solvers:
+            prob = build_problem(coupled_solver)
+            prob.run_model()
+            results[coupled_solver] = [prob['AS_point_0.fuelburn'][0],
+                prob['AS_point_0.wing_perf.CL'][0], prob['AS_point_0.L_equals_W'][0]]
+
+        for coupled_solver in coupled_solvers:
+            np.testing.assert_allclose(results[coupled_solver], results['aitken'], rtol=1e-8)
+
+    def test_totals(self):
+        prob = build_problem('newton')
+        prob.run_model()
+
+        data = check_totals(prob, out_stream=None, method='fd', form='central', step=1e-6,
+            step_calc='rel')
+        # fuelburn is of order 1e4, so smaller finite differences are noise around zero
+        for key, pair_data in data.items():
+            if pair_data['magnitude'].fd > 1e-6:
+                self.assertLess(pair_data['rel error'].forward, 1e-4, key)
+
+
+if __name__ == '__main__':
+    unittest.main()
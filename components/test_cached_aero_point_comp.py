@@ -0,0 +1,94 @@
+import unittest
+
+import numpy as np
+
+from .oas_group import OASGroup
+from .performance_group import PerformanceGroup
+from .surface import get_surface
+
+from openmdao.api import Problem
+from .complex_step import setup_problem, check_totals
+
+#  tests for the LRU cache of CachedAeroPointComp against the uncached OASGroup
+
+outputs = ['CL', 'CD', 'CM', 'wing_perf.L', 'wing_perf.D', 'wing.S_ref']
+design_vars = ['alpha', 'rho', 'wing.twist_cp', 'wing.mesh.sweep.sweep']
+
+
+def build_problem(cache_size):
+    prob = Problem()
+    prob.model.add_subsystem('oas_group', OASGroup(surface=get_surface(), cache_size=cache_size),
+        promotes=['*'])
+    setup_problem(prob)
+    return prob
+
+
+class TestCachedAeroPointComp(unittest.TestCase):
+
+    def test_values_and_totals(self):
+        prob = build_problem(10)
+        ref_prob = build_problem(0)
+
+        for alpha in [2., 5.]:
+            for each_prob in [prob, ref_prob]:
+                each_prob['alpha'] = alpha
+                each_prob['wing.mesh.sweep.sweep'] = 20.
+                each_prob.run_model()
+
+            for name in outputs:
+                np.testing.assert_allclose(prob['aero_point_0.' + name],
+                    ref_prob['aero_point_0.' + name], rtol=1e-12, atol=1e-14)
+
+            of = ['aero_point_0.' + name for name in outputs]
+            totals = prob.compute_totals(of=of, wrt=design_vars)
+            ref_totals = ref_prob.compute_totals(of=of, wrt=design_vars)
+            for key, value in ref_totals.items():
+                np.testing.assert_allclose(totals[key], value, rtol=1e-8, atol=1e-12,
+                    err_msg=str(key))
+
+    def test_hits_and_eviction(self):
+        prob = build_problem(2)
+        comp = prob.model.oas_group.aero_point_0.cached_point
+
+        for alpha in [2., 5., 2., 8., 5.]:
+            prob['alpha'] = alpha
+            prob.run_model()
+
+        # 2. is a hit; 8. evicts 5., the least recently used, which then misses again
+        info = comp.cache_info()
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 4)
+        self.assertEqual(info['size'], 2)
+        self.assertAlmostEqual(info['hit_rate'], 0.2)
+
+        prob.compute_totals(of=['aero_point_0.CL'], wrt=['alpha'])
+        prob.compute_totals(of=['aero_point_0.CL'], wrt=['alpha'])
+        info = comp.cache_info()
+        self.assertEqual(info['partials_misses'], 1)
+        self.assertEqual(info['partials_hits'], 1)
+
+    def test_complex_step(self):
+        def build_performance_problem():
+            prob = Problem()
+            prob.model.add_subsystem('performance_group',
+                PerformanceGroup(surface=get_surface(), aero_cache_size=10), promotes=['*'])
+            prob.model.add_design_var('alpha')
+            prob.model.add_objective('fuelburn')
+            prob.setup(force_alloc_complex=True)
+            prob.run_model()
+            return prob
+
+        # complex step through the real sub-problem would drop the imaginary part, so it errors
+        with self.assertRaisesRegex(ValueError, 'cannot be complex-stepped'):
+            check_totals(build_performance_problem(), method='cs', out_stream=None)
+
+        # finite differences still match the cached partials
+        data = check_totals(build_performance_problem(), method='fd', form='central', step=1e-6,
+            step_calc='rel', out_stream=None)
+        for key, value in data.items():
+            np.testing.assert_allclose(value['J_fwd'], value['J_fd'], rtol=1e-5,
+                err_msg=str(key))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+import numpy as np
+
+from .definition_key import get_definition_key
+
+#  tests for the definition keys of the on-disk and in-process caches
+
+
+class TestDefinitionKey(unittest.TestCase):
+
+    def test_key(self):
+        surface = {'name': 'wing', 'mesh': np.zeros((2, 3, 3)), 'CD0': 0.013}
+        key = get_definition_key(1, surface, [0.1, 0.2])
+
+        self.assertEqual(get_definition_key(1, dict(reversed(list(surface.items()))),
+            [0.1, 0.2]), key)
+
+        # every cache has its own version, which only changes its own keys
+        self.assertNotEqual(get_definition_key(2, surface, [0.1, 0.2]), key)
+
+        changed = dict(surface, mesh=np.ones((2, 3, 3)))
+        self.assertNotEqual(get_definition_key(1, changed, [0.1, 0.2]), key)
+        self.assertNotEqual(get_definition_key(1, surface, [0.1, 0.3]), key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+import numpy as np
+
+from .mesh_continuation import interpolate_control_points, run_mesh_continuation, \
+    build_design_problem
+
+#  tests for the coarse-to-fine mesh continuation
+
+class TestMeshContinuation(unittest.TestCase):
+
+    def test_interpolate_control_points(self):
+        values = np.array([1., 3., 2.])
+        np.testing.assert_array_equal(interpolate_control_points(values, 3), values)
+        np.testing.assert_allclose(interpolate_control_points(values, 5),
+            [1., 2., 3., 2.5, 2.])
+
+    def test_continuation(self):
+        levels = [(5, 2, 3), (7, 2, 5)]
+        prob, results = run_mesh_continuation(levels)
+
+        self.assertEqual([result['level'] for result in results], levels)
+        for result in results:
+            self.assertTrue(result['converged'])
+
+        # the same optimum as a cold start on the fine mesh
+        ref_prob = build_design_problem(*levels[-1])
+        ref_prob.run_driver()
+        np.testing.assert_allclose(results[-1]['objective'], ref_prob['aero_point_0.CD'][0],
+            rtol=1e-6)
+        np.testing.assert_allclose(prob['aero_point_0.CL'], 0.5, rtol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+
+from .oas_group import OASGroup
+from .surface import get_surface
+
+from openmdao.api import Problem
+from .complex_step import setup_problem, check_totals
+
+#  tests for the multi-point OASGroup against one single-point OASGroup per flight condition
+
+alpha = np.array([2., 5., 8.])
+Mach_number = np.array([0.6, 0.78, 0.84])
+rho = np.array([1.2, 0.6, 0.38])
+
+
+def build_problem(num_points, parallel=False):
+    prob = Problem()
+    prob.model.add_subsystem('oas_group',
+        OASGroup(surface=get_surface(), num_points=num_points, parallel=parallel),
+        promotes=['*'])
+    return prob
+
+
+class TestOASGroup(unittest.TestCase):
+
+    def test_points(self):
+        for parallel in [False, True]:
+            prob = build_problem(3, parallel)
+            setup_problem(prob)
+            prob['alpha'] = alpha
+            prob['Mach_number'] = Mach_number
+            prob['rho'] = rho
+            prob.run_model()
+
+            for ind in range(3):
+                single_prob = build_problem(1)
+                setup_problem(single_prob)
+                single_prob['alpha'] = alpha[ind]
+                single_prob['Mach_number'] = Mach_number[ind]
+                single_prob['rho'] = rho[ind]
+                single_prob.run_model()
+
+                point_name = 'aero_point_%d' % ind
+                for name in ['CL', 'CD', 'wing_perf.L', 'wing_perf.D']:
+                    np.testing.assert_allclose(prob[point_name + '.' + name],
+                        single_prob['aero_point_0.' + name], rtol=1e-12)
+
+    def test_totals(self):
+        prob = build_problem(2)
+        prob.model.add_design_var('alpha')
+        prob.model.add_design_var('Mach_number')
+        prob.model.add_design_var('wing.twist_cp')
+        for ind in range(2):
+            prob.model.add_constraint('aero_point_%d.CL' % ind)
+            prob.model.add_constraint('aero_point_%d.CD' % ind)
+        setup_problem(prob)
+        prob['alpha'] = alpha[:2]
+        prob['Mach_number'] = Mach_number[:2]
+        prob.run_model()
+
+        data = check_totals(prob, out_stream=None, method='fd', form='central', step=1e-6,
+            step_calc='rel')
+        for key, pair_data in data.items():
+            if pair_data['magnitude'].fd > 1e-10:
+                self.assertLess(pair_data['rel error'].forward, 1e-5, key)
+
+
+if __name__ == '__main__':
+    unittest.main()
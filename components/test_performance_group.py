@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+
+from .performance_group import PerformanceGroup, add_design_problem
+from .surface import get_surface
+
+from openmdao.api import Problem
+from .complex_step import setup_problem, check_totals
+
+#  test for the total derivatives of the run_opt model
+
+
+class TestPerformanceGroup(unittest.TestCase):
+
+    def test_totals(self):
+        prob = Problem()
+        prob.model.add_subsystem('performance_group', PerformanceGroup(surface=get_surface()),
+            promotes=['*'])
+        add_design_problem(prob.model)
+        prob.model.add_constraint('TOD', lower=0.)
+        setup_problem(prob)
+        prob.run_model()
+
+        # some OpenAeroStruct components are not complex-step safe, so central differences
+        # with a relative step are used for the whole model
+        data = check_totals(prob, out_stream=None, method='fd', form='central', step=1e-6,
+            step_calc='rel')
+        for key, pair_data in data.items():
+            if pair_data['magnitude'].fd > 1e-10:
+                self.assertLess(pair_data['rel error'].forward, 1e-5, key)
+
+    def test_engine_options(self):
+        # the deck is built from the options, so a larger engine gives more thrust
+        thrust = []
+        for max_thrust in [490., 600.]:
+            prob = Problem()
+            prob.model.add_subsystem('performance_group',
+                PerformanceGroup(surface=get_surface(), max_thrust=max_thrust), promotes=['*'])
+            prob.setup()
+            prob.run_model()
+            thrust.append(prob['thrust'][0])
+
+        np.testing.assert_allclose(thrust[1] / thrust[0], 600. / 490., rtol=1e-10)
+
+    def test_sizing_solvers(self):
+        for sizing_solver in ['newton', 'aitken']:
+            prob = Problem()
+            prob.model.add_subsystem('performance_group',
+                PerformanceGroup(surface=get_surface(), sizing_solver=sizing_solver),
+                promotes=['*'])
+            prob.setup()
+            prob.run_model()
+
+            W0 = prob['emptyTotal'] + (42760 + prob['fuelburn']) * 9.81 / 4.45
+            np.testing.assert_allclose(prob['W0'], W0, rtol=1e-10)
+            np.testing.assert_allclose(prob['tot_weight'], prob['W0'] * 4.45, rtol=1e-10)
+
+    def test_sizing_totals(self):
+        prob = Problem()
+        prob.model.add_subsystem('performance_group',
+            PerformanceGroup(surface=get_surface(), sizing_solver='newton'), promotes=['*'])
+        add_design_problem(prob.model)
+        setup_problem(prob)
+        prob.run_model()
+
+        data = check_totals(prob, out_stream=None, method='fd', form='central', step=1e-6,
+            step_calc='rel')
+        for key, pair_data in data.items():
+            if pair_data['magnitude'].fd > 1e-10:
+                self.assertLess(pair_data['rel error'].forward, 1e-5, key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+import numpy as np
+
+from .oas_group import OASGroup
+from .surface import get_surface
+
+from openmdao.api import Problem
+
+#  tests for the GMRES VLM solve of WarmStartAeroPoint against the direct solve of OpenAeroStruct
+
+# a short sequence of designs, as a driver would visit them
+designs = [(5., [1., 2., 3.]), (5.2, [1.1, 2., 3.1]), (4.9, [1., 1.9, 3.]), (5.1, [1., 2.1, 3.2])]
+
+
+def build_problem(vlm_solver):
+    prob = Problem()
+    prob.model.add_subsystem('oas_group', OASGroup(surface=get_surface(), vlm_solver=vlm_solver),
+        promotes=['*'])
+    prob.model.add_design_var('alpha')
+    prob.model.add_design_var('wing.twist_cp')
+    prob.model.add_constraint('aero_point_0.CL', equals=0.5)
+    prob.model.add_objective('aero_point_0.CD')
+    prob.setup(mode='rev')
+    return prob
+
+
+def run_designs(prob):
+    values = []
+    for alpha, twist_cp in designs:
+        prob['alpha'] = alpha
+        prob['wing.twist_cp'] = np.array(twist_cp)
+        prob.run_model()
+        values.append((prob['aero_point_0.CL'].copy(), prob['aero_point_0.CD'].copy(),
+            prob.compute_totals()))
+    return values
+
+
+class TestWarmStartAeroPoint(unittest.TestCase):
+
+    def test_values_and_totals(self):
+        direct_values = run_designs(build_problem('direct'))
+        gmres_values = run_designs(build_problem('gmres'))
+
+        for (CL, CD, totals), (gmres_CL, gmres_CD, gmres_totals) in zip(direct_values,
+                gmres_values):
+            np.testing.assert_allclose(gmres_CL, CL, rtol=1e-9)
+            np.testing.assert_allclose(gmres_CD, CD, rtol=1e-9)
+            for key in totals:
+                np.testing.assert_allclose(gmres_totals[key], totals[key], rtol=1e-8,
+                    atol=1e-12)
+
+    def test_warm_start(self):
+        iterations = {}
+        for warm_start in [False, True]:
+            prob = build_problem('gmres')
+            comp = prob.model.oas_group.aero_point_0.aero_states.solve_matrix
+            comp.options['warm_start'] = warm_start
+            run_designs(prob)
+
+            # only the first solve factors the matrix
+            self.assertEqual([info['refactored'] for info in comp.solve_info].count(True), 1)
+            self.assertEqual(max(info['solve'] for info in comp.solve_info), len(designs))
+            iterations[warm_start] = sum(info['iterations'] for info in comp.solve_info)
+
+        self.assertLess(iterations[True], iterations[False])
+
+    def test_not_converged(self):
+        direct_values = run_designs(build_problem('direct'))
+
+        # GMRES cannot reach this tolerance, so every solve after the first falls back to a
+        # direct solve with a new factorization
+        prob = build_problem('gmres')
+        comp = prob.model.oas_group.aero_point_0.aero_states.solve_matrix
+        comp.options['rtol'] = 1e-30
+        comp.options['refactor_iterations'] = 10 ** 6
+        gmres_values = run_designs(prob)
+
+        for (CL, CD, totals), (gmres_CL, gmres_CD, gmres_totals) in zip(direct_values,
+                gmres_values):
+            np.testing.assert_allclose(gmres_CL, CL, rtol=1e-12)
+            np.testing.assert_allclose(gmres_CD, CD, rtol=1e-12)
+            for key in totals:
+                np.testing.assert_allclose(gmres_totals[key], totals[key], rtol=1e-10,
+                    atol=1e-12)
+
+        self.assertTrue(all(info['refactored'] for info in comp.solve_info))
+        self.assertFalse(any(info['converged'] for info in list(comp.solve_info)[1:]))
+
+        self.assertEqual(comp.solve_info.maxlen, 1000)
+        self.assertEqual(sum(totals['solves'] for totals in comp.solve_totals.values()),
+            len(comp.solve_info))
+        self.assertEqual(sum(totals['refactored'] for totals in comp.solve_totals.values()),
+            len(comp.solve_info))
+
+    def test_cached(self):
+        prob = Problem()
+        prob.model.add_subsystem('oas_group', OASGroup(surface=get_surface(), cache_size=10,
+            vlm_solver='gmres'))
+        with self.assertRaises(ValueError):
+            prob.setup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+from __future__ import division, print_function
+from collections import deque
+from inspect import signature
+
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import LinearOperator, gmres
+
+from openaerostruct.aerodynamics.aero_groups import AeroPoint as AeroPointGroup
+from openaerostruct.aerodynamics.solve_matrix import SolveMatrix
+from openaerostruct.aerodynamics.states import VLMStates
+
+#
+#    OpenAeroStruct aero point whose VLM system is solved by GMRES instead of a fresh LU
+#    factorization. A driver changes the design only slightly between iterations, so every solve
+#    starts from the circulations of the previous one (and every adjoint or forward derivative
+#    solve from the previous solution for the same seed), and the LU factors of an earlier AIC
+#    matrix serve as preconditioner; the matrix is only factored again when GMRES needs more than
+#    refactor_iterations iterations or does not converge. solve_info records the iterations of the
+#    last solve_info_size solves
+#
+
+# the relative tolerance of gmres was renamed from tol to rtol in SciPy 1.12
+_rtol_name = 'rtol' if 'rtol' in signature(gmres).parameters else 'tol'
+
+
+class WarmStartSolveMatrix(SolveMatrix):
+    """
+    SolveMatrix with GMRES solves, seeded from the previous solution if
+    warm_start is True or from zero otherwise. Every solve appends a dict
+    with its kind ('nonlinear', 'fwd' or 'rev'), the GMRES iterations, the
+    number of the nonlinear solve it belongs to, whether GMRES converged and
+    whether the preconditioner was refactored to solve_info, which keeps the
+    last solve_info_size of them (all if None); solve_totals sums the
+    solves, iterations and refactorizations of every kind since setup. A
+    solve GMRES does not converge is redone directly with a new
+    factorization.
+    """
+
+    def initialize(self):
+        super(WarmStartSolveMatrix, self).initialize()
+        self.options.declare('warm_start', default=True, types=bool)
+        self.options.declare('rtol', default=1e-10, types=float)
+        self.options.declare('refactor_iterations', default=10, types=int)
+        self.options.declare('solve_info_size', default=1000, types=int, allow_none=True)
+
+    def setup(self):
+        super(WarmStartSolveMatrix, self).setup()
+
+        self.lu = None
+        self.solve_info = deque(maxlen=self.options['solve_info_size'])
+        self.solve_totals = dict((kind, dict(solves=0, iterations=0, refactored=0))
+            for kind in ['nonlinear', 'fwd', 'rev'])
+        self._num_solves = 0
+
+        # previous solutions of the linear solves, in the order of their seeds
+        self._previous = {'fwd': [], 'rev': []}
+        self._seed_index = {'fwd': 0, 'rev': 0}
+
+    def solve_nonlinear(self, inputs, outputs):
+        self._num_solves += 1
+
+        x0 = outputs['circulations'].copy() if self.options['warm_start'] else None
+        outputs['circulations'] = self._solve(inputs['mtx'], inputs['rhs'], x0, 'nonlinear')
+
+    def linearize(self, inputs, outputs, partials):
+        system_size = self.system_size
+
+        # the preconditioner of the last solve is kept, unlike in SolveMatrix
+        self._mtx = inputs['mtx'].copy()
+        self._seed_index = {'fwd': 0, 'rev': 0}
+
+        partials['circulations', 'circulations'] = inputs['mtx'].flatten()
+        partials['circulations', 'mtx'] = np.outer(np.ones(system_size),
+            outputs['circulations']).flatten()
+
+    def solve_linear(self, d_outputs, d_residuals, mode):
+        previous = self._previous[mode]
+        ind = self._seed_index[mode]
+        self._seed_index[mode] += 1
+
+        x0 = previous[ind] if self.options['warm_start'] and ind < len(previous) else None
+        if mode == 'fwd':
+            x = self._solve(self._mtx, d_residuals['circulations'], x0, mode)
+            d_outputs['circulations'] = x
+        else:
+            x = self._solve(self._mtx, d_outputs['circulations'], x0, mode)
+            d_residuals['circulations'] = x
+
+        if ind < len(previous):
+            previous[ind] = x.copy()
+        else:
+            previous.append(x.copy())
+
+    def _solve(self, mtx, rhs, x0, kind):
+        info = dict(kind=kind, iterations=0, solve=self._num_solves, converged=True,
+            refactored=False)
+        x = self._gmres_solve(mtx, rhs, x0, info)
+
+        self.solve_info.append(info)
+        totals = self.solve_totals[kind]
+        totals['solves'] += 1
+        totals['iterations'] += info['iterations']
+        totals['refactored'] += info['refactored']
+        return x
+
+    def _gmres_solve(self, mtx, rhs, x0, info):
+        # the adjoint ('rev') solves are with the transpose of mtx
+        trans = 1 if info['kind'] == 'rev' else 0
+        if self.lu is None:
+            self.lu = lu_factor(mtx)
+            info['refactored'] = True
+            return lu_solve(self.lu, rhs, trans=trans)
+
+        def count(_):
+            info['iterations'] += 1
+
+        lu = self.lu
+        preconditioner = LinearOperator(mtx.shape, matvec=lambda x: lu_solve(lu, x, trans=trans))
+        x, flag = gmres(mtx.T if trans else mtx, rhs, x0=x0, M=preconditioner, atol=0.,
+            restart=self.system_size, callback=count, callback_type='pr_norm',
+            **{_rtol_name: self.options['rtol']})
+        info['converged'] = flag == 0
+
+        # a stale preconditioner is replaced once it no longer pays off, and a solve GMRES did
+        # not converge is redone directly
+        if not info['converged'] or info['iterations'] > self.options['refactor_iterations']:
+            self.lu = lu_factor(mtx)
+            info['refactored'] = True
+            x = lu_solve(self.lu, rhs, trans=trans)
+        return x
+
+
+class WarmStartVLMStates(VLMStates):
+    """
+    VLMStates with a WarmStartSolveMatrix in place of SolveMatrix.
+    """
+
+    def initialize(self):
+        super(WarmStartVLMStates, self).initialize()
+        self.options.declare('warm_start', default=True, types=bool)
+
+    def add_subsystem(self, name, subsys, **kwargs):
+        if name == 'solve_matrix':
+            subsys = WarmStartSolveMatrix(surfaces=self.options['surfaces'],
+                warm_start=self.options['warm_start'])
+        return super(WarmStartVLMStates, self).add_subsystem(name, subsys, **kwargs)
+
+
+class WarmStartAeroPoint(AeroPointGroup):
+    """
+    AeroPoint of OpenAeroStruct with WarmStartVLMStates as aero_states.
+    """
+
+    def initialize(self):
+        super(WarmStartAeroPoint, self).initialize()
+        self.options.declare('warm_start', default=True, types=bool)
+
+    def add_subsystem(self, name, subsys, **kwargs):
+        if name == 'aero_states' and not self.options['compressible']:
+            linear_solver = subsys.linear_solver
+            subsys = WarmStartVLMStates(surfaces=self.options['surfaces'],
+                rotational=self.options['rotational'], warm_start=self.options['warm_start'])
+            subsys.linear_solver = linear_solver
+        return super(WarmStartAeroPoint, self).add_subsystem(name, subsys, **kwargs)
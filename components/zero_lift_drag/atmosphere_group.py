@@ -2,22 +2,52 @@ from __future__ import print_function
 import numpy as np
 from openmdao.api import Group, IndepVarComp, Problem
 
-from lsdo_utils.api import PowerCombinationComp
-
-from lsdo_aircraft.atmosphere.temperature_comp import TemperatureComp
-from lsdo_aircraft.atmosphere.pressure_comp import PressureComp
-from lsdo_aircraft.atmosphere.density_comp import DensityComp
-from lsdo_aircraft.atmosphere.sonic_speed_comp import SonicSpeedComp
-from lsdo_aircraft.atmosphere.viscosity_comp import ViscosityComp
+from atmosphere.atmosphere_comp import AtmosphereComp
+from atmosphere.atmosphere_table import get_atmosphere_table
 
 class AtmosphereGroup(Group):
 
     def initialize(self):
         self.options.declare('shape', types=tuple)
+        self.options.declare('fused', default=True, types=bool)
+        self.options.declare('mode', default='analytic', values=['analytic', 'table'])
+        self.options.declare('num_scenarios', default=None, types=int, allow_none=True)
 
     def setup(self):
         shape = self.options['shape']
 
+        if self.options['mode'] == 'table' and not self.options['fused']:
+            raise ValueError('The table atmosphere mode requires fused=True')
+        if self.options['num_scenarios'] is not None and not self.options['fused']:
+            raise ValueError('Atmosphere scenarios (ISA offsets) require fused=True')
+
+        if self.options['fused']:
+            if self.options['mode'] == 'table':
+                table = get_atmosphere_table()
+            else:
+                table = None
+
+            comp = AtmosphereComp(
+                shape=shape,
+                speed_name='v',
+                mach_name='Mach_number',
+                density_names=['density', 'rho'],
+                with_reynolds=True,
+                table=table,
+                num_scenarios=self.options['num_scenarios'],
+            )
+            self.add_subsystem('atmosphere_comp', comp, promotes=['*'])
+            return
+
+        # only the component chain needs lsdo_utils and lsdo_aircraft
+        from lsdo_utils.api import PowerCombinationComp
+
+        from lsdo_aircraft.atmosphere.temperature_comp import TemperatureComp
+        from lsdo_aircraft.atmosphere.pressure_comp import PressureComp
+        from lsdo_aircraft.atmosphere.density_comp import DensityComp
+        from lsdo_aircraft.atmosphere.sonic_speed_comp import SonicSpeedComp
+        from lsdo_aircraft.atmosphere.viscosity_comp import ViscosityComp
+
         comp = PowerCombinationComp(
             shape=shape,
             out_name='altitude_km',
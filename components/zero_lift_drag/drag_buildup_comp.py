@@ -0,0 +1,276 @@
+import numpy as np
+from openmdao.api import ExplicitComponent
+import openmdao.api as om
+
+from .utils import form_factor_types, compute_ks_min
+from .utils import compute_re_cutoffs, compute_re_cutoff_derivs
+from .utils import compute_laminar_cfs, compute_laminar_cf_derivs
+from .utils import compute_turbulent_cfs, compute_turbulent_cf_derivs
+from .utils import compute_form_factors
+
+#
+#    Component drag build-up: computes Re, Cf, FF and CD0 of every component in a table
+#    (wing, fuselage, nacelles, tails, ...) as array operations in a single component
+#
+
+# Geometry of every component, one input of shape (num_components,) each, with the value
+# used when a table entry leaves it out. t_c, x_t and sweep are only used by wings and
+# finesse_ratio only by bodies and nacelles.
+component_columns = dict(
+    characteristic_length=1.,
+    S_wet=1.,
+    interference_factor=1.,
+    laminar_fraction=0.05,
+    t_c=0.12,
+    x_t=0.3,
+    sweep=0.,
+    finesse_ratio=5.,
+)
+
+default_components = [
+    dict(name='wing', form_factor_type='wing', characteristic_length=5.,
+        S_wet=325., interference_factor=1., t_c=0.13, x_t=0.3, sweep=22.5 * np.pi / 180),
+    dict(name='fuselage', form_factor_type='body', characteristic_length=73.9,
+        S_wet=1300., interference_factor=1., finesse_ratio=73.9 / 6.2),
+    dict(name='nacelle_left', form_factor_type='nacelle', characteristic_length=6.,
+        S_wet=40., interference_factor=1.3, finesse_ratio=2.),
+    dict(name='nacelle_right', form_factor_type='nacelle', characteristic_length=6.,
+        S_wet=40., interference_factor=1.3, finesse_ratio=2.),
+    dict(name='horizontal_tail', form_factor_type='wing', characteristic_length=3.5,
+        S_wet=85., interference_factor=1.04, t_c=0.1, x_t=0.3, sweep=30. * np.pi / 180),
+    dict(name='vertical_tail', form_factor_type='wing', characteristic_length=5.5,
+        S_wet=55., interference_factor=1.04, t_c=0.1, x_t=0.3, sweep=35. * np.pi / 180),
+]
+
+
+class DragBuildupComp(ExplicitComponent):
+    """
+    Drag build-up over a table of components.
+
+    Every component k gets its own Reynolds number at each of the N flight
+    conditions, Re = density * speed * L_k / dynamic_viscosity, a skin
+    friction coefficient blending the laminar and turbulent (cutoff-limited)
+    values by its laminar fraction as in SkinFrictionGroup, a form factor from
+    the correlations of FormDragCo selected by its form-factor type, and
+
+        CD0_k = Cf_k * FF_k * Q_k * S_wet_k / S_ref
+
+    CD0 is the sum over the components. The per-component outputs have shape
+    shape + (num_components,), so adding a component only adds a column.
+
+    Options
+    -------
+    shape : tuple
+        Shape of the flight conditions.
+    components : list
+        One dict per component with its 'name', its 'form_factor_type'
+        (one of 'wing', 'body' or 'nacelle') and the default values of any
+        of the columns in component_columns.
+    rho : float
+        Aggregation parameter of the smooth minimum between Re and the
+        cutoff Reynolds number.
+    """
+
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('components', default=default_components, types=list)
+        self.options.declare('rho', default=1e-3, types=float)
+
+    def setup(self):
+        shape = self.options['shape']
+        components = self.options['components']
+
+        size = int(np.prod(shape))
+        num_components = len(components)
+        out_shape = shape + (num_components,)
+
+        for component in components:
+            if component['form_factor_type'] not in form_factor_types:
+                raise ValueError('Unknown form-factor type {} of component {}'.format(
+                    component['form_factor_type'], component['name']))
+
+        self.component_names = [component['name'] for component in components]
+        self.type_masks = {
+            ff_type: np.array([component['form_factor_type'] == ff_type for component in components])
+            for ff_type in form_factor_types
+        }
+
+        # flight conditions
+        self.add_input('density', shape=shape)
+        self.add_input('speed', shape=shape)
+        self.add_input('dynamic_viscosity', shape=shape)
+        self.add_input('Mach_number', shape=shape)
+        self.add_input('S_ref', val=157., shape=shape)
+
+        # component table
+        for column, default in component_columns.items():
+            val = [component.get(column, default) for component in components]
+            self.add_input('component_' + column, val=val, shape=(num_components,))
+
+        self.add_output('component_Re', shape=out_shape)
+        self.add_output('component_Cf', shape=out_shape)
+        self.add_output('component_FF', shape=out_shape)
+        self.add_output('component_CD0', shape=out_shape)
+        self.add_output('CD0', shape=shape)
+
+        # output (i, k) depends on flight condition i and component k
+        rows = np.arange(size * num_components)
+        condition_cols = np.repeat(np.arange(size), num_components)
+        component_cols = np.tile(np.arange(num_components), size)
+
+        # CD0 (i) depends on flight condition i and on every component
+        arange = np.arange(size)
+        sum_rows = np.repeat(arange, num_components)
+
+        dependencies = dict(
+            component_Re=(['density', 'speed', 'dynamic_viscosity'],
+                ['characteristic_length']),
+            component_Cf=(['density', 'speed', 'dynamic_viscosity', 'Mach_number'],
+                ['characteristic_length', 'laminar_fraction']),
+            component_FF=(['Mach_number'],
+                ['t_c', 'x_t', 'sweep', 'finesse_ratio']),
+            component_CD0=(['density', 'speed', 'dynamic_viscosity', 'Mach_number', 'S_ref'],
+                list(component_columns)),
+        )
+        for out_name, (condition_names, column_names) in dependencies.items():
+            for in_name in condition_names:
+                self.declare_partials(out_name, in_name, rows=rows, cols=condition_cols)
+            for column in column_names:
+                self.declare_partials(out_name, 'component_' + column,
+                    rows=rows, cols=component_cols)
+
+        condition_names, column_names = dependencies['component_CD0']
+        for in_name in condition_names:
+            self.declare_partials('CD0', in_name, rows=arange, cols=arange)
+        for column in column_names:
+            self.declare_partials('CD0', 'component_' + column,
+                rows=sum_rows, cols=component_cols)
+
+    def compute(self, inputs, outputs):
+        results = self._compute_buildup(inputs, derivs=False)
+
+        for name in ['Re', 'Cf', 'FF', 'CD0']:
+            outputs['component_' + name] = results[name]
+        outputs['CD0'] = np.sum(results['CD0'], axis=-1)
+
+    def compute_partials(self, inputs, partials):
+        results = self._compute_buildup(inputs)
+        derivs = results['derivs']
+
+        for (out_name, in_name), value in derivs.items():
+            partials['component_' + out_name, in_name] = value.flatten()
+
+        for (out_name, in_name), value in derivs.items():
+            if out_name != 'CD0':
+                continue
+            if in_name.startswith('component_'):
+                partials['CD0', in_name] = value.flatten()
+            else:
+                partials['CD0', in_name] = np.sum(value, axis=-1).flatten()
+
+    def _compute_buildup(self, inputs, derivs=True):
+        # flight conditions as (size, 1) columns against (num_components,) rows
+        size = int(np.prod(self.options['shape']))
+        shape = self.options['shape'] + (len(self.component_names),)
+        rho = self.options['rho']
+
+        density = inputs['density'].reshape((size, 1))
+        speed = inputs['speed'].reshape((size, 1))
+        mu = inputs['dynamic_viscosity'].reshape((size, 1))
+        mach = inputs['Mach_number'].reshape((size, 1))
+        S_ref = inputs['S_ref'].reshape((size, 1))
+
+        length = inputs['component_characteristic_length']
+        S_wet = inputs['component_S_wet']
+        Q = inputs['component_interference_factor']
+        laminar_fraction = inputs['component_laminar_fraction']
+
+        re = density * speed * length / mu
+        re_cutoff = compute_re_cutoffs(length, mach)
+        re_turbulent, dmin_dre, dmin_dcutoff = compute_ks_min(re, re_cutoff, rho)
+
+        cf_laminar = compute_laminar_cfs(re)
+        cf_turbulent = compute_turbulent_cfs(re_turbulent, mach)
+        cf = laminar_fraction * cf_laminar + (1 - laminar_fraction) * cf_turbulent
+
+        ff, dff = compute_form_factors(self.type_masks, mach,
+            inputs['component_t_c'], inputs['component_x_t'], inputs['component_sweep'],
+            inputs['component_finesse_ratio'], derivs=derivs)
+
+        cd0 = cf * ff * Q * S_wet / S_ref
+
+        results = dict(
+            Re=re.reshape(shape),
+            Cf=cf.reshape(shape),
+            FF=ff.reshape(shape),
+            CD0=cd0.reshape(shape),
+        )
+        if not derivs:
+            return results
+
+        # chain rule from Re and Mach through Cf to CD0
+        dcf_turbulent_dre_turbulent, dcf_turbulent_dmach = \
+            compute_turbulent_cf_derivs(re_turbulent, mach)
+
+        dcf_dre = laminar_fraction * compute_laminar_cf_derivs(re) \
+            + (1 - laminar_fraction) * dcf_turbulent_dre_turbulent * dmin_dre
+        dcf_dcutoff = (1 - laminar_fraction) * dcf_turbulent_dre_turbulent * dmin_dcutoff
+        dcutoff_dlength, dcutoff_dmach = compute_re_cutoff_derivs(length, mach)
+        dcf_dmach = (1 - laminar_fraction) * dcf_turbulent_dmach + dcf_dcutoff * dcutoff_dmach
+
+        dre = dict(
+            density=re / density,
+            speed=re / speed,
+            dynamic_viscosity=-re / mu,
+            component_characteristic_length=re / length,
+        )
+        dcf = {name: dcf_dre * value for name, value in dre.items()}
+        dcf['component_characteristic_length'] = dcf['component_characteristic_length'] \
+            + dcf_dcutoff * dcutoff_dlength
+        dcf['Mach_number'] = dcf_dmach
+        dcf['component_laminar_fraction'] = cf_laminar - cf_turbulent
+
+        dff = {
+            ('Mach_number' if name == 'mach' else 'component_' + name): value
+            for name, value in dff.items()
+        }
+
+        dcd0 = {}
+        for name in dcf:
+            dcd0[name] = dcf[name] * ff * Q * S_wet / S_ref
+        for name in dff:
+            dcd0[name] = dcd0.get(name, 0.) + cf * dff[name] * Q * S_wet / S_ref
+        dcd0['component_S_wet'] = cf * ff * Q / S_ref
+        dcd0['component_interference_factor'] = cf * ff * S_wet / S_ref
+        dcd0['S_ref'] = -cd0 / S_ref
+
+        derivs = {}
+        for out_name, values in [('Re', dre), ('Cf', dcf), ('FF', dff), ('CD0', dcd0)]:
+            for in_name, value in values.items():
+                derivs[out_name, in_name] = np.broadcast_to(value, cd0.shape)
+
+        results['derivs'] = derivs
+        return results
+
+
+# runs a test to see if calculated values make sense
+if __name__ == "__main__":
+    model = om.Group()
+    ivc = om.IndepVarComp()
+    ivc.add_output('density', 0.31)
+    ivc.add_output('speed', 250.)
+    ivc.add_output('dynamic_viscosity', 1.42e-5)
+    ivc.add_output('Mach_number', 0.85)
+    model.add_subsystem('des_vars', ivc, promotes=['*'])
+    model.add_subsystem('drag_buildup_comp', DragBuildupComp(), promotes=['*'])
+
+    prob = om.Problem(model)
+    prob.setup()
+    prob.run_model()
+
+    comp = prob.model.drag_buildup_comp
+    for ind, name in enumerate(comp.component_names):
+        print('{:<16} Re {:.3e}  Cf {:.5f}  FF {:.4f}  CD0 {:.5f}'.format(name,
+            prob['component_Re'][0, ind], prob['component_Cf'][0, ind],
+            prob['component_FF'][0, ind], prob['component_CD0'][0, ind]))
+    print('CD0', prob['CD0'])
@@ -9,32 +9,38 @@ import openmdao.api as om
 
 class FormDragCo(ExplicitComponent):
 
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+
     def setup(self):
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
+
         # inputs for wing form factor
 
-        self.add_input('t_c')
+        self.add_input('t_c', shape=shape)
         # # x_t is the position of maximum thickness
-        self.add_input('x_t', val = .30 )
-        self.add_input('Mach_number')
-        self.add_input('sweep')
-        self.add_output('FF_wing')
+        self.add_input('x_t', val = .30, shape=shape)
+        self.add_input('Mach_number', shape=shape)
+        self.add_input('sweep', shape=shape)
+        self.add_output('FF_wing', shape=shape)
 
         # inputs for fuselage form factor
         # finesse ratio is length / diameter of thing being looked at
-        self.add_input('fuselage_finesse_ratio')
-        self.add_output('FF_fuselage')
+        self.add_input('fuselage_finesse_ratio', shape=shape)
+        self.add_output('FF_fuselage', shape=shape)
         # # inputs for nacelle form factor
         # self.add_input('nacelle_finesse_ratio')
         # self.add_output('FF_nacelle')
         # declare partials for FF_wing with respect to t_c, mach, x_t, and sweep angle
 
-        self.declare_partials('FF_wing', 't_c')
-        self.declare_partials('FF_wing', 'Mach_number')
-        self.declare_partials('FF_wing', 'x_t')
-        self.declare_partials('FF_wing', 'sweep')
+        self.declare_partials('FF_wing', 't_c', rows=arange, cols=arange)
+        self.declare_partials('FF_wing', 'Mach_number', rows=arange, cols=arange)
+        self.declare_partials('FF_wing', 'x_t', rows=arange, cols=arange)
+        self.declare_partials('FF_wing', 'sweep', rows=arange, cols=arange)
 
         # declare partials for FF_fuselage with respect to its finesse ratio
-        self.declare_partials('FF_fuselage', 'fuselage_finesse_ratio')
+        self.declare_partials('FF_fuselage', 'fuselage_finesse_ratio', rows=arange, cols=arange)
         # declare partials for FF_nacelle with respect to its finesse ratio
         # self.declare_partials('FF_nacelle', 'nacelle_finesse_ratio')
         
@@ -55,19 +61,19 @@ class FormDragCo(ExplicitComponent):
         # outputs['FF_nacelle'] = 1 + (0.35/nacelle_finesse_ratio)
 
     def compute_partials(self, inputs, partials):
-        t_c = inputs['t_c']
-        x_t = inputs['x_t']
-        Mach_number = inputs['Mach_number']
-        sweep = inputs['sweep']
+        t_c = inputs['t_c'].flatten()
+        x_t = inputs['x_t'].flatten()
+        Mach_number = inputs['Mach_number'].flatten()
+        sweep = inputs['sweep'].flatten()
         # fuselage terms
-        fuselage_finesse_ratio = inputs['fuselage_finesse_ratio']
+        fuselage_finesse_ratio = inputs['fuselage_finesse_ratio'].flatten()
         # nacelle terms
         # nacelle_finesse_ratio = inputs['nacelle_finesse_ratio']
 
 
         partials['FF_wing', 't_c'] = 536*Mach_number**0.18 *np.cos(sweep)**0.28 * (t_c**3 *x_t + 0.0015)/x_t
         partials['FF_wing', 'x_t'] = -0.804*t_c*Mach_number**0.18 *np.cos(sweep)**0.28 / x_t**2
-        partials['FF_wing', 'Mach_number'] = 0.2412*np.cos(sweep)**0.28 * (1+ (0.6/x_t)*(t_c) + 100 *t_c**4)
+        partials['FF_wing', 'Mach_number'] = 0.2412*Mach_number**-0.82 *np.cos(sweep)**0.28 * (1+ (0.6/x_t)*(t_c) + 100 *t_c**4)
         partials['FF_wing', 'sweep'] = -0.3752*Mach_number**0.18*np.sin(sweep) * (1+ (0.6/x_t)*(t_c) + 100 *t_c**4) / np.cos(sweep)**0.72
 
         partials['FF_fuselage', 'fuselage_finesse_ratio'] = -180 / (fuselage_finesse_ratio**4) + 1/400
@@ -0,0 +1,65 @@
+import numpy as np
+from openmdao.api import ExplicitComponent
+import openmdao.api as om
+
+from .utils import skin_friction_roughness, default_blend_width
+from .utils import compute_re_cutoffs, compute_re_cutoff_derivs
+
+#
+#    Computes the cutoff Reynolds number for the skin roughness, blending the subsonic and
+#    transonic correlations with a smooth step in the Mach number around Mach 0.9, so the
+#    regime follows the Mach_number input at run time and stays differentiable
+#
+
+class ReCutoffComp(ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('skin_friction_roughness', default=skin_friction_roughness, types=float)
+        self.options.declare('blend_width', default=default_blend_width, types=float)
+
+    def setup(self):
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
+
+        self.add_input('characteristic_length', shape=shape)
+        self.add_input('Mach_number', shape=shape)
+        self.add_output('Re_cutoff', shape=shape)
+
+        self.declare_partials('Re_cutoff', 'characteristic_length', rows=arange, cols=arange)
+        self.declare_partials('Re_cutoff', 'Mach_number', rows=arange, cols=arange)
+
+    def compute(self, inputs, outputs):
+        roughness = self.options['skin_friction_roughness']
+        blend_width = self.options['blend_width']
+
+        outputs['Re_cutoff'] = compute_re_cutoffs(inputs['characteristic_length'],
+            inputs['Mach_number'], roughness, blend_width)
+
+    def compute_partials(self, inputs, partials):
+        roughness = self.options['skin_friction_roughness']
+        blend_width = self.options['blend_width']
+
+        dcutoff_dlength, dcutoff_dmach = compute_re_cutoff_derivs(
+            inputs['characteristic_length'].flatten(), inputs['Mach_number'].flatten(),
+            roughness, blend_width)
+
+        partials['Re_cutoff', 'characteristic_length'] = dcutoff_dlength
+        partials['Re_cutoff', 'Mach_number'] = dcutoff_dmach
+
+# runs a test to see if calculated values make sense
+if __name__ == "__main__":
+    model = om.Group()
+    ivc = om.IndepVarComp()
+    ivc.add_output('characteristic_length', 5. * np.ones(7))
+    ivc.add_output('Mach_number', np.linspace(0.6, 1.2, 7))
+    model.add_subsystem('des_vars', ivc, promotes=['*'])
+    model.add_subsystem('re_cutoff_comp', ReCutoffComp(shape=(7,)), promotes=['*'])
+
+    prob = om.Problem(model)
+    prob.setup()
+    prob.run_model()
+    print('Mach_number')
+    print(prob['Mach_number'])
+    print('Re_cutoff')
+    print(prob['Re_cutoff'])
@@ -10,33 +10,39 @@ import openmdao.api as om
 
 class SWet(ExplicitComponent):
 
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+
     def setup(self):
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
+
         # inputs for S_wet_fuselage
 
-        self.add_input('d_f', val= 6.2) # diameter for fuselage
-        self.add_input('l_f', val = 73.9) # length for fuselage
-        self.add_input('ln_lf', val = 15.) # The distance from the aircraft nose in x direction to the start of the cylindrical part of the fuselage / l_f
+        self.add_input('d_f', val= 6.2, shape=shape) # diameter for fuselage
+        self.add_input('l_f', val = 73.9, shape=shape) # length for fuselage
+        self.add_input('ln_lf', val = 15., shape=shape) # The distance from the aircraft nose in x direction to the start of the cylindrical part of the fuselage / l_f
         #  ln_lf just meant to make the partial later easier
-        self.add_input('fuselage_finesse_ratio', val = 73.9/6.2) # finesse ratio is length / diameter of thing being looked at
-        self.add_output('S_wet_f')
+        self.add_input('fuselage_finesse_ratio', val = 73.9/6.2, shape=shape) # finesse ratio is length / diameter of thing being looked at
+        self.add_output('S_wet_f', shape=shape)
 
         # inputs for S_wet_wing
-        self.add_input('S_w', val = 157.) # Exposed wing area (without including fuselage)
-        self.add_input('taper', val = .3) # chord tip / chord root
-        self.add_input('t_c', val = 0.14) # thickness to chord ratio at root
-        self.add_input('t_c_ratio', val = 1.) # t/c of tip / t/c of root
-        self.add_output('S_wet_w')
-
-        # declare partials for wetted areas
-        self.declare_partials('S_wet_f', 'd_f')
-        self.declare_partials('S_wet_f', 'l_f')
-        self.declare_partials('S_wet_f', 'ln_lf')
-        self.declare_partials('S_wet_f', 'fuselage_finesse_ratio')
-
-        self.declare_partials('S_wet_w', 'S_w')
-        self.declare_partials('S_wet_w', 'taper')
-        self.declare_partials('S_wet_w', 't_c')
-        self.declare_partials('S_wet_w', 't_c_ratio')
+        self.add_input('S_w', val = 157., shape=shape) # Exposed wing area (without including fuselage)
+        self.add_input('taper', val = .3, shape=shape) # chord tip / chord root
+        self.add_input('t_c', val = 0.14, shape=shape) # thickness to chord ratio at root
+        self.add_input('t_c_ratio', val = 1., shape=shape) # t/c of tip / t/c of root
+        self.add_output('S_wet_w', shape=shape)
+
+        # declare partials for wetted areas, each point only depends on its own inputs
+        self.declare_partials('S_wet_f', 'd_f', rows=arange, cols=arange)
+        self.declare_partials('S_wet_f', 'l_f', rows=arange, cols=arange)
+        self.declare_partials('S_wet_f', 'ln_lf', rows=arange, cols=arange)
+        self.declare_partials('S_wet_f', 'fuselage_finesse_ratio', rows=arange, cols=arange)
+
+        self.declare_partials('S_wet_w', 'S_w', rows=arange, cols=arange)
+        self.declare_partials('S_wet_w', 'taper', rows=arange, cols=arange)
+        self.declare_partials('S_wet_w', 't_c', rows=arange, cols=arange)
+        self.declare_partials('S_wet_w', 't_c_ratio', rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
         d_f = inputs['d_f']
@@ -53,15 +59,15 @@ class SWet(ExplicitComponent):
         outputs['S_wet_w'] = 2 * S_w * (1 + 0.25 * t_c * ( (1 + t_c_ratio * taper) /(1 + taper) ))
 
     def compute_partials(self, inputs, partials):
-        d_f = inputs['d_f']
-        l_f = inputs['l_f']
-        ln_lf = inputs['ln_lf']
-        fuselage_finesse_ratio = inputs['fuselage_finesse_ratio']
-
-        S_w = inputs['S_w']
-        taper = inputs['taper']  
-        t_c = inputs['t_c']   
-        t_c_ratio = inputs['t_c_ratio']
+        d_f = inputs['d_f'].flatten()
+        l_f = inputs['l_f'].flatten()
+        ln_lf = inputs['ln_lf'].flatten()
+        fuselage_finesse_ratio = inputs['fuselage_finesse_ratio'].flatten()
+
+        S_w = inputs['S_w'].flatten()
+        taper = inputs['taper'].flatten()
+        t_c = inputs['t_c'].flatten()
+        t_c_ratio = inputs['t_c_ratio'].flatten()
 
         partials['S_wet_f', 'd_f'] = np.pi * l_f * (0.5 + 0.135*ln_lf)**(2/3) * (1.015+0.3/(fuselage_finesse_ratio**1.5))
         partials['S_wet_f', 'l_f'] = np.pi * d_f * (0.5 + 0.135*ln_lf)**(2/3) * (1.015+0.3/(fuselage_finesse_ratio**1.5))
@@ -5,18 +5,21 @@ import openmdao.api as om
 from openmdao.api import Group,Problem
 from lsdo_utils.api import OptionsDictionary, LinearCombinationComp, PowerCombinationComp, GeneralOperationComp, ElementwiseMinComp
 
+from .re_cutoff_comp import ReCutoffComp
+from .utils import skin_friction_roughness, default_blend_width
+
 
 class SkinFrictionGroup(Group):
 
     def initialize(self):
         self.options.declare('shape', types=tuple)
+        self.options.declare('skin_friction_roughness', default=skin_friction_roughness, types=float)
+        self.options.declare('mach_blend_width', default=default_blend_width, types=float)
         
     def setup(self):
         shape = self.options['shape']
 
-        skin_friction_roughness = 0.4e-5 
         laminar_pctg = 5
-        Mach_number = 0.85 
 
         # comp = IndepVarComp()
         # comp.add_output('speed', val = 250.)
@@ -37,30 +40,14 @@ class SkinFrictionGroup(Group):
             ),
         )
         self.add_subsystem('Re_comp', comp, promotes=['*'])
-        # creates component for calculating Re_Cutoff for subsonic and sonic flows
-        if Mach_number < 0.9:
-            comp = PowerCombinationComp(
-                shape=shape,
-                out_name='Re_cutoff',
-                coeff=38.21 * skin_friction_roughness ** -1.053,
-                powers_dict=dict(
-                    characteristic_length=1.053,
-                ),
-            )
-            self.add_subsystem('Re_cutoff_comp', comp, promotes=['*'])
-        elif Mach_number > 0.9:
-            comp = PowerCombinationComp(
-                shape=shape,
-                out_name='Re_cutoff',
-                coeff=44.62 * skin_friction_roughness ** -1.053,
-                powers_dict=dict(
-                    characteristic_length=1.053,
-                    Mach_number=1.16,
-                ),
-            )
-            self.add_subsystem('Re_cutoff_comp', comp, promotes=['*'])
-        else:
-            raise Exception()
+        # creates component for calculating Re_Cutoff, blending the subsonic and transonic
+        # formulas on the Mach_number input so one set-up problem can sweep across regimes
+        comp = ReCutoffComp(
+            shape=shape,
+            skin_friction_roughness=self.options['skin_friction_roughness'],
+            blend_width=self.options['mach_blend_width'],
+        )
+        self.add_subsystem('Re_cutoff_comp', comp, promotes=['*'])
         # creates component for determining whether to use Re_cutoff or Re for later use in calculating Cf
         comp = ElementwiseMinComp(
             shape=shape, 
@@ -0,0 +1,107 @@
+import unittest
+
+import numpy as np
+
+from .drag_buildup_comp import DragBuildupComp, default_components
+from .form_drag_co import FormDragCo
+from .zero_lift_group import ZeroLiftGroup
+
+from openmdao.api import Problem
+from ..complex_step import setup_problem, check_partials, check_totals
+
+from openmdao.utils.assert_utils import assert_near_equal
+
+#  test for the component drag build-up
+
+def build_problem(components=default_components, size=4):
+    prob = Problem()
+    prob.model.add_subsystem('comp', DragBuildupComp(shape=(size,), components=components),
+        promotes=['*'])
+    setup_problem(prob)
+
+    prob['density'] = np.linspace(1.2, 0.3, size)
+    prob['speed'] = np.linspace(100., 250., size)
+    prob['dynamic_viscosity'] = np.linspace(1.8e-5, 1.4e-5, size)
+    prob['Mach_number'] = np.linspace(0.3, 0.85, size)
+    return prob
+
+
+class TestDragBuildupComp(unittest.TestCase):
+
+    def test_derivatives(self):
+        prob = build_problem()
+        # a short component at high speed puts the smooth minimum on the cutoff Reynolds number
+        prob['component_characteristic_length'][2] = 0.5
+        prob['speed'][0] = 400.
+        prob.run_model()
+
+        # Re and its partials span many orders of magnitude, so only relative errors are checked
+        data = check_partials(prob, out_stream=None)
+        for key, pair_data in data['comp'].items():
+            rel_error = pair_data['rel error'].forward
+            if not np.isnan(rel_error):
+                self.assertLess(rel_error, 1e-6, key)
+
+    def test_form_factors(self):
+        prob = build_problem(size=1)
+        prob.run_model()
+
+        ff_prob = Problem()
+        ff_prob.model = FormDragCo()
+        ff_prob.setup()
+        ff_prob['Mach_number'] = prob['Mach_number']
+        ff_prob['t_c'] = prob['component_t_c'][0]
+        ff_prob['x_t'] = prob['component_x_t'][0]
+        ff_prob['sweep'] = prob['component_sweep'][0]
+        ff_prob['fuselage_finesse_ratio'] = prob['component_finesse_ratio'][1]
+        ff_prob.run_model()
+
+        assert_near_equal(prob['component_FF'][0, 0], ff_prob['FF_wing'][0], 1e-12)
+        assert_near_equal(prob['component_FF'][0, 1], ff_prob['FF_fuselage'][0], 1e-12)
+        assert_near_equal(prob['component_FF'][0, 2],
+            1 + 0.35 / prob['component_finesse_ratio'][2], 1e-12)
+
+    def test_sum(self):
+        prob = build_problem()
+        prob.run_model()
+
+        assert_near_equal(prob['CD0'], np.sum(prob['component_CD0'], axis=1), 1e-12)
+        assert_near_equal(prob['component_CD0'],
+            prob['component_Cf'] * prob['component_FF']
+            * prob['component_interference_factor'] * prob['component_S_wet']
+            / prob['S_ref'][:, None], 1e-12)
+
+    def test_more_components(self):
+        # extra components only add columns to the same single component
+        components = default_components + [
+            dict(name='pylon_{}'.format(ind), form_factor_type='wing', characteristic_length=2.,
+                S_wet=10., t_c=0.08, interference_factor=1.1)
+            for ind in range(4)
+        ]
+        prob = build_problem(components)
+        prob.run_model()
+
+        self.assertEqual(prob['component_CD0'].shape, (4, 10))
+        self.assertEqual(len(list(prob.model.system_iter(recurse=True))), 2)
+
+        base_prob = build_problem()
+        base_prob.run_model()
+        assert_near_equal(prob['component_CD0'][:, :6], base_prob['component_CD0'], 1e-12)
+
+    def test_zero_lift_group(self):
+        prob = Problem()
+        prob.model.add_subsystem('zero_lift_group',
+            ZeroLiftGroup(shape=(3,), buildup_table=default_components), promotes=['*'])
+        setup_problem(prob)
+        prob.run_model()
+
+        assert_near_equal(prob['zero_lift_group.drag_buildup_comp.S_ref'], prob['S_w'], 1e-15)
+        assert_near_equal(prob['Mach_number'], prob['speed'] / prob['sonic_speed'], 1e-12)
+
+        data = check_totals(prob, of=['CD0'], wrt=['altitude', 'speed', 'S_w'], out_stream=None)
+        for key, pair_data in data.items():
+            self.assertLess(pair_data['rel error'].forward, 1e-6, key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+
+from .re_cutoff_comp import ReCutoffComp
+from .utils import skin_friction_roughness
+
+from openmdao.api import Problem
+from ..complex_step import setup_problem, check_partials
+
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+#  test for the Mach-blended cutoff Reynolds number
+
+class TestReCutoffComp(unittest.TestCase):
+
+    def setUp(self):
+        self.mach = np.array([0.6, 0.85, 0.89, 0.9, 0.91, 0.95, 1.2])
+
+        self.prob = Problem()
+        self.prob.model = ReCutoffComp(shape=self.mach.shape)
+        setup_problem(self.prob)
+        self.prob['characteristic_length'] = 5.
+        self.prob['Mach_number'] = self.mach
+        self.prob.run_model()
+
+    def test_derivatives(self):
+        data = check_partials(self.prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-3, rtol=1.e-6)
+
+    def test_regimes(self):
+        length_ratio = 5. / skin_friction_roughness
+        subsonic = 38.21 * length_ratio ** 1.053
+        transonic = 44.62 * length_ratio ** 1.053 * self.mach ** 1.16
+
+        Re_cutoff = self.prob['Re_cutoff']
+        assert_near_equal(Re_cutoff[:2], subsonic * np.ones(2), 1e-5)
+        assert_near_equal(Re_cutoff[-2:], transonic[-2:], 1e-5)
+        assert_near_equal(Re_cutoff[3], 0.5 * (subsonic + transonic[3]), 1e-12)
+
+    def test_sweep_without_setup(self):
+        # the regime follows the input, so one set-up problem covers the whole sweep
+        for mach in [0.6, 1.2, 0.6]:
+            self.prob['Mach_number'] = mach
+            self.prob.run_model()
+
+            fresh_prob = Problem()
+            fresh_prob.model = ReCutoffComp(shape=self.mach.shape)
+            fresh_prob.setup()
+            fresh_prob['characteristic_length'] = 5.
+            fresh_prob['Mach_number'] = mach
+            fresh_prob.run_model()
+
+            assert_near_equal(self.prob['Re_cutoff'], fresh_prob['Re_cutoff'], 1e-15)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+
+import numpy as np
+
+from .s_wet import SWet
+from .form_drag_co import FormDragCo
+from .wave_drag_co import WaveDragCo
+
+from openmdao.api import Problem
+from ..complex_step import setup_problem, check_partials
+
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+#  tests for the shape-aware zero-lift-drag components
+
+inputs_dict = {
+    SWet: dict(
+        d_f=(5., 7.),
+        l_f=(60., 80.),
+        ln_lf=(10., 20.),
+        fuselage_finesse_ratio=(8., 12.),
+        S_w=(120., 180.),
+        taper=(0.2, 0.4),
+        t_c=(0.1, 0.15),
+        t_c_ratio=(0.8, 1.2),
+    ),
+    FormDragCo: dict(
+        t_c=(0.1, 0.15),
+        x_t=(0.25, 0.35),
+        Mach_number=(0.6, 0.9),
+        sweep=(0.2, 0.6),
+        fuselage_finesse_ratio=(8., 12.),
+    ),
+    WaveDragCo: dict(
+        mach_number=(0.88, 0.95),
+        critical_mach_number=(0.7, 0.75),
+    ),
+}
+
+
+def build_problem(comp_class, size, seed=0):
+    np.random.seed(seed)
+
+    prob = Problem()
+    prob.model.add_subsystem('comp', comp_class(shape=(size,)), promotes=['*'])
+    setup_problem(prob)
+
+    for name, (lower, upper) in inputs_dict[comp_class].items():
+        prob[name] = np.random.uniform(lower, upper, size)
+
+    return prob
+
+
+class TestVectorizedDragComps(unittest.TestCase):
+
+    def test_derivatives(self):
+        for comp_class in inputs_dict:
+            prob = build_problem(comp_class, 5)
+            prob.run_model()
+
+            data = check_partials(prob, out_stream=None)
+            assert_check_partials(data, atol=1.e-3, rtol=1.e-3)
+
+    def test_matches_scalar(self):
+        for comp_class in inputs_dict:
+            prob = build_problem(comp_class, 10)
+            prob.run_model()
+
+            for ind in range(10):
+                scalar_prob = Problem()
+                scalar_prob.model.add_subsystem('comp', comp_class(), promotes=['*'])
+                scalar_prob.setup()
+                for name in inputs_dict[comp_class]:
+                    scalar_prob[name] = prob[name][ind]
+                scalar_prob.run_model()
+
+                for name in scalar_prob.model.comp._var_rel_names['output']:
+                    assert_near_equal(prob[name][ind], scalar_prob[name][0], 1e-12)
+
+    def test_scaling(self):
+        # partials stay diagonal, so the Jacobian storage is linear in N
+        for size in [1, 1000, 1000000]:
+            for comp_class in inputs_dict:
+                prob = build_problem(comp_class, size)
+                prob.run_model()
+                prob.model.run_linearize()
+
+                for key, meta in prob.model.comp._subjacs_info.items():
+                    self.assertEqual(meta['val'].size, size)
+
+                for name in prob.model.comp._var_rel_names['output']:
+                    self.assertTrue(np.all(np.isfinite(prob[name])))
+
+
+if __name__ == '__main__':
+    unittest.main()
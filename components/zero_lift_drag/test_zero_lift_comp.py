@@ -0,0 +1,133 @@
+import unittest
+
+import numpy as np
+
+from .zero_lift_comp import ZeroLiftComp, input_defaults
+from .zero_lift_group import ZeroLiftGroup
+from .atmosphere_group import AtmosphereGroup
+from .re_cutoff_comp import ReCutoffComp
+from .s_wet import SWet
+from .form_drag_co import FormDragCo
+from .utils import compute_ks_min
+
+from openmdao.api import Problem, Group, ExplicitComponent, ExecComp, IndepVarComp
+from ..complex_step import setup_problem, check_partials
+
+from openmdao.utils.assert_utils import assert_near_equal
+
+#  test for the fused zero-lift drag component
+
+class MinComp(ExplicitComponent):
+    # stands in for the ElementwiseMinComp of SkinFrictionGroup
+
+    def initialize(self):
+        self.options.declare('shape', types=tuple)
+
+    def setup(self):
+        shape = self.options['shape']
+        self.add_input('Re', shape=shape)
+        self.add_input('Re_cutoff', shape=shape)
+        self.add_output('Re_turbulent_min', shape=shape)
+
+    def compute(self, inputs, outputs):
+        outputs['Re_turbulent_min'] = compute_ks_min(inputs['Re'], inputs['Re_cutoff'], 1e-3)[0]
+
+
+class ZeroLiftChainGroup(Group):
+    """
+    The subsystem chain of ZeroLiftGroup, with ExecComps in place of the
+    lsdo_utils components.
+    """
+
+    def initialize(self):
+        self.options.declare('shape', types=tuple)
+
+    def setup(self):
+        shape = self.options['shape']
+
+        comp = IndepVarComp()
+        for name, val in input_defaults.items():
+            comp.add_output(name, val=val, shape=shape)
+        self.add_subsystem('inputs_comp', comp, promotes=['*'])
+
+        self.add_subsystem('atmosphere_group', AtmosphereGroup(shape=shape),
+            promotes=[('v', 'speed'), '*'])
+        self.add_subsystem('Re_comp', ExecComp(
+            'Re = density * speed * characteristic_length / dynamic_viscosity', shape=shape),
+            promotes=['*'])
+        self.add_subsystem('Re_cutoff_comp', ReCutoffComp(shape=shape), promotes=['*'])
+        self.add_subsystem('Re_turbulent_min_comp', MinComp(shape=shape), promotes=['*'])
+        self.add_subsystem('skin_friction_coeff_comp', ExecComp(
+            'skin_friction_coeff = 0.05 * 1.328 * Re ** -0.5'
+            ' + 0.95 * 0.455 / (log(Re_turbulent_min) / log(10)) ** 2.58'
+            ' / (1 + 0.144 * Mach_number ** 2) ** 0.65', shape=shape),
+            promotes=['*'])
+        self.add_subsystem('wetted_area_comp', SWet(shape=shape), promotes=['*'])
+        self.add_subsystem('form_drag_comp', FormDragCo(shape=shape), promotes=['*'])
+        self.add_subsystem('C0_comp', ExecComp([
+            'C0_wing = skin_friction_coeff * S_wet_w * FF_wing / S_w * interference_factor',
+            'C0_fuselage = skin_friction_coeff * S_wet_f * FF_fuselage / S_f * interference_factor',
+            ], shape=shape),
+            promotes=['*'])
+        self.add_subsystem('CD0', ExecComp('CD0 = C0_wing + C0_fuselage', shape=shape),
+            promotes=['*'])
+
+
+def build_problem(model_class, size=4):
+    shape = (size,)
+
+    prob = Problem()
+    prob.model.add_subsystem('model', model_class(shape=shape), promotes=['*'])
+    setup_problem(prob)
+
+    prob['altitude'] = np.linspace(0., 12000., size)
+    prob['speed'] = np.linspace(100., 300., size)
+    prob['characteristic_length'] = 5.
+    prob['S_w'] = 157.
+    prob['S_f'] = 2000.
+    prob['t_c'] = 0.13
+    prob['sweep'] = 22.5 * np.pi / 180
+    prob['fuselage_finesse_ratio'] = 8.
+    prob['interference_factor'] = 1.
+    prob.run_model()
+    return prob
+
+
+class TestZeroLiftComp(unittest.TestCase):
+
+    def test_derivatives(self):
+        prob = build_problem(ZeroLiftComp)
+        # a short component at high speed puts the smooth minimum on the cutoff Reynolds number
+        prob['characteristic_length'][-1] = 0.5
+        prob.run_model()
+
+        # C0_wing does not depend on S_w, so only relative errors of nonzero partials are checked
+        data = check_partials(prob, out_stream=None)
+        for key, pair_data in data['model'].items():
+            if pair_data['magnitude'].fd > 1e-12:
+                self.assertLess(pair_data['rel error'].forward, 1e-6, key)
+
+    def test_matches_chain(self):
+        prob = build_problem(ZeroLiftComp)
+        chain_prob = build_problem(ZeroLiftChainGroup)
+
+        for name in ['C0_wing', 'C0_fuselage', 'CD0']:
+            assert_near_equal(prob[name], chain_prob[name], 1e-12)
+
+    def test_zero_lift_group(self):
+        prob = Problem()
+        prob.model.add_subsystem('zero_lift_group', ZeroLiftGroup(shape=(3,), fused=True),
+            promotes=['*'])
+        prob.setup()
+        prob.run_model()
+
+        chain_prob = build_problem(ZeroLiftChainGroup, size=3)
+        chain_prob['altitude'] = 12000.
+        chain_prob['speed'] = 250.
+        chain_prob.run_model()
+
+        assert_near_equal(prob['CD0'], chain_prob['CD0'], 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
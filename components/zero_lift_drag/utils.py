@@ -0,0 +1,112 @@
+from __future__ import division
+import numpy as np
+
+
+# Roughness of the skin [m], as in SkinFrictionGroup
+skin_friction_roughness = 0.4e-5
+
+# Mach number between the subsonic and transonic cutoff Reynolds numbers
+transonic_mach = 0.9
+
+# Half-width [Mach] of the smooth blend between the two cutoff correlations
+default_blend_width = 0.01
+
+# Form-factor correlations available to the drag build-up
+form_factor_types = ['wing', 'body', 'nacelle']
+
+# functions
+def compute_ks_min(a, b, rho):
+    """
+    Smooth (Kreisselmeier-Steinhauser) elementwise minimum of a and b, with
+    its derivatives with respect to a and b.
+    """
+    # the branch only looks at the real part so that complex step passes through
+    min_ab = np.where(np.real(a) < np.real(b), a, b)
+    exp_a = np.exp(-rho * (a - min_ab))
+    exp_b = np.exp(-rho * (b - min_ab))
+    sum_exp = exp_a + exp_b
+
+    value = min_ab - np.log(sum_exp) / rho
+    return value, exp_a / sum_exp, exp_b / sum_exp
+
+def compute_mach_blend(mach, blend_width):
+    # weight of the transonic cutoff, a smooth step from 0 to 1 around Mach 0.9
+    return 0.5 + 0.5 * np.tanh((mach - transonic_mach) / blend_width)
+
+def compute_mach_blend_derivs(mach, blend_width):
+    return 0.5 / blend_width / np.cosh((mach - transonic_mach) / blend_width) ** 2
+
+def compute_re_cutoffs(length, mach, roughness=skin_friction_roughness,
+        blend_width=default_blend_width):
+    """
+    Cutoff Reynolds number for the skin roughness, blending the subsonic and
+    transonic correlations smoothly around Mach 0.9 instead of switching.
+    """
+    weight = compute_mach_blend(mach, blend_width)
+    subsonic = 38.21 * (length / roughness) ** 1.053
+    transonic = 44.62 * (length / roughness) ** 1.053 * mach ** 1.16
+    return (1 - weight) * subsonic + weight * transonic
+
+def compute_re_cutoff_derivs(length, mach, roughness=skin_friction_roughness,
+        blend_width=default_blend_width):
+    """
+    Returns the derivatives of compute_re_cutoffs with respect to length and mach.
+    """
+    weight = compute_mach_blend(mach, blend_width)
+    subsonic = 38.21 * (length / roughness) ** 1.053
+    transonic = 44.62 * (length / roughness) ** 1.053 * mach ** 1.16
+
+    dcutoff_dlength = 1.053 / length * ((1 - weight) * subsonic + weight * transonic)
+    dcutoff_dmach = compute_mach_blend_derivs(mach, blend_width) * (transonic - subsonic) \
+        + weight * 1.16 * transonic / mach
+    return dcutoff_dlength, dcutoff_dmach
+
+def compute_laminar_cfs(re):
+    return 1.328 * re ** -0.5
+
+def compute_laminar_cf_derivs(re):
+    return -0.664 * re ** -1.5
+
+def compute_turbulent_cfs(re, mach):
+    return 0.455 / np.log10(re) ** 2.58 / (1 + 0.144 * mach ** 2) ** 0.65
+
+def compute_turbulent_cf_derivs(re, mach):
+    dcf_dre = -2.58 * 0.455 / np.log10(re) ** 3.58 / re / np.log(10) \
+        / (1 + 0.144 * mach ** 2) ** 0.65
+    dcf_dmach = 0.455 / np.log10(re) ** 2.58 \
+        * -0.65 / (1 + 0.144 * mach ** 2) ** 1.65 * 2 * 0.144 * mach
+    return dcf_dre, dcf_dmach
+
+def compute_form_factors(type_masks, mach, t_c, x_t, sweep, finesse_ratio, derivs=True):
+    """
+    Evaluates the wing, body and nacelle form-factor correlations of FormDragCo
+    for every component at once, selecting the right one with type_masks.
+
+    type_masks maps each name in form_factor_types to a boolean array over the
+    components. mach broadcasts against the component arrays. Returns the form
+    factors and, if derivs is True, a dict of their derivatives with respect to
+    'mach', 't_c', 'x_t', 'sweep' and 'finesse_ratio'.
+    """
+    wing_mask = type_masks['wing']
+    body_mask = type_masks['body']
+    nacelle_mask = type_masks['nacelle']
+
+    thickness_term = 1 + 0.6 / x_t * t_c + 100 * t_c ** 4
+    mach_term = 1.34 * mach ** 0.18 * np.cos(sweep) ** 0.28
+
+    form_factor = wing_mask * thickness_term * mach_term \
+        + body_mask * (1 + 60 / finesse_ratio ** 3 + finesse_ratio / 400) \
+        + nacelle_mask * (1 + 0.35 / finesse_ratio)
+
+    if not derivs:
+        return form_factor, None
+
+    form_factor_derivs = dict(
+        mach=wing_mask * thickness_term * 0.18 * mach_term / mach,
+        t_c=wing_mask * (0.6 / x_t + 400 * t_c ** 3) * mach_term,
+        x_t=wing_mask * -0.6 * t_c / x_t ** 2 * mach_term,
+        sweep=wing_mask * thickness_term * -0.28 * mach_term * np.tan(sweep),
+        finesse_ratio=body_mask * (-180 / finesse_ratio ** 4 + 1. / 400)
+            + nacelle_mask * -0.35 / finesse_ratio ** 2,
+    )
+    return form_factor, form_factor_derivs
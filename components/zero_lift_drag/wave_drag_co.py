@@ -9,24 +9,30 @@ import openmdao.api as om
 
 class WaveDragCo(ExplicitComponent):
 
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+
     def setup(self):
-        self.add_input('mach_number')
-        self.add_input('critical_mach_number')
-        self.add_output('wave_drag_co')
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
+
+        self.add_input('mach_number', shape=shape)
+        self.add_input('critical_mach_number', shape=shape)
+        self.add_output('wave_drag_co', shape=shape)
 
 
-        self.declare_partials('wave_drag_co', 'mach_number')
-        self.declare_partials('wave_drag_co', 'critical_mach_number')
+        self.declare_partials('wave_drag_co', 'mach_number', rows=arange, cols=arange)
+        self.declare_partials('wave_drag_co', 'critical_mach_number', rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
         d_mach = inputs['mach_number'] - inputs['critical_mach_number']
-        d_mach *= d_mach > 0.1
+        d_mach = d_mach * (d_mach.real > 0.1)
 
         outputs['wave_drag_co'] = 20. * d_mach ** 4
 
     def compute_partials(self, inputs, partials):
         d_mach = (inputs['mach_number'] - inputs['critical_mach_number']).flatten()
-        d_mach *= d_mach > 0.1
+        d_mach = d_mach * (d_mach.real > 0.1)
 
         partials['wave_drag_co', 'mach_number'] = 80. * d_mach ** 3
         partials['wave_drag_co', 'critical_mach_number'] = -80. * d_mach ** 3
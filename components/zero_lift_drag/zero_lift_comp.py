@@ -0,0 +1,212 @@
+import numpy as np
+from openmdao.api import ExplicitComponent
+import openmdao.api as om
+
+from atmosphere.utils import compute_atmosphere
+from .utils import skin_friction_roughness, default_blend_width, compute_ks_min
+from .utils import compute_re_cutoffs, compute_re_cutoff_derivs
+from .utils import compute_laminar_cfs, compute_laminar_cf_derivs
+from .utils import compute_turbulent_cfs, compute_turbulent_cf_derivs
+from .utils import compute_form_factors
+
+#
+#    Computes the zero-lift drag coefficient of the wing and fuselage in one pass: the same
+#    atmosphere, skin friction, wetted area, form factor and C0 equations as the subsystems
+#    of ZeroLiftGroup, with the Jacobian chained analytically inside the component
+#
+
+# default value of every input, as in the ZeroLiftGroup inputs_comp, SWet and FormDragCo
+input_defaults = dict(
+    altitude=12000.,
+    speed=250.,
+    t_c=.13,
+    sweep=22.5 * np.pi / 180,
+    S_w=157.,
+    S_f=2000.,
+    fuselage_finesse_ratio=8.,
+    characteristic_length=5.,
+    interference_factor=1.,
+    x_t=.30,
+    d_f=6.2,
+    l_f=73.9,
+    ln_lf=15.,
+    taper=.3,
+    t_c_ratio=1.,
+)
+
+wing_mask = dict(wing=1., body=0., nacelle=0.)
+body_mask = dict(wing=0., body=1., nacelle=0.)
+
+
+class ZeroLiftComp(ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('laminar_pctg', default=5., types=float)
+        self.options.declare('skin_friction_roughness', default=skin_friction_roughness, types=float)
+        self.options.declare('mach_blend_width', default=default_blend_width, types=float)
+        self.options.declare('rho', default=1e-3, types=float)
+
+    def setup(self):
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
+
+        for name, val in input_defaults.items():
+            self.add_input(name, val=val, shape=shape)
+
+        self.add_output('C0_wing', shape=shape)
+        self.add_output('C0_fuselage', shape=shape)
+        self.add_output('CD0', shape=shape)
+
+        # every point only depends on its own inputs
+        for out_name in ['C0_wing', 'C0_fuselage', 'CD0']:
+            for in_name in input_defaults:
+                self.declare_partials(out_name, in_name, rows=arange, cols=arange)
+
+    def compute(self, inputs, outputs):
+        results = self._compute_zero_lift(inputs, derivs=False)
+
+        for out_name in ['C0_wing', 'C0_fuselage', 'CD0']:
+            outputs[out_name] = results[out_name]
+
+    def compute_partials(self, inputs, partials):
+        results = self._compute_zero_lift(inputs)
+
+        for out_name in ['C0_wing', 'C0_fuselage', 'CD0']:
+            for in_name in input_defaults:
+                partials[out_name, in_name] = results['derivs'][out_name].get(in_name, 0.)
+
+    def _compute_zero_lift(self, inputs, derivs=True):
+        laminar_fraction = self.options['laminar_pctg'] / 100.
+        roughness = self.options['skin_friction_roughness']
+        blend_width = self.options['mach_blend_width']
+
+        x = {name: inputs[name].flatten() for name in input_defaults}
+        speed = x['speed']
+        length = x['characteristic_length']
+        Q = x['interference_factor']
+
+        # atmosphere
+        atm = compute_atmosphere(x['altitude'], derivs=derivs)
+        density = atm['density']
+        mu = atm['dynamic_viscosity']
+        mach = speed / atm['sonic_speed']
+
+        # skin friction
+        re = density * speed * length / mu
+        re_cutoff = compute_re_cutoffs(length, mach, roughness, blend_width)
+        re_turbulent, dmin_dre, dmin_dcutoff = compute_ks_min(re, re_cutoff, self.options['rho'])
+
+        cf_laminar = compute_laminar_cfs(re)
+        cf_turbulent = compute_turbulent_cfs(re_turbulent, mach)
+        cf = laminar_fraction * cf_laminar + (1 - laminar_fraction) * cf_turbulent
+
+        # wetted areas
+        fuselage_term = np.pi * x['d_f'] * x['l_f'] * (0.5 + 0.135 * x['ln_lf']) ** (2 / 3)
+        finesse_term = 1.015 + 0.3 / (x['fuselage_finesse_ratio'] ** 1.5)
+        S_wet_f = fuselage_term * finesse_term
+
+        thickness_ratio = (1 + x['t_c_ratio'] * x['taper']) / (1 + x['taper'])
+        S_wet_w = 2 * x['S_w'] * (1 + 0.25 * x['t_c'] * thickness_ratio)
+
+        # form factors
+        ff_args = (mach, x['t_c'], x['x_t'], x['sweep'], x['fuselage_finesse_ratio'])
+        ff_wing, dff_wing = compute_form_factors(wing_mask, *ff_args, derivs=derivs)
+        ff_fuselage, dff_fuselage = compute_form_factors(body_mask, *ff_args, derivs=derivs)
+
+        C0_wing = cf * S_wet_w * ff_wing / x['S_w'] * Q
+        C0_fuselage = cf * S_wet_f * ff_fuselage / x['S_f'] * Q
+
+        results = dict(C0_wing=C0_wing, C0_fuselage=C0_fuselage, CD0=C0_wing + C0_fuselage)
+        if not derivs:
+            return results
+
+        # Mach number and Reynolds number
+        dmach = dict(
+            altitude=-speed / atm['sonic_speed'] ** 2 * atm['dsonic_speed_dh'],
+            speed=1. / atm['sonic_speed'],
+        )
+        dre = dict(
+            altitude=speed * length * (atm['ddensity_dh'] / mu
+                - density / mu ** 2 * atm['ddynamic_viscosity_dh']),
+            speed=re / speed,
+            characteristic_length=re / length,
+        )
+
+        # skin friction, through Re, the cutoff and the turbulent Mach correction
+        dcf_turbulent_dre_turbulent, dcf_turbulent_dmach = \
+            compute_turbulent_cf_derivs(re_turbulent, mach)
+        dcutoff_dlength, dcutoff_dmach = \
+            compute_re_cutoff_derivs(length, mach, roughness, blend_width)
+
+        dcf_dre = laminar_fraction * compute_laminar_cf_derivs(re) \
+            + (1 - laminar_fraction) * dcf_turbulent_dre_turbulent * dmin_dre
+        dcf_dcutoff = (1 - laminar_fraction) * dcf_turbulent_dre_turbulent * dmin_dcutoff
+        dcf_dmach = (1 - laminar_fraction) * dcf_turbulent_dmach + dcf_dcutoff * dcutoff_dmach
+
+        dcf = {name: dcf_dre * value for name, value in dre.items()}
+        for name, value in dmach.items():
+            dcf[name] = dcf[name] + dcf_dmach * value
+        dcf['characteristic_length'] = dcf['characteristic_length'] + dcf_dcutoff * dcutoff_dlength
+
+        # wetted areas
+        dS_wet_f = dict(
+            d_f=S_wet_f / x['d_f'],
+            l_f=S_wet_f / x['l_f'],
+            ln_lf=S_wet_f * 0.09 / (0.5 + 0.135 * x['ln_lf']),
+            fuselage_finesse_ratio=fuselage_term * -0.45 / x['fuselage_finesse_ratio'] ** 2.5,
+        )
+        dS_wet_w = dict(
+            S_w=S_wet_w / x['S_w'],
+            t_c=0.5 * x['S_w'] * thickness_ratio,
+            taper=0.5 * x['S_w'] * x['t_c'] * (x['t_c_ratio'] - 1) / (1 + x['taper']) ** 2,
+            t_c_ratio=0.5 * x['S_w'] * x['t_c'] * x['taper'] / (1 + x['taper']),
+        )
+
+        # form factors, with the Mach number chained back to altitude and speed
+        dff = {}
+        for ff_name, ff_derivs in [('wing', dff_wing), ('fuselage', dff_fuselage)]:
+            dff[ff_name] = dict(
+                t_c=ff_derivs['t_c'],
+                x_t=ff_derivs['x_t'],
+                sweep=ff_derivs['sweep'],
+                fuselage_finesse_ratio=ff_derivs['finesse_ratio'],
+            )
+            for name, value in dmach.items():
+                dff[ff_name][name] = ff_derivs['mach'] * value
+
+        # product rule over C0 = Cf * S_wet * FF * Q / S_ref
+        dC0 = {}
+        for out_name, S_wet, dS_wet, ff, ff_name, S_ref_name in [
+                ('C0_wing', S_wet_w, dS_wet_w, ff_wing, 'wing', 'S_w'),
+                ('C0_fuselage', S_wet_f, dS_wet_f, ff_fuselage, 'fuselage', 'S_f')]:
+            C0 = results[out_name]
+            S_ref = x[S_ref_name]
+
+            dC0[out_name] = {}
+            for factor, dfactor in [(cf, dcf), (S_wet, dS_wet), (ff, dff[ff_name])]:
+                for name, value in dfactor.items():
+                    dC0[out_name][name] = dC0[out_name].get(name, 0.) \
+                        + value * C0 / factor
+            dC0[out_name][S_ref_name] = dC0[out_name].get(S_ref_name, 0.) - C0 / S_ref
+            dC0[out_name]['interference_factor'] = C0 / Q
+
+        dC0['CD0'] = {}
+        for out_name in ['C0_wing', 'C0_fuselage']:
+            for name, value in dC0[out_name].items():
+                dC0['CD0'][name] = dC0['CD0'].get(name, 0.) + value
+
+        results['derivs'] = dC0
+        return results
+
+
+# runs a test to see if calculated values make sense
+if __name__ == "__main__":
+    prob = om.Problem()
+    prob.model.add_subsystem('zero_lift_comp', ZeroLiftComp(), promotes=['*'])
+    prob.setup()
+    prob.run_model()
+
+    print('C0_wing', prob['C0_wing'])
+    print('C0_fuselage', prob['C0_fuselage'])
+    print('CD0', prob['CD0'])
@@ -1,42 +1,65 @@
 import numpy as np
 
 from openmdao.api import ExplicitComponent, IndepVarComp, Group, Problem
-from lsdo_utils.api import OptionsDictionary, LinearCombinationComp, PowerCombinationComp, GeneralOperationComp, ElementwiseMinComp
 from .atmosphere_group import AtmosphereGroup
 from .s_wet import SWet
-from .skin_friction_group import SkinFrictionGroup
 from .form_drag_co import FormDragCo
+from .drag_buildup_comp import DragBuildupComp
+from .zero_lift_comp import ZeroLiftComp
 
 class ZeroLiftGroup(Group):
 
     def initialize(self):
         self.options.declare('shape', types=tuple)
+        # list of component dicts for DragBuildupComp; if None, the wing and fuselage are wired by hand
+        self.options.declare('buildup_table', default=None, types=list, allow_none=True)
+        # if True, the atmosphere and the wing/fuselage build-up are computed by one ZeroLiftComp
+        self.options.declare('fused', default=False, types=bool)
         
     def setup(self):
         shape = self.options['shape']
+        buildup_table = self.options['buildup_table']
         
         comp = IndepVarComp()
-        comp.add_output('altitude', val = 12000.)
-        comp.add_output('speed', val = 250.)
-        comp.add_output('t_c', val = .13)
-        comp.add_output('sweep', val = 22.5 * np.pi/180)
+        comp.add_output('altitude', val = 12000., shape=shape)
+        comp.add_output('speed', val = 250., shape=shape)
+        comp.add_output('t_c', val = .13, shape=shape)
+        comp.add_output('sweep', val = 22.5 * np.pi/180, shape=shape)
         # comp.add_output('Mach_number', val = 0.85)
 
-        comp.add_output('S_w', val = 157. )
-        comp.add_output('S_f', val = 2000. )
+        comp.add_output('S_w', val = 157., shape=shape)
+        comp.add_output('S_f', val = 2000., shape=shape)
 
-        comp.add_output('fuselage_finesse_ratio', val = 8.)
-        comp.add_output('characteristic_length', val = 5.)
+        comp.add_output('fuselage_finesse_ratio', val = 8., shape=shape)
+        comp.add_output('characteristic_length', val = 5., shape=shape)
         
 
-        comp.add_output('interference_factor', val = 1.)
+        comp.add_output('interference_factor', val = 1., shape=shape)
         self.add_subsystem('inputs_comp', comp, promotes=['*'])
+
+        if self.options['fused']:
+            if buildup_table is not None:
+                raise ValueError('The fused zero-lift component does not take a buildup_table')
+
+            comp = ZeroLiftComp(shape=shape)
+            self.add_subsystem('zero_lift_comp', comp, promotes=['*'])
+            return
         
         atmosphere_group = AtmosphereGroup(
             shape = shape,
         )
-        self.add_subsystem('atmosphere_group', atmosphere_group, promotes=['*'])
-        
+        # the atmosphere names the flight speed 'v'
+        self.add_subsystem('atmosphere_group', atmosphere_group, promotes=[('v', 'speed'), '*'])
+
+        if buildup_table is not None:
+            # every component in one array computation, referenced to the wing area
+            comp = DragBuildupComp(shape=shape, components=buildup_table)
+            self.add_subsystem('drag_buildup_comp', comp, promotes=[('S_ref', 'S_w'), '*'])
+            return
+
+        # only the hand-wired build-up needs lsdo_utils
+        from lsdo_utils.api import LinearCombinationComp, PowerCombinationComp
+        from .skin_friction_group import SkinFrictionGroup
 
         skin_friction_group = SkinFrictionGroup(
             shape = shape,
@@ -44,10 +67,10 @@ class ZeroLiftGroup(Group):
 
         self.add_subsystem('skin_friction_group', skin_friction_group, promotes=['*'])
 
-        wetted_area_comp = SWet()
+        wetted_area_comp = SWet(shape=shape)
         self.add_subsystem('wetted_area_comp', wetted_area_comp, promotes=['*'])
 
-        form_drag_comp = FormDragCo()
+        form_drag_comp = FormDragCo(shape=shape)
         self.add_subsystem('form_drag_comp', form_drag_comp, promotes=['*'])
 
         comp = PowerCombinationComp(
@@ -0,0 +1,87 @@
+"""
+Command-line entry point for running declarative model configs.
+
+    python -m model_config run config.yaml [config.yaml ...]
+        [--set NAME=VALUE ...] [--sweep NAME=V1,V2,...]
+
+Every config is run once, or once per value of the --sweep input, with the
+--set inputs overriding those of the config. Configs with the same model
+structure share one set-up problem, and the setup time this saves is
+reported at the end. Run from the repository root.
+"""
+from __future__ import division, print_function
+import argparse
+import sys
+import timeit
+
+from model_config.config import load_config, parse_value, update_config
+from model_config.model_builder import ModelCache, run_problem
+
+
+def parse_assignment(text):
+    name, sep, value = text.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError('expected NAME=VALUE, not {}'.format(text))
+    return name, value
+
+
+def get_runs(args):
+    """
+    Returns a list of (file path, config) of every run of the arguments.
+    """
+    overrides = dict((name, parse_value(value)) for name, value in args.set)
+
+    runs = []
+    for file_path in args.configs:
+        config = update_config(load_config(file_path), overrides)
+        if args.sweep is None:
+            runs.append((file_path, config))
+        else:
+            name, values = args.sweep
+            for value in values.split(','):
+                runs.append((file_path, update_config(config, {name: parse_value(value)})))
+    return runs
+
+
+def run(args, out_stream=sys.stdout):
+    cache = ModelCache()
+
+    for file_path, config in get_runs(args):
+        start = timeit.default_timer()
+        prob = cache.get_problem(config)
+        failed = run_problem(prob, config)
+        wall_time = timeit.default_timer() - start
+
+        inputs = ', '.join('{}={}'.format(name, value)
+            for name, value in sorted(config.get('inputs', {}).items()))
+        print('{} ({}): {:.2f} s{}'.format(file_path, inputs or 'defaults', wall_time,
+            ', driver failed' if failed else ''), file=out_stream)
+        for name in config.get('outputs', []):
+            print('    {} = {}'.format(name, prob[name]), file=out_stream)
+
+    print('{} runs, {} model builds in {:.2f} s, {} reused, about {:.2f} s of setup '
+        'saved'.format(cache.hits + cache.misses, cache.misses, cache.build_time, cache.hits,
+        cache.saved_time), file=out_stream)
+    return cache
+
+
+def main(argv=None, out_stream=sys.stdout):
+    parser = argparse.ArgumentParser(prog='python -m model_config',
+        description='Builds and runs models from declarative YAML configs.')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    run_parser = subparsers.add_parser('run', help='run one or more configs')
+    run_parser.add_argument('configs', nargs='+', help='YAML config files')
+    run_parser.add_argument('--set', type=parse_assignment, action='append', default=[],
+        metavar='NAME=VALUE', help='set an input in every run')
+    run_parser.add_argument('--sweep', type=parse_assignment, default=None,
+        metavar='NAME=V1,V2,...', help='run every config once per value of an input')
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        run(args, out_stream)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+from __future__ import division, print_function
+import copy
+import re
+
+import yaml
+
+from components.definition_key import get_definition_key
+
+#
+#    Declarative model configs, as YAML files with the sections
+#
+#        mesh                     arguments of generate_mesh; the mesh and twist_cp go into surface
+#        surface                  the remaining entries of the OpenAeroStruct surface dict
+#        independent_variables    name: {val, units}, outputs of an IndepVarComp
+#        subsystems               list of {name, type, options} (or {name, type: ExecComp, expr}),
+#                                 where type is a name of api; every subsystem is promoted with '*'
+#                                 and gets the surface if it has a surface option
+#        connections              list of [source, target] pairs
+#        design_vars, constraints name: keyword arguments of add_design_var / add_constraint
+#        objective                name: keyword arguments of add_objective
+#        driver                   keyword arguments of ScipyOptimizeDriver
+#        inputs                   name: value, set on the problem after setup
+#        outputs                  names printed after the run
+#        run                      'driver' or 'model'
+#
+#    Only inputs, outputs and run can change without building and setting up the model again, so
+#    get_structure_key hashes everything else
+#
+
+# Version of the structure key; bump it when building a model from a config changes
+config_version = 1
+
+# sections that do not change the model structure
+numeric_sections = ['inputs', 'outputs', 'run']
+
+sections = ['mesh', 'surface', 'independent_variables', 'subsystems', 'connections',
+    'design_vars', 'constraints', 'objective', 'driver'] + numeric_sections
+
+
+class _ConfigLoader(yaml.SafeLoader):
+    pass
+
+
+# YAML 1.1 only reads floats with a dot, e.g. 1.0e-9; also read 1e-9 and 1e6 as floats
+_ConfigLoader.add_implicit_resolver(
+    'tag:yaml.org,2002:float',
+    re.compile(r'''^(?:[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+        |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+        |\.[0-9_]+(?:[eE][-+][0-9]+)?
+        |[-+]?\.(?:inf|Inf|INF)
+        |\.(?:nan|NaN|NAN))$''', re.X),
+    list('-+0123456789.'))
+
+
+def load_config(file_path):
+    """
+    Returns the config dict of a YAML file.
+    """
+    with open(file_path) as config_file:
+        config = yaml.load(config_file, Loader=_ConfigLoader) or {}
+    check_config(config)
+    return config
+
+
+def parse_value(text):
+    """
+    Returns the number, list or string written in text, e.g. 1e6 or [1, 2].
+    """
+    return yaml.load(text, Loader=_ConfigLoader)
+
+
+def check_config(config):
+    """
+    Raises ValueError if the config has unknown sections or no subsystems.
+    """
+    unknown = sorted(set(config) - set(sections))
+    if unknown:
+        raise ValueError('Unknown config sections {}; the sections are {}'.format(
+            ', '.join(unknown), ', '.join(sections)))
+    if not config.get('subsystems'):
+        raise ValueError('The config has no subsystems')
+    for subsystem in config['subsystems']:
+        if 'name' not in subsystem or 'type' not in subsystem:
+            raise ValueError('Every subsystem needs a name and a type, not {}'.format(subsystem))
+
+
+def get_structure_key(config):
+    """
+    Returns a hash of the sections of the config that define the model
+    structure, i.e. all but inputs, outputs and run.
+    """
+    return get_definition_key(config_version, dict(
+        (name, value) for name, value in config.items() if name not in numeric_sections))
+
+
+def update_config(config, values):
+    """
+    Returns a copy of the config with the inputs in values set.
+    """
+    config = copy.deepcopy(config)
+    config.setdefault('inputs', {}).update(values)
+    return config
@@ -0,0 +1,132 @@
+from __future__ import division, print_function
+import timeit
+
+import numpy as np
+
+from openmdao.api import ExecComp, IndepVarComp, Problem, ScipyOptimizeDriver
+
+import api
+from model_config.config import get_structure_key
+
+#
+#    Builds and sets up the OpenMDAO problem of a config (see model_config.config). ModelCache
+#    keeps the set-up problem of every model structure, so running a config that only differs in
+#    its inputs reuses the problem instead of building and setting it up again
+#
+
+
+def get_surface(config):
+    """
+    Returns the surface dict of a config, with the mesh and twist_cp of
+    generate_mesh and lists turned into arrays, or None if it has no mesh.
+    """
+    if 'mesh' not in config:
+        return None
+
+    mesh, twist_cp = api.generate_mesh(dict(config['mesh']))
+    surface = {'name': 'wing', 'mesh': mesh, 'twist_cp': twist_cp}
+    for name, value in config.get('surface', {}).items():
+        surface[name] = np.array(value, dtype=float) if isinstance(value, list) else value
+    return surface
+
+
+def build_problem(config):
+    """
+    Returns the set-up problem of a config, without its inputs set.
+    """
+    surface = get_surface(config)
+
+    prob = Problem()
+    model = prob.model
+
+    if config.get('independent_variables'):
+        comp = IndepVarComp()
+        for name, kwargs in config['independent_variables'].items():
+            comp.add_output(name, **kwargs)
+        model.add_subsystem('inputs_comp', comp, promotes=['*'])
+
+    for subsystem in config['subsystems']:
+        options = dict(subsystem.get('options', {}))
+        if subsystem['type'] == 'ExecComp':
+            comp = ExecComp(subsystem['expr'], **options)
+        else:
+            comp = getattr(api, subsystem['type'])(**options)
+            if surface is not None and 'surface' in comp.options:
+                comp.options['surface'] = surface
+        model.add_subsystem(subsystem['name'], comp, promotes=['*'])
+
+    for source, target in config.get('connections', []):
+        model.connect(source, target)
+
+    for name, kwargs in config.get('design_vars', {}).items():
+        model.add_design_var(name, **kwargs)
+    for name, kwargs in config.get('constraints', {}).items():
+        model.add_constraint(name, **kwargs)
+    for name, kwargs in config.get('objective', {}).items():
+        model.add_objective(name, **kwargs)
+
+    if 'driver' in config:
+        prob.driver = ScipyOptimizeDriver(**config['driver'])
+
+    prob.setup()
+    prob.final_setup()
+    return prob
+
+
+def run_problem(prob, config):
+    """
+    Runs the driver of the problem, or only the model if the config has no
+    driver or run is 'model'. Returns True if the driver failed.
+    """
+    if config.get('run', 'driver' if 'driver' in config else 'model') == 'driver':
+        return prob.run_driver()
+    prob.run_model()
+    return False
+
+
+class ModelCache(object):
+    """
+    Set-up problems by the structure key of their config.
+
+    get_problem returns the problem of a config with its inputs set, building
+    it on a miss. On a hit, the inputs a previous config set and the design
+    variables are first reset to their values after setup, so the result does
+    not depend on what ran before. build_time is the wall time spent
+    building and setting up problems and saved_time the build time of the
+    hits, estimated from the build of the same structure.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.build_time = 0.
+        self.saved_time = 0.
+
+    def get_problem(self, config):
+        key = get_structure_key(config)
+
+        if key in self.entries:
+            self.hits += 1
+            entry = self.entries[key]
+            self.saved_time += entry['build_time']
+
+            for name, value in entry['defaults'].items():
+                entry['prob'][name] = value
+        else:
+            self.misses += 1
+            start = timeit.default_timer()
+            prob = build_problem(config)
+            build_time = timeit.default_timer() - start
+            self.build_time += build_time
+
+            entry = dict(prob=prob, build_time=build_time, defaults=dict(
+                (name, prob[name].copy()) for name in config.get('design_vars', {})))
+            self.entries[key] = entry
+
+        prob = entry['prob']
+        for name, value in config.get('inputs', {}).items():
+            if name not in entry['defaults']:
+                entry['defaults'][name] = prob[name].copy()
+            prob[name] = value
+        return prob
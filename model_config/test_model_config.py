@@ -0,0 +1,83 @@
+import glob
+import io
+import os
+import unittest
+
+import numpy as np
+
+from .config import load_config, parse_value, check_config, get_structure_key, update_config
+from .model_builder import ModelCache, build_problem, run_problem
+from .__main__ import main
+
+#  tests for the declarative model configs and the cached model builder
+
+config_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'configs')
+weights_path = os.path.join(config_dir, 'weights.yaml')
+
+
+class TestModelConfig(unittest.TestCase):
+
+    def test_configs(self):
+        file_paths = glob.glob(os.path.join(config_dir, '*.yaml'))
+        self.assertGreater(len(file_paths), 0)
+        for file_path in file_paths:
+            config = load_config(file_path)
+            self.assertIsInstance(config['subsystems'], list)
+
+        config = load_config(os.path.join(config_dir, 'run_opt.yaml'))
+        self.assertEqual(config['driver']['tol'], 1e-9)
+        self.assertEqual(config['constraints']['LOW']['lower'], -1e-3)
+
+        with self.assertRaises(ValueError):
+            check_config(dict(config, solver='newton'))
+
+    def test_parse_value(self):
+        self.assertEqual(parse_value('1e-9'), 1e-9)
+        self.assertEqual(parse_value('11000'), 11000)
+        self.assertEqual(parse_value('[1, 2.5]'), [1, 2.5])
+        self.assertEqual(parse_value('newton'), 'newton')
+
+    def test_structure_key(self):
+        config = load_config(os.path.join(config_dir, 'run_opt.yaml'))
+        key = get_structure_key(config)
+
+        self.assertEqual(get_structure_key(update_config(config, {'rnge': 1.5e6})), key)
+
+        changed = update_config(config, {})
+        changed['mesh']['num_y'] = 7
+        self.assertNotEqual(get_structure_key(changed), key)
+
+    def test_cache(self):
+        config = load_config(weights_path)
+
+        prob = build_problem(config)
+        run_problem(prob, config)
+        default_value = prob['emptyTotal'].copy()
+
+        prob = build_problem(config)
+        prob['W0'] = 300000.
+        run_problem(prob, config)
+        heavy_value = prob['emptyTotal'].copy()
+
+        cache = ModelCache()
+        for W0, value in [(300000., heavy_value), (None, default_value),
+                (300000., heavy_value)]:
+            run_config = config if W0 is None else update_config(config, {'W0': W0})
+            prob = cache.get_problem(run_config)
+            run_problem(prob, run_config)
+            np.testing.assert_allclose(prob['emptyTotal'], value, rtol=1e-12)
+
+        self.assertEqual((cache.misses, cache.hits), (1, 2))
+        self.assertGreater(cache.saved_time, 0.)
+
+    def test_main(self):
+        out_stream = io.StringIO()
+        main(['run', weights_path, '--sweep', 'W0=2.5e5,3e5'], out_stream=out_stream)
+
+        lines = out_stream.getvalue().splitlines()
+        self.assertIn('W0=250000.0', lines[0])
+        self.assertIn('2 runs, 1 model builds', lines[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,7 @@
 import numpy as np
 
 from openmdao.api import Problem, Group, IndepVarComp, ExecComp, ScipyOptimizeDriver
-from openaerostruct.geometry.utils import generate_mesh
-from components.oas_group import OASGroup
-from components.breguet_range.breguet_range_comp import BregRangeCo
-from weight_component.weightGroup import weightCompGroup
+from api import generate_mesh, OASGroup, BregRangeCo, weightCompGroup
 
 # Create a dictionary to store options about the mesh
 mesh_dict = {'num_y' : 11,
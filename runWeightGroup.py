@@ -1,6 +1,6 @@
 import numpy as np
 from openmdao.api import Problem, Group, IndepVarComp, ExecComp, ScipyOptimizeDriver
-from weight_component.weightGroup import weightCompGroup
+from api import weightCompGroup
 
 prob = Problem()
 
@@ -5,9 +5,9 @@ from openmdao.api import Problem, Group, IndepVarComp, ExecComp, ScipyOptimizeDr
 from lsdo_utils.api import LinearCombinationComp, PowerCombinationComp
 from openaerostruct.geometry.utils import generate_mesh
 
-from openaerostruct.integration.aerostruct_groups import AerostructGeometry, AerostructPoint
 from openaerostruct.utils.constants import grav_constant
 from components.zero_lift_drag.atmosphere_group import AtmosphereGroup
+from components.aerostruct_group import AerostructGroup
 
 
 shape = (1,)
@@ -71,8 +71,6 @@ prob = Problem()
 
 # Add problem information as an independent variables component
 indep_var_comp = IndepVarComp()
-indep_var_comp.add_output('v', val=250, units='m/s')
-indep_var_comp.add_output('alpha', val=2.5, units='deg')
 indep_var_comp.add_output('Mach_number', val=0.84)
 indep_var_comp.add_output('re', val=1.e6, units='1/m')
 indep_var_comp.add_output('rho', val=0.38, units='kg/m**3')
@@ -81,8 +79,6 @@ indep_var_comp.add_output('R', val=1.3e6, units='m') # range
 # The operating empty weight of the aircraft, without fuel or structural mass. Supplied in kg despite being a 'weight' due to convention.
 indep_var_comp.add_output('W0', val=54412.4,  units='kg') 
 indep_var_comp.add_output('speed_of_sound', val=295.4, units='m/s')
-indep_var_comp.add_output('load_factor', val=1.)
-indep_var_comp.add_output('empty_cg', val=np.zeros((3)), units='m')
 # some wing variables to add
 indep_var_comp.add_output('sweep', val=25, units='deg')
 indep_var_comp.add_output('span', val=57, units='m')
@@ -99,43 +95,17 @@ prob.model.add_subsystem('flight_and_wing_properties',
 # atmosphere_group = AtmosphereGroup(shape = shape,)
 # prob.model.add_subsystem('atmosphere_group', atmosphere_group, promotes=['*'])
 
-aerostruct_group = AerostructGeometry(surface=surface)
+# Aerostructural geometry and analysis point, with Aitken-relaxed Gauss-Seidel on the coupled
+# aero/structure group, the cheapest per evaluation (see benchmarks/bench_aerostruct_solvers.py)
+aerostruct_group = AerostructGroup(surface=surface)
 
-name = 'wing'
-
-# Add tmp_group to the problem with the name of the surface.
-prob.model.add_subsystem(name, aerostruct_group)
-
-point_name = 'AS_point_0'
-
-# Create the aero point group and add it to the model
-AS_point = AerostructPoint(surfaces=[surface], user_specified_Sref=True)
-
-prob.model.add_subsystem(point_name, AS_point,
-    promotes_inputs=['v', 'alpha', 'Mach_number', 're', 'rho', 'CT', 'R',
-        'W0', 'speed_of_sound', 'empty_cg', 'load_factor'])
-
-com_name = point_name + '.' + name + '_perf'
-prob.model.connect(name + '.local_stiff_transformed', point_name + '.coupled.' + name + '.local_stiff_transformed')
-prob.model.connect(name + '.nodes', point_name + '.coupled.' + name + '.nodes')
-
-# Connect aerodyamic mesh to coupled group mesh
-prob.model.connect(name + '.mesh', point_name + '.coupled.' + name + '.mesh')
-
-# Connect performance calculation variables
-prob.model.connect(name + '.radius', com_name + '.radius')
-prob.model.connect(name + '.thickness', com_name + '.thickness')
-prob.model.connect(name + '.nodes', com_name + '.nodes')
-prob.model.connect(name + '.cg_location', point_name + '.' + 'total_perf.' + name + '_cg_location')
-prob.model.connect(name + '.structural_mass', point_name + '.' + 'total_perf.' + name + '_structural_mass') # in N
-prob.model.connect(name + '.t_over_c', com_name + '.t_over_c')
+prob.model.add_subsystem('aerostruct_group', aerostruct_group, promotes=['*'])
 
 # prob.model.connect('S_ref','AS_point_0.wing_perf.S_ref')
 prob.model.connect('span','wing.geometry.mesh.stretch.span')
 prob.model.connect('sweep','wing.geometry.mesh.sweep.sweep')
 prob.model.connect('taper','wing.geometry.mesh.taper.taper')
 prob.model.connect('dihedral','wing.geometry.mesh.dihedral.dihedral')
-prob.model.connect('S_ref_total', point_name + '.S_ref_total')
 
 comp = ExecComp('aspect_ratio = span**2 / S_ref_total')
 prob.model.add_subsystem('aspect_ratio_comp', comp, promotes=['*'])
@@ -2,15 +2,8 @@ import numpy as np
 
 from openmdao.api import Group, IndepVarComp, ExecComp, ScipyOptimizeDriver
 from lsdo_utils.api import PowerCombinationComp, LinearPowerCombinationComp
-from openaerostruct.geometry.utils import generate_mesh
-from components.oas_group import OASGroup
-from components.breguet_range.breguet_range_comp import BregRangeCo
-from components.zero_lift_drag.zero_lift_group import ZeroLiftGroup
-from components.aeroprop.thrust_comp import thrustComp
-from components.aeroprop.drag_comp import dragComp
-from components.aeroprop.lift_comp import liftComp
-from weight_component.weightGroup import weightCompGroup
-from components.zero_lift_drag.atmosphere_group import AtmosphereGroup
+from api import generate_mesh, OASGroup, BregRangeCo, ZeroLiftGroup
+from api import thrustComp, dragComp, liftComp, weightCompGroup, AtmosphereGroup
 from lsdo_viz.api import Problem
 
 shape = (1,)
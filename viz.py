@@ -2,11 +2,6 @@ import numpy as np
 
 from lsdo_viz.api import BaseViz, Frame
 
-import seaborn as sns
-
-
-sns.set()
-
 
 mode = 'last'
 
@@ -14,6 +9,10 @@ mode = 'last'
 class Viz(BaseViz):
 
     def setup(self):
+        # seaborn is only needed once frames are drawn, not when this module is imported
+        import seaborn as sns
+        sns.set()
+
         # self.use_latex_fonts()
 
         self.frame_name_format = 'output_{}'
@@ -5,16 +5,37 @@ from openmdao.api import ExplicitComponent
 
 class airconWeightComp(ExplicitComponent):
 
+    # the options are the default values of the inputs of the same name
     def initialize(self):
-        self.options.declare('Np', types=float)
-        self.options.declare('Vpr', types=float)
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('Np', default=410., types=float)
+        self.options.declare('Vpr', default=39000., types=float)
 
     def setup(self):
-        self.add_output('W_aircon')
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
+
+        for name in ['Np', 'Vpr']:
+            self.add_input(name, val=self.options[name], shape=shape)
+        self.add_output('W_aircon', shape=shape)
+
+        for name in ['Np', 'Vpr']:
+            self.declare_partials('W_aircon', name, rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
-        Np = self.options['Np']
-        Vpr = self.options['Vpr']
+        outputs['W_aircon'] = self._compute_weight(inputs)
+
+    def compute_partials(self, inputs, partials):
+        Np = inputs['Np']
+        Vpr = inputs['Vpr']
+
+        W_aircon = self._compute_weight(inputs)
+
+        partials['W_aircon', 'Np'] = (0.25 * W_aircon / Np).flatten()
+        partials['W_aircon', 'Vpr'] = (0.604 * W_aircon / Vpr).flatten()
 
-        outputs['W_aircon'] = 62.36 * Np ** 0.25 * (Vpr / 1000) ** 0.604 * 1000 ** 0.1
+    def _compute_weight(self, inputs):
+        Np = inputs['Np']
+        Vpr = inputs['Vpr']
 
+        return 62.36 * Np ** 0.25 * (Vpr / 1000) ** 0.604 * 1000 ** 0.1
@@ -5,49 +5,71 @@ from openmdao.api import ExplicitComponent
 
 class fuselageWeightComp(ExplicitComponent):
 
+    # the options are the default values of the inputs of the same name
     def initialize(self):
-        self.options.declare('N', types=float)
-        self.options.declare('L', types=float)
-        self.options.declare('LD', types=float)
-        self.options.declare('S_fuse', types=float)
-        self.options.declare('sweep', types=float)
-        self.options.declare('taper', types=float)
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('N', default=3.5, types=float)
+        self.options.declare('L', default=205., types=float)
+        self.options.declare('LD', default=17., types=float)
+        self.options.declare('S_fuse', default=15030., types=float)
+        self.options.declare('sweep', default=30., types=float)
+        self.options.declare('taper', default=0.3, types=float)
 
     def setup(self):
-        self.add_input('W0')
-        self.add_input('Bw')
-        self.add_output('W_fuse')
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
 
-        self.declare_partials('W_fuse', 'W0')
+        self.add_input('W0', shape=shape)
+        self.add_input('Bw', shape=shape)
+        for name in ['N', 'L', 'LD', 'S_fuse', 'sweep', 'taper']:
+            self.add_input(name, val=self.options[name], shape=shape)
+        self.add_output('W_fuse', shape=shape)
+
+        for name in ['W0', 'Bw', 'N', 'L', 'LD', 'S_fuse', 'sweep', 'taper']:
+            self.declare_partials('W_fuse', name, rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
-        N = self.options['N']
-        L = self.options['L']
-        LD = self.options['LD']
-        S_fuse = self.options['S_fuse']
-        sweep = self.options['sweep']
-        taper = self.options['taper']
+        outputs['W_fuse'] = self._compute_weight(inputs)[0]
 
+    def compute_partials(self, inputs, partials):
         W0 = inputs['W0']
         Bw = inputs['Bw']
+        N = inputs['N']
+        L = inputs['L']
+        LD = inputs['LD']
+        S_fuse = inputs['S_fuse']
+        sweep = inputs['sweep']
+        taper = inputs['taper']
 
-        Kws = 0.75 * (1 + 2 * taper) / (1 + taper) * Bw * np.tan(sweep / L * (np.pi / 180))
+        W_fuse, Kws = self._compute_weight(inputs)
 
-        outputs['W_fuse'] = 0.328 * 1.12 * W0 ** 0.5 * N ** 0.5  * L ** 0.25 * S_fuse ** 0.302 * (1 + Kws) ** 0.04 * LD ** 0.1
+        # Kws = 0.75 * (1 + 2 * taper) / (1 + taper) * Bw * tan(sweep) / L
+        tanSweep = np.tan(sweep * np.pi / 180)
+        dW_dKws = 0.04 * W_fuse / (1 + Kws)
+        dKws_dBw = 0.75 * (1 + 2 * taper) / (1 + taper) * tanSweep / L
+        dKws_dsweep = 0.75 * (1 + 2 * taper) / (1 + taper) * Bw / L * (1 + tanSweep ** 2) * np.pi / 180
+        dKws_dtaper = 0.75 / (1 + taper) ** 2 * Bw * tanSweep / L
 
-    def compute_partials(self, inputs, partials):
-        N = self.options['N']
-        L = self.options['L']
-        LD = self.options['LD']
-        S_fuse = self.options['S_fuse']
-        sweep = self.options['sweep']
-        taper = self.options['taper']
+        partials['W_fuse', 'W0'] = (0.5 * W_fuse / W0).flatten()
+        partials['W_fuse', 'Bw'] = (dW_dKws * dKws_dBw).flatten()
+        partials['W_fuse', 'N'] = (0.5 * W_fuse / N).flatten()
+        partials['W_fuse', 'L'] = (0.25 * W_fuse / L - dW_dKws * Kws / L).flatten()
+        partials['W_fuse', 'LD'] = (0.1 * W_fuse / LD).flatten()
+        partials['W_fuse', 'S_fuse'] = (0.302 * W_fuse / S_fuse).flatten()
+        partials['W_fuse', 'sweep'] = (dW_dKws * dKws_dsweep).flatten()
+        partials['W_fuse', 'taper'] = (dW_dKws * dKws_dtaper).flatten()
 
+    def _compute_weight(self, inputs):
         W0 = inputs['W0']
         Bw = inputs['Bw']
+        N = inputs['N']
+        L = inputs['L']
+        LD = inputs['LD']
+        S_fuse = inputs['S_fuse']
+        sweep = inputs['sweep']
+        taper = inputs['taper']
 
-        Kws = 0.75 * (1 + 2 * taper) / (1 + taper) * Bw * np.tan(sweep / L * (np.pi / 180))
-
-        partials['W_fuse', 'W0'] = 0.328 * 1.12 * 0.5 * W0 ** -0.5 * N ** 0.5 * L ** 0.25 * S_fuse ** 0.302 * (1 + Kws) ** 0.04 * LD ** 0.1
+        Kws = 0.75 * (1 + 2 * taper) / (1 + taper) * Bw * np.tan(sweep * (np.pi / 180)) / L
 
-       
\ No newline at end of file
+        W_fuse = 0.328 * 1.12 * W0 ** 0.5 * N ** 0.5  * L ** 0.25 * S_fuse ** 0.302 * (1 + Kws) ** 0.04 * LD ** 0.1
+        return W_fuse, Kws
@@ -5,55 +5,77 @@ from openmdao.api import ExplicitComponent
 
 class maingearWeightComp(ExplicitComponent):
 
+    # the options are the default values of the inputs of the same name
     def initialize(self):
-        self.options.declare('Nl', types=float)
-        self.options.declare('Vstall', types=float)
-        
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('Nl', default=5., types=float)
+        self.options.declare('Vstall', default=150., types=float)
+
     def setup(self):
-        self.add_input('Wl')
-        self.add_output('W_mgear')
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
+
+        self.add_input('Wl', shape=shape)
+        for name in ['Nl', 'Vstall']:
+            self.add_input(name, val=self.options[name], shape=shape)
+        self.add_output('W_mgear', shape=shape)
 
-        self.declare_partials('W_mgear', 'Wl')
+        for name in ['Wl', 'Nl', 'Vstall']:
+            self.declare_partials('W_mgear', name, rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
-        Nl = self.options['Nl']
-        Vstall = self.options['Vstall']
-        
+        outputs['W_mgear'] = self._compute_weight(inputs)
+
+    def compute_partials(self, inputs, partials):
         Wl = inputs['Wl']
+        Nl = inputs['Nl']
+        Vstall = inputs['Vstall']
 
-        outputs['W_mgear'] = 0.0106 * Wl ** 0.888 * Nl ** 0.25 * 90 ** 0.4 * 8 ** 0.321 * 2 ** -0.5 * Vstall ** 0.1
+        W_mgear = self._compute_weight(inputs)
 
-    def compute_partials(self, inputs, partials):
-        Nl = self.options['Nl']
-        Vstall = self.options['Vstall']
+        partials['W_mgear', 'Wl'] = (0.888 * W_mgear / Wl).flatten()
+        partials['W_mgear', 'Nl'] = (0.25 * W_mgear / Nl).flatten()
+        partials['W_mgear', 'Vstall'] = (0.1 * W_mgear / Vstall).flatten()
 
+    def _compute_weight(self, inputs):
         Wl = inputs['Wl']
+        Nl = inputs['Nl']
+        Vstall = inputs['Vstall']
 
-        partials['W_mgear', 'Wl'] = 0.0106 * 0.888 * Wl ** -0.112 * Nl ** 0.25 * 90 ** 0.4 * 8 ** 0.321 * 2 ** -0.5 * Vstall ** 0.1
+        return 0.0106 * Wl ** 0.888 * Nl ** 0.25 * 90 ** 0.4 * 8 ** 0.321 * 2 ** -0.5 * Vstall ** 0.1
 
 class nosegearWeightComp(ExplicitComponent):
 
+    # the options are the default values of the inputs of the same name
     def initialize(self):
-        self.options.declare('Nl', types=float)
-        
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('Nl', default=5., types=float)
+
     def setup(self):
-        self.add_input('Wl')
-        self.add_output('W_ngear')
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
 
-        self.declare_partials('W_ngear', 'Wl')
+        self.add_input('Wl', shape=shape)
+        self.add_input('Nl', val=self.options['Nl'], shape=shape)
+        self.add_output('W_ngear', shape=shape)
 
-    def compute(self, inputs, outputs):
-        Nl = self.options['Nl']
-        
-        Wl = inputs['Wl']
+        for name in ['Wl', 'Nl']:
+            self.declare_partials('W_ngear', name, rows=arange, cols=arange)
 
-        outputs['W_ngear'] = 0.032 * Wl ** 0.646 * Nl ** 0.2 * 90 ** 0.5 * 2 ** 0.45
+    def compute(self, inputs, outputs):
+        outputs['W_ngear'] = self._compute_weight(inputs)
 
     def compute_partials(self, inputs, partials):
-        Nl = self.options['Nl']
-        
         Wl = inputs['Wl']
+        Nl = inputs['Nl']
 
-        partials['W_ngear', 'Wl'] = 0.032 * 0.646 * Wl ** -0.354 * Nl ** 0.2 * 90 ** 0.5 * 2 ** 0.45
+        W_ngear = self._compute_weight(inputs)
+
+        partials['W_ngear', 'Wl'] = (0.646 * W_ngear / Wl).flatten()
+        partials['W_ngear', 'Nl'] = (0.2 * W_ngear / Nl).flatten()
+
+    def _compute_weight(self, inputs):
+        Wl = inputs['Wl']
+        Nl = inputs['Nl']
 
-       
\ No newline at end of file
+        return 0.032 * Wl ** 0.646 * Nl ** 0.2 * 90 ** 0.5 * 2 ** 0.45
@@ -5,11 +5,17 @@ from openmdao.api import ExplicitComponent
 
 class hydraulicWeightComp(ExplicitComponent):
 
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+
     def setup(self):
-        self.add_input('Bw')
-        self.add_output('W_hydraulic')
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
+
+        self.add_input('Bw', shape=shape)
+        self.add_output('W_hydraulic', shape=shape)
 
-        self.declare_partials('W_hydraulic', 'Bw')
+        self.declare_partials('W_hydraulic', 'Bw', rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
         Bw = inputs['Bw']
@@ -19,4 +25,4 @@ class hydraulicWeightComp(ExplicitComponent):
     def compute_partials(self, inputs, partials):
         Bw = inputs['Bw']
 
-        partials['W_hydraulic', 'Bw'] =0.2673 * 5 * 0.937 * (205 + Bw) ** -0.063
+        partials['W_hydraulic', 'Bw'] = (0.2673 * 5 * 0.937 * (205 + Bw) ** -0.063).flatten()
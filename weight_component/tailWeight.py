@@ -5,97 +5,118 @@ from openmdao.api import ExplicitComponent
 
 class htailWeightComp(ExplicitComponent):
 
+    # the options are the default values of the inputs of the same name
     def initialize(self):
-        self.options.declare('N', types=float)
-        self.options.declare('Lt', types=float)
-        self.options.declare('AR_ht', types=float)
-        self.options.declare('sweepht', types=float)
-    
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('N', default=3.5, types=float)
+        self.options.declare('Lt', default=85., types=float)
+        self.options.declare('AR_ht', default=4., types=float)
+        self.options.declare('sweepht', default=27., types=float)
 
     def setup(self):
-        self.add_input('W0')
-        self.add_input('S_ht')
-        self.add_output('W_ht')
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
 
-        self.declare_partials('W_ht', 'W0')
-        self.declare_partials('W_ht', 'S_ht')
+        self.add_input('W0', shape=shape)
+        self.add_input('S_ht', shape=shape)
+        for name in ['N', 'Lt', 'AR_ht', 'sweepht']:
+            self.add_input(name, val=self.options[name], shape=shape)
+        self.add_output('W_ht', shape=shape)
+
+        for name in ['W0', 'S_ht', 'N', 'Lt', 'AR_ht', 'sweepht']:
+            self.declare_partials('W_ht', name, rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
-        N = self.options['N']
-        Lt = self.options['Lt']
-        AR_ht = self.options['AR_ht']
-        sweepht = self.options['sweepht']
-       
+        outputs['W_ht'] = self._compute_weight(inputs)
 
+    def compute_partials(self, inputs, partials):
         W0 = inputs['W0']
         S_ht = inputs['S_ht']
-
-        cosSweepht = np.cos(sweepht * np.pi / 180)
-        Ky = 0.3 * Lt
-
-        outputs['W_ht'] = 0.0379 * 1.2 ** -0.25 * W0 ** 0.639 * N ** 0.1 * S_ht ** 0.75 * Lt ** -1 * Ky ** 0.704 * cosSweepht ** -1 * AR_ht ** 0.166
-
-    def compute_partials(self, inputs, partials):
-        N = self.options['N']
-        Lt = self.options['Lt']
-        AR_ht = self.options['AR_ht']
-        sweepht = self.options['sweepht']
-
+        N = inputs['N']
+        Lt = inputs['Lt']
+        AR_ht = inputs['AR_ht']
+        sweepht = inputs['sweepht']
+
+        W_ht = self._compute_weight(inputs)
+
+        # Ky = 0.3 * Lt, so the weight goes with Lt ** (0.704 - 1)
+        partials['W_ht', 'W0'] = (0.639 * W_ht / W0).flatten()
+        partials['W_ht', 'S_ht'] = (0.75 * W_ht / S_ht).flatten()
+        partials['W_ht', 'N'] = (0.1 * W_ht / N).flatten()
+        partials['W_ht', 'Lt'] = (-0.296 * W_ht / Lt).flatten()
+        partials['W_ht', 'AR_ht'] = (0.166 * W_ht / AR_ht).flatten()
+        partials['W_ht', 'sweepht'] = (W_ht * np.tan(sweepht * np.pi / 180) * np.pi / 180).flatten()
+
+    def _compute_weight(self, inputs):
         W0 = inputs['W0']
         S_ht = inputs['S_ht']
+        N = inputs['N']
+        Lt = inputs['Lt']
+        AR_ht = inputs['AR_ht']
+        sweepht = inputs['sweepht']
 
         cosSweepht = np.cos(sweepht * np.pi / 180)
         Ky = 0.3 * Lt
 
-        partials['W_ht', 'W0'] = 0.0379 * 1.2 ** -0.25 * 0.639 * W0 ** -0.361 * N ** 0.1 * S_ht ** 0.75 * Lt ** -1 * Ky ** 0.704 * cosSweepht ** -1 * AR_ht ** 0.166
-        partials['W_ht', 'S_ht'] = 0.0379 * 1.2 ** -0.25 * W0 ** 0.639 * N ** 0.1 * 0.75 * S_ht ** -0.25 * Lt ** -1 * Ky ** 0.704 * cosSweepht ** -1 * AR_ht ** 0.166
+        return 0.0379 * 1.2 ** -0.25 * W0 ** 0.639 * N ** 0.1 * S_ht ** 0.75 * Lt ** -1 * Ky ** 0.704 * cosSweepht ** -1 * AR_ht ** 0.166
 
 class vtailWeightComp(ExplicitComponent):
 
+    # the options are the default values of the inputs of the same name
     def initialize(self):
-        self.options.declare('N', types=float)
-        self.options.declare('Lt', types=float)
-        self.options.declare('AR_vt', types=float)
-        self.options.declare('sweepvt', types=float)
-        self.options.declare('t_c',types=float)
-    
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('N', default=3.5, types=float)
+        self.options.declare('Lt', default=85., types=float)
+        self.options.declare('AR_vt', default=4., types=float)
+        self.options.declare('sweepvt', default=27., types=float)
+        self.options.declare('t_c', default=0.3, types=float)
 
     def setup(self):
-        self.add_input('W0')
-        self.add_input('S_vt')
-        self.add_output('W_vt')
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
 
-        self.declare_partials('W_vt', 'W0')
-        self.declare_partials('W_vt', 'S_vt')
+        self.add_input('W0', shape=shape)
+        self.add_input('S_vt', shape=shape)
+        for name in ['N', 'Lt', 'AR_vt', 'sweepvt', 't_c']:
+            self.add_input(name, val=self.options[name], shape=shape)
+        self.add_output('W_vt', shape=shape)
+
+        for name in ['W0', 'S_vt', 'N', 'Lt', 'AR_vt', 'sweepvt', 't_c']:
+            self.declare_partials('W_vt', name, rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
-        N = self.options['N']
-        Lt = self.options['Lt']
-        AR_vt = self.options['AR_vt']
-        sweepvt = self.options['sweepvt']
-        t_c = self.options['t_c']
-       
+        outputs['W_vt'] = self._compute_weight(inputs)
 
+    def compute_partials(self, inputs, partials):
         W0 = inputs['W0']
         S_vt = inputs['S_vt']
-
-        cosSweepvt = np.cos(sweepvt * np.pi / 180)
-        Kz = Lt
-
-        outputs['W_vt'] = 0.0026 * W0 ** 0.556 * N ** 0.536 * S_vt ** 0.5 * Lt ** -0.5 * Kz ** 0.875 * cosSweepvt ** -1 * AR_vt ** 0.35 * t_c ** -0.5
-
-    def compute_partials(self, inputs, partials):
-        N = self.options['N']
-        Lt = self.options['Lt']
-        AR_vt = self.options['AR_vt']
-        sweepvt = self.options['sweepvt']
-        t_c = self.options['t_c']
-
+        N = inputs['N']
+        Lt = inputs['Lt']
+        AR_vt = inputs['AR_vt']
+        sweepvt = inputs['sweepvt']
+        t_c = inputs['t_c']
+
+        W_vt = self._compute_weight(inputs)
+
+        # Kz = Lt, so the weight goes with Lt ** (0.875 - 0.5)
+        partials['W_vt', 'W0'] = (0.556 * W_vt / W0).flatten()
+        partials['W_vt', 'S_vt'] = (0.5 * W_vt / S_vt).flatten()
+        partials['W_vt', 'N'] = (0.536 * W_vt / N).flatten()
+        partials['W_vt', 'Lt'] = (0.375 * W_vt / Lt).flatten()
+        partials['W_vt', 'AR_vt'] = (0.35 * W_vt / AR_vt).flatten()
+        partials['W_vt', 'sweepvt'] = (W_vt * np.tan(sweepvt * np.pi / 180) * np.pi / 180).flatten()
+        partials['W_vt', 't_c'] = (-0.5 * W_vt / t_c).flatten()
+
+    def _compute_weight(self, inputs):
         W0 = inputs['W0']
         S_vt = inputs['S_vt']
+        N = inputs['N']
+        Lt = inputs['Lt']
+        AR_vt = inputs['AR_vt']
+        sweepvt = inputs['sweepvt']
+        t_c = inputs['t_c']
 
         cosSweepvt = np.cos(sweepvt * np.pi / 180)
         Kz = Lt
 
-        partials['W_vt', 'W0'] = 0.0026 * 0.556 * W0 ** -0.444 * N ** 0.536 * S_vt ** 0.5 * Lt ** -0.5 * Kz ** 0.875 * cosSweepvt ** -1 * AR_vt ** 0.35 * t_c ** -0.5
-        partials['W_vt', 'S_vt'] = 0.0026 * W0 ** 0.556 * N ** 0.536 * 0.5 * S_vt ** -0.5 * Lt ** -0.5 * Kz ** 0.875 * cosSweepvt ** -1 * AR_vt ** 0.35 * t_c ** -0.5
+        return 0.0026 * W0 ** 0.556 * N ** 0.536 * S_vt ** 0.5 * Lt ** -0.5 * Kz ** 0.875 * cosSweepvt ** -1 * AR_vt ** 0.35 * t_c ** -0.5
@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from weightEngine import weightEngineComp, weight_names
+from weightGroup import weightCompGroup
+from openmdao.api import Problem
+from components.complex_step import setup_problem, check_partials
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+
+def build_problem(model, size=4):
+    prob = Problem()
+    prob.model.add_subsystem('model', model, promotes=['*'])
+    setup_problem(prob)
+
+    prob['S_w'] = np.linspace(300., 500., size)
+    prob['W0'] = np.linspace(200000., 300000., size)
+    prob['N'] = np.linspace(2.5, 4.5, size)
+    prob['sweep_w'] = np.linspace(20., 35., size)
+    prob['taper_w'] = np.linspace(0.2, 0.4, size)
+    prob['L_fuse'] = np.linspace(180., 230., size)
+    prob['Lt'] = np.linspace(75., 95., size)
+    prob.run_model()
+    return prob
+
+
+class TestWeightEngineComp(unittest.TestCase):
+
+    def test_derivatives(self):
+        prob = build_problem(weightEngineComp(shape=(4,)))
+
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-6, rtol=1.e-6)
+
+    def test_matches_weight_group(self):
+        prob = build_problem(weightEngineComp(shape=(4,)))
+        group_prob = build_problem(weightCompGroup(shape=(4,)))
+        fused_prob = build_problem(weightCompGroup(shape=(4,), fused=True))
+
+        for name in weight_names + ['emptyTotal']:
+            assert_near_equal(prob[name], group_prob[name], 1e-12)
+            assert_near_equal(fused_prob[name], group_prob[name], 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from weightGroup import weightCompGroup
+from openmdao.api import Problem
+from components.complex_step import setup_problem, check_partials
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+
+class TestWeightCompGroup(unittest.TestCase):
+
+    def setUp(self):
+        self.prob = Problem()
+        self.prob.model.add_subsystem('weight_group', weightCompGroup(), promotes=['*'])
+        setup_problem(self.prob)
+        self.prob['S_w'] = 400.
+        self.prob.run_model()
+
+    def test_derivatives(self):
+        data = check_partials(self.prob, out_stream=None, excludes=['emptyWeight'])
+        assert_check_partials(data, atol=1.e-6, rtol=1.e-6)
+
+    def test_empty_weight(self):
+        names = ['W_wing', 'W_ht', 'W_vt', 'W_fuse', 'W_mgear', 'W_ngear', 'W_aircon',
+            'W_hydraulic', 'W_furnish', 'W_engine']
+        total = np.sum([self.prob[name] for name in names])
+
+        assert_near_equal(self.prob['emptyTotal'], total, 1e-12)
+
+    def test_vectorized_sweep(self):
+        # one set-up problem evaluates several configurations at once
+        prob = Problem()
+        prob.model.add_subsystem('weight_group', weightCompGroup(shape=(3,)), promotes=['*'])
+        setup_problem(prob)
+        prob['S_w'] = 400.
+        prob['N'] = [2.5, 3.5, 4.5]
+        prob['sweep_w'] = [20., 30., 35.]
+        prob['L_fuse'] = [180., 205., 230.]
+        prob.run_model()
+
+        data = check_partials(prob, out_stream=None, excludes=['emptyWeight'])
+        assert_check_partials(data, atol=1.e-6, rtol=1.e-6)
+
+        for ind in range(3):
+            self.prob['N'] = prob['N'][ind]
+            self.prob['sweep_w'] = prob['sweep_w'][ind]
+            self.prob['L_fuse'] = prob['L_fuse'][ind]
+            self.prob.run_model()
+
+            assert_near_equal(prob['emptyTotal'][ind], self.prob['emptyTotal'][0], 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
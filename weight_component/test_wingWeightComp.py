@@ -2,6 +2,7 @@ import unittest
 
 from wingWeight import wingWeightComp
 from openmdao.api import Problem
+from components.complex_step import setup_problem, check_partials
 from openmdao.utils.assert_utils import assert_check_partials
 
 
@@ -9,13 +10,15 @@ class TestWingWeightComp(unittest.TestCase):
 
     def test_component_and_derivatives(self):
         prob = Problem()
-        prob.model = wingWeightComp(N=3.,tc=0.3,AR=9.,sweep=30.)
-        prob.setup()
+        prob.model.add_subsystem('wingWeight', wingWeightComp(N=3.,t_c=0.3,AR=9.,sweep=30.,taper=0.3), promotes=['*'])
+        setup_problem(prob)
+        prob['W0'] = 256000.
+        prob['S_w'] = 400.
         prob.run_model()
 
-        data = prob.check_partials(out_stream=None)
-        assert_check_partials(data, atol=1.e2, rtol=1.e2)
+        data = check_partials(prob, out_stream=None)
+        assert_check_partials(data, atol=1.e-6, rtol=1.e-6)
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,221 @@
+import numpy as np
+
+from openmdao.api import ExplicitComponent, Problem
+
+#
+#    Evaluates all the weight equations of weightCompGroup at once from a table of coefficients
+#    and exponents: with the logs of the factors of the equations in an (n, num_factors) array,
+#    the logs of the weights of n configurations are one matrix product
+#
+
+# default value of every input, as in weightCompGroup
+input_defaults = dict(
+    W0=256000.,
+    Wl=150000.,
+    S_w=1.,
+    Bw=126.,
+    S_ht=300.,
+    S_vt=300.,
+    W_furnish=8900.,
+    W_engine=32000.,
+    N=3.5,
+    Lt=85.,
+    Nl=5.,
+    t_c_w=0.3,
+    AR_w=9.,
+    sweep_w=30.,
+    taper_w=0.3,
+    AR_ht=4.,
+    sweepht=27.,
+    AR_vt=4.,
+    sweepvt=27.,
+    t_c_vt=0.3,
+    L_fuse=205.,
+    LD_fuse=17.,
+    S_fuse=15030.,
+    Vstall=150.,
+    Np=410.,
+    Vpr=39000.,
+)
+
+# weights added to the empty weight as they are
+fixed_weights = ['W_furnish', 'W_engine']
+
+# W = coefficient * prod(factor ** exponent), with Ky = 0.3 * Lt and Kz = Lt folded into Lt
+weight_equations = [
+    ('W_wing', 0.0051 * 0.2 ** 0.1, dict(
+        W0=0.557, N=0.557, S_w=0.749, AR_w=0.5, t_c_w=-0.4, one_plus_taper_w=0.1,
+        cos_sweep_w=-1.)),
+    ('W_ht', 0.0379 * 1.2 ** -0.25 * 0.3 ** 0.704, dict(
+        W0=0.639, N=0.1, S_ht=0.75, Lt=-0.296, cos_sweepht=-1., AR_ht=0.166)),
+    ('W_vt', 0.0026, dict(
+        W0=0.556, N=0.536, S_vt=0.5, Lt=0.375, cos_sweepvt=-1., AR_vt=0.35, t_c_vt=-0.5)),
+    ('W_fuse', 0.328 * 1.12, dict(
+        W0=0.5, N=0.5, L_fuse=0.25, S_fuse=0.302, one_plus_Kws=0.04, LD_fuse=0.1)),
+    ('W_mgear', 0.0106 * 90 ** 0.4 * 8 ** 0.321 * 2 ** -0.5, dict(
+        Wl=0.888, Nl=0.25, Vstall=0.1)),
+    ('W_ngear', 0.032 * 90 ** 0.5 * 2 ** 0.45, dict(
+        Wl=0.646, Nl=0.2)),
+    ('W_aircon', 62.36 * 1000 ** 0.1 * 1000 ** -0.604, dict(
+        Np=0.25, Vpr=0.604)),
+    ('W_hydraulic', 0.2673 * 5, dict(
+        Bw_plus_205=0.937)),
+]
+
+weight_names = [name for name, _, _ in weight_equations]
+
+# factors that are functions of the inputs, the other factors are inputs themselves
+derived_factor_names = [
+    'cos_sweep_w', 'one_plus_taper_w', 'cos_sweepht', 'cos_sweepvt', 'one_plus_Kws',
+    'Bw_plus_205',
+]
+factor_names = sorted(set(
+    name for _, _, exponents in weight_equations for name in exponents
+) - set(derived_factor_names)) + derived_factor_names
+
+log_coeffs = np.log([coeff for _, coeff, _ in weight_equations])
+exponents = np.array([
+    [equation_exponents.get(name, 0.) for name in factor_names]
+    for _, _, equation_exponents in weight_equations
+])
+
+
+def compute_log_factors(x, derivs=True):
+    """
+    Returns the (n, num_factors) array of the logs of the factors of the
+    weight equations for the flat input arrays in x and, if derivs is True,
+    a dict with the derivatives of each log factor with respect to the
+    inputs it depends on.
+    """
+    deg = np.pi / 180
+    taper_ratio = (1 + 2 * x['taper_w']) / (1 + x['taper_w'])
+    tan_sweep = np.tan(x['sweep_w'] * deg)
+    Kws = 0.75 * taper_ratio * x['Bw'] * tan_sweep / x['L_fuse']
+
+    factors = dict(
+        cos_sweep_w=np.cos(x['sweep_w'] * deg),
+        one_plus_taper_w=1 + x['taper_w'],
+        cos_sweepht=np.cos(x['sweepht'] * deg),
+        cos_sweepvt=np.cos(x['sweepvt'] * deg),
+        one_plus_Kws=1 + Kws,
+        Bw_plus_205=205 + x['Bw'],
+    )
+    log_factors = np.column_stack([
+        np.log(factors[name] if name in factors else x[name]) for name in factor_names])
+
+    if not derivs:
+        return log_factors, None
+
+    dlog_factors = dict(
+        cos_sweep_w=dict(sweep_w=-tan_sweep * deg),
+        one_plus_taper_w=dict(taper_w=1 / (1 + x['taper_w'])),
+        cos_sweepht=dict(sweepht=-np.tan(x['sweepht'] * deg) * deg),
+        cos_sweepvt=dict(sweepvt=-np.tan(x['sweepvt'] * deg) * deg),
+        one_plus_Kws=dict(
+            Bw=0.75 * taper_ratio * tan_sweep / x['L_fuse'] / (1 + Kws),
+            L_fuse=-Kws / x['L_fuse'] / (1 + Kws),
+            sweep_w=0.75 * taper_ratio * x['Bw'] / x['L_fuse'] * (1 + tan_sweep ** 2) * deg
+                / (1 + Kws),
+            taper_w=0.75 / (1 + x['taper_w']) ** 2 * x['Bw'] * tan_sweep / x['L_fuse']
+                / (1 + Kws),
+        ),
+        Bw_plus_205=dict(Bw=1 / (205 + x['Bw'])),
+    )
+    for name in factor_names:
+        if name not in dlog_factors:
+            dlog_factors[name] = {name: 1 / x[name]}
+
+    return log_factors, dlog_factors
+
+
+def compute_weights(x, derivs=True):
+    """
+    Returns a dict with every weight and emptyTotal for the flat input arrays
+    in x and, if derivs is True, a dict of their nonzero derivatives,
+    derivs[out_name][in_name].
+    """
+    log_factors, dlog_factors = compute_log_factors(x, derivs=derivs)
+
+    weights = np.exp(log_coeffs + log_factors.dot(exponents.T))
+
+    results = dict(zip(weight_names, weights.T))
+    results['emptyTotal'] = weights.sum(axis=1) + sum(x[name] for name in fixed_weights)
+
+    if not derivs:
+        return results
+
+    # d W_k / d x = W_k * sum over the factors f of W_k of exponent_kf * d log f / d x
+    results['derivs'] = dict((name, {}) for name in weight_names + ['emptyTotal'])
+    for ind_weight, name in enumerate(weight_names):
+        for ind_factor, factor_name in enumerate(factor_names):
+            exponent = exponents[ind_weight, ind_factor]
+            if exponent == 0.:
+                continue
+
+            for in_name, value in dlog_factors[factor_name].items():
+                value = exponent * weights[:, ind_weight] * value
+                for out_name in [name, 'emptyTotal']:
+                    out_derivs = results['derivs'][out_name]
+                    out_derivs[in_name] = out_derivs.get(in_name, 0.) + value
+
+    for name in fixed_weights:
+        results['derivs']['emptyTotal'][name] = np.ones(weights.shape[0])
+
+    return results
+
+
+def get_dependencies():
+    """
+    Returns a dict with the names of the inputs every output depends on.
+    """
+    x = dict((name, np.array([value])) for name, value in input_defaults.items())
+    derivs = compute_weights(x)['derivs']
+    return dict((out_name, sorted(derivs[out_name])) for out_name in derivs)
+
+
+class weightEngineComp(ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+
+    def setup(self):
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
+
+        for name, val in input_defaults.items():
+            self.add_input(name, val=val, shape=shape)
+
+        self.dependencies = get_dependencies()
+        for out_name in weight_names + ['emptyTotal']:
+            self.add_output(out_name, shape=shape)
+
+            # every configuration only depends on its own inputs
+            for in_name in self.dependencies[out_name]:
+                self.declare_partials(out_name, in_name, rows=arange, cols=arange)
+
+    def compute(self, inputs, outputs):
+        results = compute_weights(self._get_inputs(inputs), derivs=False)
+
+        for out_name in weight_names + ['emptyTotal']:
+            outputs[out_name] = results[out_name].reshape(self.options['shape'])
+
+    def compute_partials(self, inputs, partials):
+        derivs = compute_weights(self._get_inputs(inputs))['derivs']
+
+        for out_name, in_names in self.dependencies.items():
+            for in_name in in_names:
+                partials[out_name, in_name] = derivs[out_name][in_name]
+
+    def _get_inputs(self, inputs):
+        return dict((name, inputs[name].flatten()) for name in input_defaults)
+
+
+# runs a test to see if calculated values make sense
+if __name__ == "__main__":
+    prob = Problem()
+    prob.model.add_subsystem('weight_engine', weightEngineComp(), promotes=['*'])
+    prob.setup()
+    prob.run_model()
+
+    for name in weight_names + ['emptyTotal']:
+        print(name, prob[name])
@@ -1,3 +1,5 @@
+import numpy as np
+
 from openmdao.api import Group, IndepVarComp, ExecComp, Problem
 
 from weight_component.wingWeight import wingWeightComp
@@ -8,50 +10,85 @@ from weight_component.gearWeight import maingearWeightComp
 from weight_component.gearWeight import nosegearWeightComp
 from weight_component.hydraulicWeight import hydraulicWeightComp
 from weight_component.airconWeight import airconWeightComp
+from weight_component.weightEngine import weightEngineComp
 
 class weightCompGroup(Group):
-
+    """
+    Empty weight build-up. The configuration parameters of the components are
+    inputs, promoted as N, Lt and Nl (shared by the components that use them),
+    t_c_w, AR_w, sweep_w and taper_w (wing, with sweep_w and taper_w also
+    used by the fuselage), AR_ht, sweepht, AR_vt, sweepvt, t_c_vt, L_fuse,
+    LD_fuse, S_fuse, Vstall, Np and Vpr, so they can be swept or optimized
+    without setting up the problem again.
+
+    With fused=True, all the weights are evaluated by a single
+    weightEngineComp instead of one component per weight. With
+    fixed_W0=False, the gross weight W0 is not an output of inputs_comp but
+    an input of the group, e.g. to close a sizing loop.
+    """
+
+    def initialize(self):
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('fused', default=False, types=bool)
+        self.options.declare('fixed_W0', default=True, types=bool)
 
     def setup(self):
+        shape = self.options['shape']
 
         comp = IndepVarComp()
-        comp.add_output('W0', val=256000)
-        comp.add_output('Wl', val=150000)
+        if self.options['fixed_W0']:
+            comp.add_output('W0', val=256000, shape=shape)
+        else:
+            self.set_input_defaults('W0', val=256000 * np.ones(shape))
+        comp.add_output('Wl', val=150000, shape=shape)
         # comp.add_output('S_w', val=1757)
-        comp.add_output('Bw',val=126)
-        comp.add_output('S_ht',val=300)
-        comp.add_output('S_vt',val=300)
-        comp.add_output('W_furnish',val=8900)
-        comp.add_output('W_engine',val=32000)
+        comp.add_output('Bw',val=126, shape=shape)
+        comp.add_output('S_ht',val=300, shape=shape)
+        comp.add_output('S_vt',val=300, shape=shape)
+        comp.add_output('W_furnish',val=8900, shape=shape)
+        comp.add_output('W_engine',val=32000, shape=shape)
         # comp.add_design_var('W0', lower=150000)
         self.add_subsystem('inputs_comp', comp, promotes=['*'])
+
+        if self.options['fused']:
+            comp = weightEngineComp(shape=shape)
+            self.add_subsystem('weightEngine', comp, promotes=['*'])
+            return
         
-        comp = wingWeightComp(N=3.5,t_c=0.3,AR=9.,sweep=30.,taper = 0.3)
-        self.add_subsystem('wingWeight',comp,promotes=['*'])
+        comp = wingWeightComp(shape=shape,N=3.5,t_c=0.3,AR=9.,sweep=30.,taper = 0.3)
+        self.add_subsystem('wingWeight',comp,promotes=[
+            ('t_c', 't_c_w'), ('AR', 'AR_w'), ('sweep', 'sweep_w'), ('taper', 'taper_w'), '*'])
 
-        comp = htailWeightComp(N=3.5,Lt=85.,AR_ht=4., sweepht=27.)
+        comp = htailWeightComp(shape=shape,N=3.5,Lt=85.,AR_ht=4., sweepht=27.)
         self.add_subsystem('htailWeight',comp,promotes=['*'])
 
-        comp = vtailWeightComp(N=3.5,Lt=85.,AR_vt=4.,sweepvt=27., t_c=0.3)
-        self.add_subsystem('vtailWeight',comp,promotes=['*'])
+        comp = vtailWeightComp(shape=shape,N=3.5,Lt=85.,AR_vt=4.,sweepvt=27., t_c=0.3)
+        self.add_subsystem('vtailWeight',comp,promotes=[('t_c', 't_c_vt'), '*'])
 
-        comp = fuselageWeightComp(N=3.5,L=205.,LD=17.,S_fuse=15030.,sweep=30.,taper=0.3)
-        self.add_subsystem('fuselageWeight',comp,promotes=['*'])
+        # the fuselage weight uses the sweep and taper of the wing
+        comp = fuselageWeightComp(shape=shape,N=3.5,L=205.,LD=17.,S_fuse=15030.,sweep=30.,taper=0.3)
+        self.add_subsystem('fuselageWeight',comp,promotes=[
+            ('L', 'L_fuse'), ('LD', 'LD_fuse'), ('sweep', 'sweep_w'), ('taper', 'taper_w'), '*'])
 
-        comp = maingearWeightComp(Nl=5.,Vstall=150.)
+        comp = maingearWeightComp(shape=shape,Nl=5.,Vstall=150.)
         self.add_subsystem('maingearWeight',comp,promotes=['*'])
 
-        comp = nosegearWeightComp(Nl=5.)
+        comp = nosegearWeightComp(shape=shape,Nl=5.)
         self.add_subsystem('nosegearWeight',comp,promotes=['*'])
 
-        comp = airconWeightComp(Np=410.,Vpr=39000.)
+        comp = airconWeightComp(shape=shape,Np=410.,Vpr=39000.)
         self.add_subsystem('airconWeight',comp,promotes=['*'])
 
-        comp = hydraulicWeightComp()
+        comp = hydraulicWeightComp(shape=shape)
         self.add_subsystem('hydraulicWeight',comp,promotes=['*'])
 
-        comp = ExecComp('emptyTotal = W_wing + W_ht + vtailWeight + W_fuse + W_mgear + W_ngear + W_aircon + W_hydraulic + W_furnish + W_engine')
+        comp = ExecComp('emptyTotal = W_wing + W_ht + W_vt + W_fuse + W_mgear + W_ngear + W_aircon + W_hydraulic + W_furnish + W_engine',
+            shape=shape, has_diag_partials=True)
         self.add_subsystem('emptyWeight',comp,promotes=['*'])
+
+        # inputs shared by several components
+        for name, val in [('N', 3.5), ('Lt', 85.), ('Nl', 5.), ('sweep_w', 30.), ('taper_w', 0.3)]:
+            self.set_input_defaults(name, val=val * np.ones(shape))
         
 # runs a test to see if calculated values make sense
 if __name__ == "__main__":
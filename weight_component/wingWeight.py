@@ -5,46 +5,60 @@ from openmdao.api import ExplicitComponent
 
 class wingWeightComp(ExplicitComponent):
 
+    # the options are the default values of the inputs of the same name
     def initialize(self):
-        self.options.declare('N', types=float)
-        self.options.declare('t_c', types=float)
-        self.options.declare('AR', types=float)
-        self.options.declare('sweep', types=float)
-        self.options.declare('taper', types=float)
+        self.options.declare('shape', default=(1,), types=tuple)
+        self.options.declare('N', default=3.5, types=float)
+        self.options.declare('t_c', default=0.3, types=float)
+        self.options.declare('AR', default=9., types=float)
+        self.options.declare('sweep', default=30., types=float)
+        self.options.declare('taper', default=0.3, types=float)
 
     def setup(self):
-        self.add_input('W0')
-        self.add_input('S_w')
-        self.add_output('W_wing')
+        shape = self.options['shape']
+        arange = np.arange(int(np.prod(shape)))
 
-        self.declare_partials('W_wing', 'W0')
-        self.declare_partials('W_wing', 'S_w')
+        self.add_input('W0', shape=shape)
+        self.add_input('S_w', shape=shape)
+        for name in ['N', 't_c', 'AR', 'sweep', 'taper']:
+            self.add_input(name, val=self.options[name], shape=shape)
+        self.add_output('W_wing', shape=shape)
+
+        for name in ['W0', 'S_w', 'N', 't_c', 'AR', 'sweep', 'taper']:
+            self.declare_partials('W_wing', name, rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
-        N = self.options['N']
-        t_c = self.options['t_c']
-        AR = self.options['AR']
-        sweep = self.options['sweep']
-        taper = self.options['taper']
+        outputs['W_wing'] = self._compute_weight(inputs)
 
+    def compute_partials(self, inputs, partials):
         W0 = inputs['W0']
         S_w = inputs['S_w']
+        N = inputs['N']
+        t_c = inputs['t_c']
+        AR = inputs['AR']
+        sweep = inputs['sweep']
+        taper = inputs['taper']
 
-        cosSweep = np.cos(sweep * (np.pi / 180))
-
-        outputs['W_wing'] = 0.0051 * W0 ** 0.557 * N ** 0.557 * S_w ** 0.649 * AR ** 0.5 * t_c ** -0.4 * (1 + taper) ** 0.1 * cosSweep ** -1 * 0.2 ** 0.1 * S_w ** 0.1
+        W_wing = self._compute_weight(inputs)
 
-    def compute_partials(self, inputs, partials):
-        N = self.options['N']
-        t_c = self.options['t_c']
-        AR = self.options['AR']
-        sweep = self.options['sweep']
-        taper = self.options['taper']
+        # every factor is a power law, so each partial is the exponent times W_wing over the factor
+        partials['W_wing', 'W0'] = (0.557 * W_wing / W0).flatten()
+        partials['W_wing', 'S_w'] = (0.749 * W_wing / S_w).flatten()
+        partials['W_wing', 'N'] = (0.557 * W_wing / N).flatten()
+        partials['W_wing', 't_c'] = (-0.4 * W_wing / t_c).flatten()
+        partials['W_wing', 'AR'] = (0.5 * W_wing / AR).flatten()
+        partials['W_wing', 'sweep'] = (W_wing * np.tan(sweep * np.pi / 180) * np.pi / 180).flatten()
+        partials['W_wing', 'taper'] = (0.1 * W_wing / (1 + taper)).flatten()
 
+    def _compute_weight(self, inputs):
         W0 = inputs['W0']
         S_w = inputs['S_w']
+        N = inputs['N']
+        t_c = inputs['t_c']
+        AR = inputs['AR']
+        sweep = inputs['sweep']
+        taper = inputs['taper']
 
-        cosSweep = np.cos(sweep * np.pi / 180)
+        cosSweep = np.cos(sweep * (np.pi / 180))
 
-        partials['W_wing', 'W0'] = 0.0051 * 0.557 * W0 ** -0.443 * N ** 0.557 * S_w ** 0.649 * AR ** 0.5 * t_c ** -0.4 * (1 + taper) ** 0.1 * cosSweep ** -1 * 0.2 ** 0.1 * S_w ** 0.1
-        partials['W_wing', 'S_w'] = 0.0051 * W0 ** 0.557 * N ** 0.557 * 0.649 * S_w ** -0.351 * AR ** 0.5 * t_c ** -0.4 * (1 + taper) ** 0.1 * cosSweep ** -1 * 0.2 ** 0.1 * 0.1 * S_w ** -0.9
\ No newline at end of file
+        return 0.0051 * W0 ** 0.557 * N ** 0.557 * S_w ** 0.649 * AR ** 0.5 * t_c ** -0.4 * (1 + taper) ** 0.1 * cosSweep ** -1 * 0.2 ** 0.1 * S_w ** 0.1